@@ -18,6 +18,8 @@
  * 32 bit index
  * 16 bit length
  * data (variable length)
+ *
+ * The header is ODIN_TLV_HEADER_SIZE bytes, which the generated size defines rely on
  */
 #pragma pack(push, 1)
 typedef struct {
@@ -102,7 +104,8 @@ int ODIN_decode_bytes_to_parameter(const ODIN_parameter_group_t *group, const ui
 }
 
 /**
- * @brief Recursively encode a parameter group to a byte buffer
+ * @brief Encode a parameter group to a byte buffer, in a single loop over the generated leaves when available,
+ * otherwise by walking the tree
  *
  * @param group The group to encode
  * @param output_buffer The buffer to write the encoded group to
@@ -119,6 +122,22 @@ int ODIN_encode_parameter_group_to_bytes(const ODIN_parameter_group_t *group, ui
     }
 
     uint8_t *output_buffer_start = output_buffer;
+
+    // The generator flattens the tree, so the parameters can be encoded without recursion
+    if (group->leaves != NULL) {
+        for (uint32_t i = 0; i < group->leaf_count; i++) {
+            int len = ODIN_encode_parameter_to_bytes(group->leaves[i], output_buffer, output_buffer_size, access_group);
+            if (len < ODIN_SUCCESS) {
+                return len;
+            }
+
+            output_buffer += len;
+            output_buffer_size -= len;
+        }
+
+        return output_buffer - output_buffer_start;
+    }
+
     for (int i = 0; i < group->count; i++) {
         // Check type of parameter, if group, call recursively
         const ODIN_parameter_generic_t *parameter = (const ODIN_parameter_generic_t *)group->parameters[i];
@@ -196,4 +215,197 @@ int ODIN_decode_bytes_to_parameter_group(const ODIN_parameter_group_t *group, co
     }
 
     return input_buffer - input_buffer_start;
-}
\ No newline at end of file
+}
+
+/**
+ * @brief Decode a byte buffer with many parameters to a parameter group, without stopping at the first failing entry
+ *
+ * The buffer is checked to be well formed before anything is written. An entry which can't be written (unknown
+ * index, permission, size) does not stop the decoding, the result of every entry is reported instead. When the
+ * group has an index table, the entries are resolved by merging them against it, which is a single pass when the
+ * entries are sorted by global index. Unsorted entries are still decoded, at the cost of a search each.
+ *
+ * @param group The group to decode into
+ * @param input_buffer The buffer to read the encoded parameters from
+ * @param input_buffer_data_length The size of the data in the input buffer
+ * @param access_group The access group to use
+ * @param results The result of every entry, in the order of the buffer, can be NULL
+ * @param results_size The number of results, further entries are decoded but not reported
+ *
+ * @return int The number of entries, or an error code if the buffer is not well formed
+ */
+int ODIN_decode_bytes_to_parameter_group_batch(const ODIN_parameter_group_t *group, const uint8_t *input_buffer,
+                                               size_t input_buffer_data_length, odin_access_group_t access_group,
+                                               ODIN_batch_result_t *results, size_t results_size) {
+    // Check if the group and buffer are valid
+    if (group == NULL || input_buffer == NULL) {
+        return ODIN_ERROR_INVALID_ARGUMENT;
+    }
+
+    // Check the framing first, so a truncated buffer does not leave the group half written
+    size_t offset = 0;
+    while (offset < input_buffer_data_length) {
+        if (offset + sizeof(byte_package_format_t) > input_buffer_data_length) {
+            return ODIN_ERROR_SIZE_MISMATCH;
+        }
+
+        const byte_package_format_t *package = (const byte_package_format_t *)(input_buffer + offset);
+        if (offset + sizeof(byte_package_format_t) + package->length > input_buffer_data_length) {
+            return ODIN_ERROR_SIZE_MISMATCH;
+        }
+
+        offset += sizeof(byte_package_format_t) + package->length;
+    }
+
+    int entries = 0;
+    uint32_t cursor = 0;
+    for (offset = 0; offset < input_buffer_data_length; entries++) {
+        const byte_package_format_t *package = (const byte_package_format_t *)(input_buffer + offset);
+        offset += sizeof(byte_package_format_t) + package->length;
+
+        // Find the parameter
+        const ODIN_parameter_t *parameter;
+        if (group->index_table != NULL) {
+            const ODIN_parameter_generic_t *generic = ODIN_find_in_index_table_from(group->index_table, package->index, &cursor);
+            parameter = generic != NULL && generic->odin_type != ODIN_TYPE_GROUP ? (const ODIN_parameter_t *)generic : NULL;
+        } else {
+            parameter = ODIN_get_parameter_by_id(group, package->index, 0);
+        }
+
+        // Write the parameter
+        int result = ODIN_ERROR_PARAMETER_NOT_FOUND;
+        if (parameter != NULL) {
+            result = ODIN_parameter_write(parameter, package->data, package->length, access_group);
+        }
+
+        if (results != NULL && (size_t)entries < results_size) {
+            results[entries].global_index = package->index;
+            results[entries].result = result;
+        }
+    }
+
+    return entries;
+}
+
+#ifdef ODIN_DIRTY_TRACKING
+
+// Index of the lowest set bit
+static inline uint32_t ODIN_lowest_bit(uint32_t bits) {
+#if defined(__GNUC__) || defined(__clang__)
+    return (uint32_t)__builtin_ctz(bits);
+#else
+    uint32_t bit = 0;
+    while ((bits & 1u) == 0) {
+        bits >>= 1;
+        bit++;
+    }
+    return bit;
+#endif
+}
+
+// Mask of the bits [first, last] of a word, both within the word
+static inline uint32_t ODIN_bit_range(uint32_t first, uint32_t last) {
+    return (0xFFFFFFFFu << first) & (0xFFFFFFFFu >> (31 - last));
+}
+
+// Mark the parameters of already encoded packages as changed again, the packages are in the order of the leaves
+static void ODIN_set_dirty_of_packages(const ODIN_parameter_group_t *group, const uint8_t *buffer, const uint8_t *end) {
+    uint32_t leaf = 0;
+    while (buffer < end) {
+        const byte_package_format_t *package = (const byte_package_format_t *)buffer;
+        while (group->leaves[leaf]->global_index != package->index) {
+            leaf++;
+        }
+        ODIN_parameter_set_dirty(group->leaves[leaf]);
+        buffer += sizeof(byte_package_format_t) + package->length;
+    }
+}
+
+/**
+ * @brief Encode the parameters of a group which changed since the last delta export, and mark them as unchanged
+ *
+ * The parameters are found through the dirty bitmap, so for a group the time only depends on the number of changed
+ * parameters (and a word per 32 parameters). Collections check the bit of every leaf. The bits are cleared before the
+ * parameters are encoded, so a write during the export marks its parameter for the next one. On an error the taken
+ * bits are set again, nothing is marked as unchanged. With ODIN_SEQLOCK the bitmap is updated atomically, so writers
+ * may run while the group is exported.
+ *
+ * @param group The group to encode, needs the leaves generated with dirty tracking
+ * @param output_buffer The buffer to write the encoded parameters to
+ * @param output_buffer_size The size of the output buffer
+ * @param access_group The access group to use
+ *
+ * @return int The size of the encoded parameters or an error code
+ */
+int ODIN_encode_parameter_group_to_bytes_delta(const ODIN_parameter_group_t *group, uint8_t *output_buffer,
+                                               size_t output_buffer_size, odin_access_group_t access_group) {
+    // Check if the group and buffer are valid
+    if (group == NULL || output_buffer == NULL) {
+        return ODIN_ERROR_INVALID_ARGUMENT;
+    }
+
+    if (group->leaves == NULL) {
+        return ODIN_ERROR_NOT_SUPPORTED;
+    }
+
+    if (group->leaf_count == 0) {
+        return 0;
+    }
+
+    uint32_t *bitmap = group->leaves[0]->dirty_bitmap;
+    if (bitmap == NULL) {
+        return ODIN_ERROR_NOT_SUPPORTED;
+    }
+
+    uint8_t *output_buffer_start = output_buffer;
+
+    if (group->dirty_first < 0) {
+        // The leaves are spread over the bitmap, check every one of them
+        for (uint32_t i = 0; i < group->leaf_count; i++) {
+            if (!ODIN_parameter_take_dirty(group->leaves[i])) {
+                continue;
+            }
+
+            int len = ODIN_encode_parameter_to_bytes(group->leaves[i], output_buffer, output_buffer_size, access_group);
+            if (len < ODIN_SUCCESS) {
+                ODIN_parameter_set_dirty(group->leaves[i]);
+                ODIN_set_dirty_of_packages(group, output_buffer_start, output_buffer);
+                return len;
+            }
+
+            output_buffer += len;
+            output_buffer_size -= len;
+        }
+
+        return output_buffer - output_buffer_start;
+    }
+
+    // The leaves are the bits [first, last], skip the words without changes
+    uint32_t first = (uint32_t)group->dirty_first;
+    uint32_t last = first + group->leaf_count - 1;
+
+    for (uint32_t word = first / 32; word <= last / 32; word++) {
+        uint32_t bits =
+            ODIN_dirty_take_bits(&bitmap[word], ODIN_bit_range(word == first / 32 ? first % 32 : 0, word == last / 32 ? last % 32 : 31));
+
+        while (bits != 0) {
+            uint32_t bit = ODIN_lowest_bit(bits);
+            bits &= bits - 1;
+
+            const ODIN_parameter_t *parameter = group->leaves[word * 32 + bit - first];
+            int len = ODIN_encode_parameter_to_bytes(parameter, output_buffer, output_buffer_size, access_group);
+            if (len < ODIN_SUCCESS) {
+                ODIN_dirty_set_bits(&bitmap[word], bits | (1u << bit));
+                ODIN_set_dirty_of_packages(group, output_buffer_start, output_buffer);
+                return len;
+            }
+
+            output_buffer += len;
+            output_buffer_size -= len;
+        }
+    }
+
+    return output_buffer - output_buffer_start;
+}
+
+#endif
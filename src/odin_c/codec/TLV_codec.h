@@ -14,3 +14,18 @@ int ODIN_encode_parameter_group_to_bytes(const ODIN_parameter_group_t *group, ui
 
 int ODIN_decode_bytes_to_parameter_group(const ODIN_parameter_group_t *group, const uint8_t *input_buffer,
                                          size_t input_buffer_size, odin_access_group_t access_group);
+
+#ifdef ODIN_DIRTY_TRACKING
+int ODIN_encode_parameter_group_to_bytes_delta(const ODIN_parameter_group_t *group, uint8_t *output_buffer,
+                                               size_t output_buffer_size, odin_access_group_t access_group);
+#endif
+
+// Result of a single entry of a batch decode
+typedef struct {
+    uint32_t global_index;
+    int result;  // Bytes written, or an error code
+} ODIN_batch_result_t;
+
+int ODIN_decode_bytes_to_parameter_group_batch(const ODIN_parameter_group_t *group, const uint8_t *input_buffer,
+                                               size_t input_buffer_size, odin_access_group_t access_group,
+                                               ODIN_batch_result_t *results, size_t results_size);
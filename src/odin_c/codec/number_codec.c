@@ -1,6 +1,7 @@
 #include "number_codec.h"
 
 #include "odin.h"
+#include "odin_seqlock.h"
 
 /**
  * @brief Method to read a parameter as a floating point number
@@ -22,7 +23,13 @@ int ODIN_encode_parameter_to_float(const ODIN_parameter_t *parameter, float *dat
         return ODIN_ERROR_INVALID_ARGUMENT;
     }
 
-    return ODIN_encode_data_to_float(parameter->element_type, parameter->data, parameter->element_size, data);
+    int ret;
+    uint32_t sequence;
+    do {
+        sequence = ODIN_READ_BEGIN(parameter);
+        ret = ODIN_encode_data_to_float(parameter->element_type, parameter->data, parameter->element_size, data);
+    } while (ODIN_READ_RETRY(parameter, sequence));
+    return ret;
 }
 
 int ODIN_encode_data_to_float(ODIN_element_type_t element_type, const uint8_t *data, size_t size, float *value) {
@@ -125,6 +132,110 @@ int ODIN_decode_float_to_data(ODIN_element_type_t element_type, const uint8_t *d
     return ODIN_SUCCESS;
 }
 
+/**
+ * @brief Method to read an integer element without going through a float, for the fixed point conversions
+ *
+ * @param element_type Type of the element, only the integers up to 32 bit and bool
+ * @param data Pointer to the element
+ * @param size Size of the element
+ * @param value The value of the element
+ *
+ * @return int error code
+ */
+int ODIN_encode_data_to_int64(ODIN_element_type_t element_type, const uint8_t *data, size_t size, int64_t *value) {
+    if (data == NULL || value == NULL) {
+        return ODIN_ERROR_INVALID_ARGUMENT;
+    }
+
+    switch (element_type) {
+        case ODIN_ELEMENT_TYPE_INT8:
+            (*value) = *((int8_t *)data);
+            break;
+
+        case ODIN_ELEMENT_TYPE_HEX:
+        case ODIN_ELEMENT_TYPE_UINT8:
+            (*value) = *((uint8_t *)data);
+            break;
+
+        case ODIN_ELEMENT_TYPE_INT16:
+            (*value) = *((int16_t *)data);
+            break;
+
+        case ODIN_ELEMENT_TYPE_UINT16:
+            (*value) = *((uint16_t *)data);
+            break;
+
+        case ODIN_ELEMENT_TYPE_INT32:
+            (*value) = *((int32_t *)data);
+            break;
+
+        case ODIN_ELEMENT_TYPE_UINT32:
+            (*value) = *((uint32_t *)data);
+            break;
+
+        case ODIN_ELEMENT_TYPE_BOOL:
+            (*value) = *((bool *)data);
+            break;
+
+        default:
+            return ODIN_ERROR;
+    }
+
+    return ODIN_SUCCESS;
+}
+
+/**
+ * @brief Method to write an integer element without going through a float, for the fixed point conversions
+ *
+ * @param element_type Type of the element, only the integers up to 32 bit and bool
+ * @param data Pointer to the element
+ * @param size Size of the element
+ * @param value The value to write, truncated to the type of the element
+ *
+ * @return int error code
+ */
+int ODIN_decode_int64_to_data(ODIN_element_type_t element_type, const uint8_t *data, size_t size, int64_t value) {
+    if (data == NULL) {
+        return ODIN_ERROR_INVALID_ARGUMENT;
+    }
+
+    switch (element_type) {
+        case ODIN_ELEMENT_TYPE_INT8:
+            *((int8_t *)data) = (int8_t)value;
+            break;
+
+        case ODIN_ELEMENT_TYPE_HEX:
+        case ODIN_ELEMENT_TYPE_UINT8:
+            *((uint8_t *)data) = (uint8_t)value;
+            break;
+
+        case ODIN_ELEMENT_TYPE_INT16:
+            *((int16_t *)data) = (int16_t)value;
+            break;
+
+        case ODIN_ELEMENT_TYPE_UINT16:
+            *((uint16_t *)data) = (uint16_t)value;
+            break;
+
+        case ODIN_ELEMENT_TYPE_INT32:
+            *((int32_t *)data) = (int32_t)value;
+            break;
+
+        case ODIN_ELEMENT_TYPE_UINT32:
+            *((uint32_t *)data) = (uint32_t)value;
+            break;
+
+        case ODIN_ELEMENT_TYPE_BOOL:
+            *((bool *)data) = value != 0;
+            break;
+
+        default:
+            return ODIN_ERROR;
+    }
+
+    return ODIN_SUCCESS;
+}
+
 int ODIN_decode_float_to_parameter(const ODIN_parameter_t *parameter, float data, odin_access_group_t access_group) {
     if (parameter == NULL) {
         return ODIN_ERROR_INVALID_ARGUMENT;
@@ -134,5 +245,8 @@ int ODIN_decode_float_to_parameter(const ODIN_parameter_t *parameter, float data
         return ODIN_ERROR_INVALID_ARGUMENT;
     }
 
-    return ODIN_decode_float_to_data(parameter->element_type, parameter->data, parameter->element_size, data);
+    ODIN_WRITE_BEGIN(parameter);
+    int ret = ODIN_decode_float_to_data(parameter->element_type, parameter->data, parameter->element_size, data);
+    ODIN_WRITE_END(parameter);
+    return ret;
 }
@@ -2,14 +2,13 @@
 #include "odin.h"
 
 const ODIN_extension_t *find_extension(const struct ODIN_parameter *parameter, ODIN_extension_type_t type) {
-    const ODIN_extension_t *extension = parameter->extension;
-
-    while (extension != NULL) {
-        if (extension->type == type) {
-            return extension;
+    // The extensions are sorted by type, so stop at the first one which is not before the type
+    for (uint32_t i = 0; i < parameter->extension_count; i++) {
+        const ODIN_extension_t *extension = &parameter->extensions[i];
+        if (extension->type >= type) {
+            return extension->type == type ? extension : NULL;
         }
-        extension = extension->next;
     }
 
     return NULL;
-}
\ No newline at end of file
+}
@@ -1,4 +1,6 @@
+#include <math.h>
 #include <stddef.h>
+#include <stdint.h>
 
 #ifndef EXTENSIONS_H
 #define EXTENSIONS_H
@@ -32,10 +34,11 @@ typedef struct {
 
 } ODIN_validate_extension_ops_t;
 
+// The extensions of a parameter are sorted in this order
 typedef enum {
+    ODIN_EXTENSION_TYPE_VALIDATE,
     ODIN_EXTENSION_TYPE_IO,
     ODIN_EXTENSION_TYPE_STRING_CODEC,
-    ODIN_EXTENSION_TYPE_VALIDATE,
 } ODIN_extension_type_t;
 
 // Extension definition
@@ -46,11 +49,21 @@ typedef struct ODIN_extension {
     void *ops;                    // Operations for the extension, check the type to cast to the
                                   // correct type
     void *data;                   // Metadata for the extension, can be NULL
-    struct ODIN_extension *next;  // Next extension in the list, can be NULL
 } ODIN_extension_t;
 
 extern ODIN_validate_extension_ops_t ODIN_validate_extension_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_int8_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_int16_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_int32_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_int64_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_uint8_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_uint16_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_uint32_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_uint64_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_float_ops;
+extern ODIN_validate_extension_ops_t ODIN_validate_extension_double_ops;
 extern ODIN_io_extension_ops_t ODIN_extension_io_mapped_number_ops;
+extern ODIN_io_extension_ops_t ODIN_extension_io_mapped_number_fixed_ops;
 const ODIN_extension_t *find_extension(const struct ODIN_parameter *parameter, ODIN_extension_type_t type);
 
 typedef struct {
@@ -58,12 +71,40 @@ typedef struct {
     float max;
 } range_parameter_t;
 
+// Bounds in the type of the parameter, for the ODIN_validate_extension_<type>_ops
+#define ODIN_RANGE_PARAMETER(name, type) \
+    typedef struct {                     \
+        type min;                        \
+        type max;                        \
+    } range_parameter_##name##_t
+
+ODIN_RANGE_PARAMETER(int8, int8_t);
+ODIN_RANGE_PARAMETER(int16, int16_t);
+ODIN_RANGE_PARAMETER(int32, int32_t);
+ODIN_RANGE_PARAMETER(int64, int64_t);
+ODIN_RANGE_PARAMETER(uint8, uint8_t);
+ODIN_RANGE_PARAMETER(uint16, uint16_t);
+ODIN_RANGE_PARAMETER(uint32, uint32_t);
+ODIN_RANGE_PARAMETER(uint64, uint64_t);
+ODIN_RANGE_PARAMETER(float, float);
+ODIN_RANGE_PARAMETER(double, double);
+
 typedef struct {
     const struct ODIN_parameter *reference;
     float scale;
     float offset;
 } mapped_number_parameters_t;
 
+// The same mapping with integers, value = (reference * multiplier + offset) / 2^shift and
+// reference = (value * 2^shift - offset) / divisor, the divisor only differs from the multiplier for approximations
+typedef struct {
+    const struct ODIN_parameter *reference;
+    int32_t multiplier;
+    int32_t divisor;
+    int32_t offset;
+    uint8_t shift;
+} mapped_number_fixed_parameters_t;
+
 
 
 #endif
\ No newline at end of file
@@ -4,18 +4,26 @@
 #include "extensions.h"
 #include "odin.h"
 #include "odin_security.h"
+#include "odin_seqlock.h"
 
 static int read_operation(const ODIN_parameter_t *parameter, void *data, size_t size, odin_access_group_t access_group) {
     if (parameter == NULL || data == NULL) {
         return ODIN_ERROR_INVALID_ARGUMENT;
     }
 
-    mapped_number_parameters_t *config = (mapped_number_parameters_t *)parameter->extension->data;
+    const ODIN_extension_t *extension = find_extension(parameter, ODIN_EXTENSION_TYPE_IO);
+    mapped_number_parameters_t *config = (mapped_number_parameters_t *)extension->data;
 
     // Get number from refernce parameter
     float value;
-    RETURN_ON_FAIL(ODIN_encode_data_to_float(config->reference->element_type, config->reference->data,
-                                             config->reference->element_size, &value));
+    int result;
+    uint32_t sequence;
+    do {
+        sequence = ODIN_READ_BEGIN(config->reference);
+        result = ODIN_encode_data_to_float(config->reference->element_type, config->reference->data,
+                                           config->reference->element_size, &value);
+    } while (ODIN_READ_RETRY(config->reference, sequence));
+    RETURN_ON_FAIL(result);
 
     // Scale and offset
     value = value * config->scale + config->offset;
@@ -31,7 +39,8 @@ static int write_operation(const ODIN_parameter_t *parameter, const void *data,
         return ODIN_ERROR_INVALID_ARGUMENT;
     }
 
-    mapped_number_parameters_t *config = (mapped_number_parameters_t *)parameter->extension->data;
+    const ODIN_extension_t *extension = find_extension(parameter, ODIN_EXTENSION_TYPE_IO);
+    mapped_number_parameters_t *config = (mapped_number_parameters_t *)extension->data;
 
     // Get number from refernce parameter
     float value;
@@ -41,8 +50,11 @@ static int write_operation(const ODIN_parameter_t *parameter, const void *data,
     value = (value - config->offset) / config->scale;
 
     // Write to the current parameter
-    RETURN_ON_FAIL(ODIN_decode_float_to_data(config->reference->element_type, config->reference->data, config->reference->element_size,
-                                     value));
+    ODIN_WRITE_BEGIN(config->reference);
+    int result = ODIN_decode_float_to_data(config->reference->element_type, config->reference->data,
+                                           config->reference->element_size, value);
+    ODIN_WRITE_END(config->reference);
+    RETURN_ON_FAIL(result);
     return size;
 }
 
@@ -50,3 +62,62 @@ ODIN_io_extension_ops_t ODIN_extension_io_mapped_number_ops = {
     .write = write_operation,
     .read = read_operation,
 };
+
+static int fixed_read_operation(const ODIN_parameter_t *parameter, void *data, size_t size, odin_access_group_t access_group) {
+    if (parameter == NULL || data == NULL) {
+        return ODIN_ERROR_INVALID_ARGUMENT;
+    }
+
+    const ODIN_extension_t *extension = find_extension(parameter, ODIN_EXTENSION_TYPE_IO);
+    mapped_number_fixed_parameters_t *config = (mapped_number_fixed_parameters_t *)extension->data;
+
+    // Get number from refernce parameter
+    int64_t value;
+    int result;
+    uint32_t sequence;
+    do {
+        sequence = ODIN_READ_BEGIN(config->reference);
+        result = ODIN_encode_data_to_int64(config->reference->element_type, config->reference->data,
+                                           config->reference->element_size, &value);
+    } while (ODIN_READ_RETRY(config->reference, sequence));
+    RETURN_ON_FAIL(result);
+
+    // Scale and offset, shifting the magnitude truncates towards zero like the float to integer conversion. An
+    // approximate multiplier is rounded up, so the result does not drop below an exact integer
+    value = value * config->multiplier + config->offset;
+    value = value >= 0 ? value >> config->shift : -((-value) >> config->shift);
+
+    // Write to the current parameter
+    RETURN_ON_FAIL(ODIN_decode_int64_to_data(parameter->element_type, data, size, value));
+
+    return size;
+}
+
+static int fixed_write_operation(const ODIN_parameter_t *parameter, const void *data, size_t size,
+                                 odin_access_group_t access_group) {
+    if (parameter == NULL || data == NULL) {
+        return ODIN_ERROR_INVALID_ARGUMENT;
+    }
+
+    const ODIN_extension_t *extension = find_extension(parameter, ODIN_EXTENSION_TYPE_IO);
+    mapped_number_fixed_parameters_t *config = (mapped_number_fixed_parameters_t *)extension->data;
+
+    int64_t value;
+    RETURN_ON_FAIL(ODIN_encode_data_to_int64(parameter->element_type, data, size, &value));
+
+    // Inverse of the read, (value - offset) / scale
+    value = (value * ((int64_t)1 << config->shift) - config->offset) / config->divisor;
+
+    // Write to the current parameter
+    ODIN_WRITE_BEGIN(config->reference);
+    int result = ODIN_decode_int64_to_data(config->reference->element_type, config->reference->data,
+                                           config->reference->element_size, value);
+    ODIN_WRITE_END(config->reference);
+    RETURN_ON_FAIL(result);
+    return size;
+}
+
+ODIN_io_extension_ops_t ODIN_extension_io_mapped_number_fixed_ops = {
+    .write = fixed_write_operation,
+    .read = fixed_read_operation,
+};
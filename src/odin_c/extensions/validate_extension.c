@@ -1,3 +1,5 @@
+#include <string.h>
+
 #include "codec/number_codec.h"
 #include "extensions.h"
 #include "odin.h"
@@ -8,7 +10,8 @@ int range_validator_float(const ODIN_parameter_t *parameter, const void *data, s
         return ODIN_ERROR_INVALID_ARGUMENT;
     }
 
-    range_parameter_t *range = (range_parameter_t *)parameter->extension->data;
+    const ODIN_extension_t *extension = find_extension(parameter, ODIN_EXTENSION_TYPE_VALIDATE);
+    range_parameter_t *range = (range_parameter_t *)extension->data;
 
     if (range == NULL) {
         return ODIN_ERROR;
@@ -27,3 +30,46 @@ int range_validator_float(const ODIN_parameter_t *parameter, const void *data, s
 ODIN_validate_extension_ops_t ODIN_validate_extension_ops = {
     .validate = range_validator_float,
 };
+
+// Compares in the type of the parameter, exact for the 64 bit integers and without float conversions
+#define ODIN_RANGE_VALIDATOR(name, type)                                                                          \
+    static int typed_range_validator_##name(const ODIN_parameter_t *parameter, const void *data, size_t size,    \
+                                            odin_access_group_t access_group) {                                   \
+        if (parameter == NULL || data == NULL) {                                                                  \
+            return ODIN_ERROR_INVALID_ARGUMENT;                                                                   \
+        }                                                                                                         \
+                                                                                                                  \
+        const ODIN_extension_t *extension = find_extension(parameter, ODIN_EXTENSION_TYPE_VALIDATE);               \
+        const range_parameter_##name##_t *range = (const range_parameter_##name##_t *)extension->data;            \
+        if (range == NULL) {                                                                                      \
+            return ODIN_ERROR;                                                                                    \
+        }                                                                                                         \
+                                                                                                                  \
+        if (size != sizeof(type)) {                                                                               \
+            return ODIN_ERROR_SIZE_MISMATCH;                                                                      \
+        }                                                                                                         \
+                                                                                                                  \
+        type value;                                                                                               \
+        memcpy(&value, data, sizeof(value));                                                                      \
+                                                                                                                  \
+        if (value < range->min || value > range->max) {                                                           \
+            return ODIN_ERROR_VALIDATION;                                                                         \
+        }                                                                                                         \
+                                                                                                                  \
+        return ODIN_SUCCESS;                                                                                      \
+    }                                                                                                             \
+                                                                                                                  \
+    ODIN_validate_extension_ops_t ODIN_validate_extension_##name##_ops = {                                        \
+        .validate = typed_range_validator_##name,                                                                 \
+    }
+
+ODIN_RANGE_VALIDATOR(int8, int8_t);
+ODIN_RANGE_VALIDATOR(int16, int16_t);
+ODIN_RANGE_VALIDATOR(int32, int32_t);
+ODIN_RANGE_VALIDATOR(int64, int64_t);
+ODIN_RANGE_VALIDATOR(uint8, uint8_t);
+ODIN_RANGE_VALIDATOR(uint16, uint16_t);
+ODIN_RANGE_VALIDATOR(uint32, uint32_t);
+ODIN_RANGE_VALIDATOR(uint64, uint64_t);
+ODIN_RANGE_VALIDATOR(float, float);
+ODIN_RANGE_VALIDATOR(double, double);
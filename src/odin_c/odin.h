@@ -69,6 +69,15 @@ struct ODIN_parameter;
 #define ODIN_INCLUDE_NAME
 #define ODIN_INCLUDE_DESCRIPTION
 
+#ifdef ODIN_SEQLOCK
+#include <stdatomic.h>
+
+// Sequence counter shared by the parameters of a group, odd while one of them is written
+typedef struct {
+    atomic_uint sequence;
+} ODIN_seqlock_t;
+#endif
+
 typedef struct {
     size_t num_elements;
     uint8_t data[2];  // Not a pointer, but a array
@@ -104,7 +113,21 @@ typedef struct ODIN_parameter {
 #endif
 
     // Extension info
-    const struct ODIN_extension *extension;  // Linked list of extensions, can be NULL
+    const struct ODIN_extension *extensions;  // Array of extensions sorted by type, can be NULL
+    uint8_t extension_count;                  // Number of extensions in the array
+
+#ifdef ODIN_DIRTY_TRACKING
+    // Bit of the parameter in the dirty bitmap, the parameters of a group are a contiguous range of bits
+    uint32_t dirty_index;
+
+    // Bitmap of the changed parameters, NULL if the parameter is not tracked
+    uint32_t *dirty_bitmap;
+#endif
+
+#ifdef ODIN_SEQLOCK
+    // Sequence counter of the group of the parameter, NULL if the parameter is not protected
+    ODIN_seqlock_t *seqlock;
+#endif
 
 } ODIN_parameter_t;
 #pragma pack(pop)
@@ -114,6 +137,36 @@ typedef struct {
     ODIN_type_t odin_type : 4;
 } ODIN_parameter_generic_t;
 
+// Size of the index and length in front of every parameter in the TLV encoding
+#define ODIN_TLV_HEADER_SIZE 6
+
+// Entry of the lookup table, maps a global index to a parameter or group
+typedef struct {
+    uint32_t global_index;
+    const void *parameter;  // ODIN_parameter_t or ODIN_parameter_group_t
+} ODIN_index_entry_t;
+
+// Lookup table generated for the root group, sorted by global index so it can be binary searched
+typedef struct {
+    uint32_t count;
+    const ODIN_index_entry_t *entries;
+} ODIN_index_table_t;
+
+// Entry of the name table, the dotted name is kept for the final compare
+typedef struct {
+    const char *name;
+    const void *parameter;  // ODIN_parameter_t or ODIN_parameter_group_t
+} ODIN_name_entry_t;
+
+// Minimal perfect hash of the dotted names below the root group, computed by the C generator
+typedef struct {
+    uint32_t count;         // Number of entries, one per name
+    uint32_t bucket_count;  // Number of displacements
+    uint32_t seed;          // Offset basis of the second hash
+    const uint32_t *displacements;
+    const ODIN_name_entry_t *entries;
+} ODIN_name_table_t;
+
 typedef struct {
     uint32_t global_index;  // Bits to shift to get the index
     ODIN_type_t odin_type : 4;
@@ -122,6 +175,22 @@ typedef struct {
     uint16_t count;  // Number of parameters in the group
 
     const char *name_and_description;
+
+    // Sorted table of all the parameters and groups below this group, NULL to walk the tree instead
+    const ODIN_index_table_t *index_table;
+
+    // Perfect hash of the dotted names of all the parameters and groups below this group, NULL to walk the tree instead
+    const ODIN_name_table_t *name_table;
+
+    // All the parameters below this group in pre-order, without the groups, NULL to walk the tree instead
+    uint32_t leaf_count;
+    const ODIN_parameter_t *const *leaves;
+
+#ifdef ODIN_DIRTY_TRACKING
+    // Dirty bit of the first leaf when the leaves are a contiguous range of bits, in order, otherwise -1
+    int32_t dirty_first;
+#endif
+
     const void *parameters[];
 } ODIN_parameter_group_t;
 
@@ -1,10 +1,16 @@
 #include "odin_core.h"
 
 #include "extensions/extensions.h"
+#include "odin_seqlock.h"
 #include "string.h"
 
 #define TAG "ODIN"
 
+// Most parameters have no extensions, check that before searching
+static inline const ODIN_extension_t *parameter_extension(const ODIN_parameter_t *parameter, ODIN_extension_type_t type) {
+    return parameter->extension_count == 0 ? NULL : find_extension(parameter, type);
+}
+
 /**
  * @brief Method to read a parameter
  *
@@ -38,7 +44,7 @@ int ODIN_parameter_read(const ODIN_parameter_t *parameter, void *data, size_t si
     // }
 
     // Handle the io extension
-    const ODIN_extension_t *extension = find_extension(parameter, ODIN_EXTENSION_TYPE_IO);
+    const ODIN_extension_t *extension = parameter_extension(parameter, ODIN_EXTENSION_TYPE_IO);
     if (extension != NULL) {
         ODIN_io_extension_ops_t *ops = (ODIN_io_extension_ops_t *)extension->ops;
         return ops->read(parameter, data, size, access_group);
@@ -50,28 +56,42 @@ int ODIN_parameter_read(const ODIN_parameter_t *parameter, void *data, size_t si
     }
 
     // Otherwise, copy the data to the buffer
-    int read_size = ODIN_get_data_size(parameter);
+    int read_size;
 
     // Check if the size matches the read size
     if (parameter->odin_type == ODIN_TYPE_VECTOR) {
+        ODIN_vector_structure_t *vector_structure = (ODIN_vector_structure_t *)parameter->data;
+
+        // The length of a vector can change during the copy, so it is checked again on a retry
+        uint32_t sequence;
+        do {
+            sequence = ODIN_READ_BEGIN(parameter);
+            read_size = ODIN_get_data_size(parameter);
+
+            // Copy the data
+            if (size >= read_size) {
+                memcpy(data, vector_structure->data, read_size);
+            }
+        } while (ODIN_READ_RETRY(parameter, sequence));
+
         if (size < read_size) {
             printf("Read size to small (%zu < %u) when reading %s", size, read_size, parameter->name_and_description);
             return ODIN_ERROR_SIZE_MISMATCH;
         }
 
-        ODIN_vector_structure_t *vector_structure = (ODIN_vector_structure_t *)parameter->data;
-
-        // Copy the data
-        memcpy(data, vector_structure->data, read_size);
-
     } else {
+        read_size = ODIN_get_data_size(parameter);
         if (size != read_size) {
             printf("Read size mismatch (%zu != %u) when reading %s", size, parameter->element_size,
                    parameter->name_and_description);
             return ODIN_ERROR_SIZE_MISMATCH;
         }
 
-        memcpy(data, parameter->data, read_size);
+        uint32_t sequence;
+        do {
+            sequence = ODIN_READ_BEGIN(parameter);
+            memcpy(data, parameter->data, read_size);
+        } while (ODIN_READ_RETRY(parameter, sequence));
     }
 
     // Log the access
@@ -149,7 +169,7 @@ int ODIN_parameter_write(const ODIN_parameter_t *parameter, const void *data, si
     RETURN_ON_FAIL(ODIN_validate_access(parameter, access_group, ODIN_ACCESS_WRITE));
 
     // Handle validation
-    const ODIN_extension_t *extension = find_extension(parameter, ODIN_EXTENSION_TYPE_VALIDATE);
+    const ODIN_extension_t *extension = parameter_extension(parameter, ODIN_EXTENSION_TYPE_VALIDATE);
     if (extension != NULL) {
         ODIN_validate_extension_ops_t *ops = (ODIN_validate_extension_ops_t *)extension->ops;
         int ret = ops->validate(parameter, data, size, access_group);
@@ -160,10 +180,16 @@ int ODIN_parameter_write(const ODIN_parameter_t *parameter, const void *data, si
     }
 
     // Handle the io extension
-    extension = find_extension(parameter, ODIN_EXTENSION_TYPE_IO);
+    extension = parameter_extension(parameter, ODIN_EXTENSION_TYPE_IO);
     if (extension != NULL) {
         ODIN_io_extension_ops_t *ops = (ODIN_io_extension_ops_t *)extension->ops;
-        return ops->write(parameter, data, size, access_group);
+        int ret = ops->write(parameter, data, size, access_group);
+#ifdef ODIN_DIRTY_TRACKING
+        if (ret >= ODIN_SUCCESS) {
+            ODIN_parameter_set_dirty(parameter);
+        }
+#endif
+        return ret;
     }
 
     // If the parameter has no data, return an error
@@ -190,21 +216,31 @@ int ODIN_parameter_write(const ODIN_parameter_t *parameter, const void *data, si
 
         ODIN_vector_structure_t *vector_structure = (ODIN_vector_structure_t *)parameter->data;
 
+        ODIN_WRITE_BEGIN(parameter);
+
         // Copy the data
         memcpy(vector_structure->data, data, size);
 
         // Update the element count
         vector_structure->num_elements = size / parameter->element_size;
 
+        ODIN_WRITE_END(parameter);
+
     } else {
         if (size != max_write_size) {
             printf("Write size mismatch (%zu != %u) when writing %s", size, max_write_size, parameter->name_and_description);
             return ODIN_ERROR_SIZE_MISMATCH;
         }
 
+        ODIN_WRITE_BEGIN(parameter);
         memcpy(parameter->data, data, size);
+        ODIN_WRITE_END(parameter);
     }
 
+#ifdef ODIN_DIRTY_TRACKING
+    ODIN_parameter_set_dirty(parameter);
+#endif
+
     // Log the access
     // ODIN_conditionally_log_access(parameter, access_group, ODIN_WRITE_ACCESS);
 
@@ -273,7 +309,13 @@ int ODIN_array_write_element(const ODIN_parameter_t *parameter, int index, const
     int offset = index * parameter->element_size;
 
     // Copy the data
+    ODIN_WRITE_BEGIN(parameter);
     memcpy((uint8_t *)parameter->data + offset, data, size);
+    ODIN_WRITE_END(parameter);
+
+#ifdef ODIN_DIRTY_TRACKING
+    ODIN_parameter_set_dirty(parameter);
+#endif
 
     // Log the access
     // ODIN_conditionally_log_access(parameter, access_group, ODIN_WRITE_ACCESS);
@@ -342,10 +384,89 @@ int ODIN_array_read_element(const ODIN_parameter_t *parameter, int index, void *
     int offset = index * parameter->element_size;
 
     // Copy the data
-    memcpy(data, (uint8_t *)parameter->data + offset, size);
+    uint32_t sequence;
+    do {
+        sequence = ODIN_READ_BEGIN(parameter);
+        memcpy(data, (uint8_t *)parameter->data + offset, size);
+    } while (ODIN_READ_RETRY(parameter, sequence));
 
     // Log the access
     // ODIN_conditionally_log_access
 
     return size;
 }
+
+#ifdef ODIN_DIRTY_TRACKING
+/**
+ * @brief Set bits of a dirty bitmap word
+ *
+ * With ODIN_SEQLOCK the writers of different groups run concurrently and neighbouring groups share bitmap words, so
+ * the word is updated atomically. Setting releases the written data to the export which takes the bit.
+ *
+ * @param word Pointer to the bitmap word
+ * @param bits The bits to set
+ */
+void ODIN_dirty_set_bits(uint32_t *word, uint32_t bits) {
+#ifdef ODIN_SEQLOCK
+    __atomic_fetch_or(word, bits, __ATOMIC_RELEASE);
+#else
+    *word |= bits;
+#endif
+}
+
+/**
+ * @brief Clear bits of a dirty bitmap word, atomically with ODIN_SEQLOCK
+ *
+ * @param word Pointer to the bitmap word
+ * @param bits The bits to clear
+ *
+ * @return uint32_t The bits which were set before clearing
+ */
+uint32_t ODIN_dirty_take_bits(uint32_t *word, uint32_t bits) {
+#ifdef ODIN_SEQLOCK
+    return __atomic_fetch_and(word, ~bits, __ATOMIC_ACQUIRE) & bits;
+#else
+    uint32_t taken = *word & bits;
+    *word &= ~bits;
+    return taken;
+#endif
+}
+
+/**
+ * @brief Mark a parameter as changed, so it is included in the next delta export
+ *
+ * Every write through the library does this, only needed after changing the variable directly
+ *
+ * @param parameter Pointer to the parameter
+ */
+void ODIN_parameter_set_dirty(const ODIN_parameter_t *parameter) {
+    if (parameter->dirty_bitmap != NULL) {
+        ODIN_dirty_set_bits(&parameter->dirty_bitmap[parameter->dirty_index / 32], 1u << (parameter->dirty_index % 32));
+    }
+}
+
+bool ODIN_parameter_is_dirty(const ODIN_parameter_t *parameter) {
+    if (parameter->dirty_bitmap == NULL) {
+        return false;
+    }
+#ifdef ODIN_SEQLOCK
+    uint32_t word = __atomic_load_n(&parameter->dirty_bitmap[parameter->dirty_index / 32], __ATOMIC_RELAXED);
+#else
+    uint32_t word = parameter->dirty_bitmap[parameter->dirty_index / 32];
+#endif
+    return (word & (1u << (parameter->dirty_index % 32))) != 0;
+}
+
+/**
+ * @brief Mark a parameter as unchanged
+ *
+ * @param parameter Pointer to the parameter
+ *
+ * @return bool Whether the parameter was marked as changed
+ */
+bool ODIN_parameter_take_dirty(const ODIN_parameter_t *parameter) {
+    return parameter->dirty_bitmap != NULL &&
+           ODIN_dirty_take_bits(&parameter->dirty_bitmap[parameter->dirty_index / 32],
+                                1u << (parameter->dirty_index % 32)) != 0;
+}
+#endif
@@ -13,4 +13,12 @@ int ODIN_get_max_data_size(const ODIN_parameter_t *parameter);
 int ODIN_array_read_element(const ODIN_parameter_t *parameter, int index, void *data, size_t size,
                             odin_access_group_t access_group);
 int ODIN_array_write_element(const ODIN_parameter_t *parameter, int index, const void *data, size_t size,
-                             odin_access_group_t access_group);
\ No newline at end of file
+                             odin_access_group_t access_group);
+
+#ifdef ODIN_DIRTY_TRACKING
+void ODIN_parameter_set_dirty(const ODIN_parameter_t *parameter);
+bool ODIN_parameter_is_dirty(const ODIN_parameter_t *parameter);
+bool ODIN_parameter_take_dirty(const ODIN_parameter_t *parameter);
+void ODIN_dirty_set_bits(uint32_t *word, uint32_t bits);
+uint32_t ODIN_dirty_take_bits(uint32_t *word, uint32_t bits);
+#endif
@@ -4,12 +4,93 @@
 
 #include "odin.h"
 
+// 32 bit FNV-1a, must match odin_python/utils/perfect_hash.py
+#define ODIN_FNV_PRIME 16777619u
+#define ODIN_FNV_OFFSET_BASIS 2166136261u
+
+// Murmur3 finalizer, mixes the last characters of the name into all the bits
+static uint32_t ODIN_hash_finalize(uint32_t value) {
+    value ^= value >> 16;
+    value *= 0x85EBCA6Bu;
+    value ^= value >> 13;
+    value *= 0xC2B2AE35u;
+    value ^= value >> 16;
+    return value;
+}
+
+const ODIN_parameter_generic_t *ODIN_find_in_index_table(const ODIN_index_table_t *table, uint32_t index) {
+    // Binary search, the generator sorts the entries by global index
+    uint32_t low = 0;
+    uint32_t high = table->count;
+    while (low < high) {
+        uint32_t middle = low + (high - low) / 2;
+        uint32_t middle_index = table->entries[middle].global_index;
+
+        if (middle_index == index) {
+            return (const ODIN_parameter_generic_t *)table->entries[middle].parameter;
+        }
+
+        if (middle_index < index) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+    return NULL;
+}
+
+// First entry in [low, high) with a global index of at least index, high if there is none
+static uint32_t ODIN_index_table_lower_bound(const ODIN_index_table_t *table, uint32_t index, uint32_t low, uint32_t high) {
+    while (low < high) {
+        uint32_t middle = low + (high - low) / 2;
+        if (table->entries[middle].global_index < index) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+    return low;
+}
+
+const ODIN_parameter_generic_t *ODIN_find_in_index_table_from(const ODIN_index_table_t *table, uint32_t index,
+                                                              uint32_t *cursor) {
+    uint32_t low = *cursor;
+
+    // Not increasing, search from the start again
+    if (low > table->count || (low > 0 && table->entries[low - 1].global_index >= index)) {
+        low = 0;
+    }
+
+    // Gallop from the cursor, so a dense stream costs a step per entry and a sparse one stays logarithmic
+    uint32_t high = low;
+    uint32_t step = 1;
+    while (high < table->count && table->entries[high].global_index < index) {
+        low = high + 1;
+        high = table->count - low > step ? low + step : table->count;
+        step *= 2;
+    }
+
+    uint32_t position = ODIN_index_table_lower_bound(table, index, low, high);
+    *cursor = position;
+
+    if (position < table->count && table->entries[position].global_index == index) {
+        *cursor = position + 1;
+        return (const ODIN_parameter_generic_t *)table->entries[position].parameter;
+    }
+    return NULL;
+}
+
 const ODIN_parameter_generic_t *ODIN_get_generic_parameter_by_id(const ODIN_parameter_group_t *group, uint32_t index,
                                                                  uint32_t parent_shift) {
     if (group == NULL) {
         return NULL;
     }
 
+    // Use the generated lookup table when available, instead of walking the tree
+    if (group->index_table != NULL) {
+        return ODIN_find_in_index_table(group->index_table, index);
+    }
+
     int shift = group->shift + parent_shift;
 
     uint32_t mask = ((1 << shift) - 1) << (32 - shift);
@@ -63,12 +144,52 @@ const ODIN_parameter_group_t *ODIN_get_parameter_group_by_id(const ODIN_paramete
     return (ODIN_parameter_group_t *)parameter;
 }
 
+const ODIN_parameter_generic_t *ODIN_find_in_name_table(const ODIN_name_table_t *table, const char *name, char separator) {
+    // The generator hashes the names with '.' as separator
+    uint32_t h1 = table->seed;
+    uint32_t h2 = ODIN_FNV_OFFSET_BASIS;
+    for (const char *character = name; *character != '\0'; character++) {
+        uint8_t byte = *character == separator ? '.' : (uint8_t)*character;
+        h1 = (h1 ^ byte) * ODIN_FNV_PRIME;
+        h2 = (h2 ^ byte) * ODIN_FNV_PRIME;
+    }
+    h1 = ODIN_hash_finalize(h1);
+    h2 = ODIN_hash_finalize(h2);
+
+    uint32_t displacement = table->displacements[h2 % table->bucket_count];
+    uint32_t slot =
+        (ODIN_hash_finalize(h1 ^ (displacement / table->count)) % table->count + displacement % table->count) % table->count;
+    const ODIN_name_entry_t *entry = &table->entries[slot];
+
+    // Every name hashes to some slot, so a single compare is needed to reject unknown names
+    const char *expected = entry->name;
+    for (const char *character = name; *character != '\0'; character++, expected++) {
+        if (*character == separator) {
+            if (*expected != '.') {
+                return NULL;
+            }
+        } else if (*character != *expected || *character == '.') {
+            return NULL;
+        }
+    }
+    if (*expected != '\0') {
+        return NULL;
+    }
+
+    return (const ODIN_parameter_generic_t *)entry->parameter;
+}
+
 const ODIN_parameter_generic_t *ODIN_get_generic_parameter_by_name(const ODIN_parameter_group_t *group, const char *name,
                                                                    char separator) {
     if (group == NULL) {
         return NULL;
     }
 
+    // Use the generated perfect hash when available, instead of comparing the names level by level
+    if (group->name_table != NULL) {
+        return ODIN_find_in_name_table(group->name_table, name, separator);
+    }
+
     // Find the first separator
     const char *sub_string = strchr(name, separator);
     if (sub_string == NULL) {
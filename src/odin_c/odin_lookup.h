@@ -1,5 +1,10 @@
 #include "odin.h"
 
+const ODIN_parameter_generic_t *ODIN_find_in_index_table(const ODIN_index_table_t *table, uint32_t index);
+// Lookup for increasing indices, continues from the position of the previous lookup, start with a cursor of 0
+const ODIN_parameter_generic_t *ODIN_find_in_index_table_from(const ODIN_index_table_t *table, uint32_t index,
+                                                              uint32_t *cursor);
+const ODIN_parameter_generic_t *ODIN_find_in_name_table(const ODIN_name_table_t *table, const char *name, char separator);
 const ODIN_parameter_generic_t *ODIN_get_generic_parameter_by_id(const ODIN_parameter_group_t *group, uint32_t index,
                                                                  uint32_t parent_shift);
 const ODIN_parameter_t *ODIN_get_parameter_by_id(const ODIN_parameter_group_t *group, uint32_t index, uint32_t parent_shift);
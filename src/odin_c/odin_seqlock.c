@@ -0,0 +1,81 @@
+#include "odin_seqlock.h"
+
+#ifdef ODIN_SEQLOCK
+
+/**
+ * @brief Start reading the parameters of a group, waits while a writer is busy
+ *
+ * The readers never write to the counter, so any number of them can read at the same time. A reader copies the data
+ * and checks with ODIN_seqlock_read_retry if a writer changed it in the meantime, in which case it starts over.
+ *
+ * @param lock The sequence counter of the group, can be NULL
+ *
+ * @return The sequence to pass to ODIN_seqlock_read_retry
+ */
+uint32_t ODIN_seqlock_read_begin(const ODIN_seqlock_t *lock) {
+    if (lock == NULL) {
+        return 0;
+    }
+
+    uint32_t sequence;
+    while ((sequence = atomic_load_explicit(&lock->sequence, memory_order_acquire)) & 1u) {
+        // A writer is busy
+    }
+    return sequence;
+}
+
+/**
+ * @brief Check if the data read since ODIN_seqlock_read_begin can be torn
+ *
+ * @param lock The sequence counter of the group, can be NULL
+ * @param sequence The sequence returned by ODIN_seqlock_read_begin
+ *
+ * @return true if a writer changed the group and the read has to be repeated
+ */
+bool ODIN_seqlock_read_retry(const ODIN_seqlock_t *lock, uint32_t sequence) {
+    if (lock == NULL) {
+        return false;
+    }
+
+    // Keep the reads of the data before the second read of the counter
+    atomic_thread_fence(memory_order_acquire);
+    return atomic_load_explicit(&lock->sequence, memory_order_relaxed) != sequence;
+}
+
+/**
+ * @brief Start writing a parameter of a group, makes the counter odd
+ *
+ * Only one writer per group at a time, the others spin until it is done. Keep the section short, the readers of the
+ * group spin as well.
+ *
+ * @param lock The sequence counter of the group, can be NULL
+ */
+void ODIN_seqlock_write_begin(ODIN_seqlock_t *lock) {
+    if (lock == NULL) {
+        return;
+    }
+
+    uint32_t sequence = atomic_load_explicit(&lock->sequence, memory_order_relaxed);
+    while ((sequence & 1u) || !atomic_compare_exchange_weak_explicit(&lock->sequence, &sequence, sequence + 1,
+                                                                      memory_order_acquire, memory_order_relaxed)) {
+        sequence = atomic_load_explicit(&lock->sequence, memory_order_relaxed);
+    }
+
+    // Keep the odd counter visible before any of the writes of the data
+    atomic_thread_fence(memory_order_release);
+}
+
+/**
+ * @brief Finish writing a parameter of a group, makes the counter even again
+ *
+ * @param lock The sequence counter of the group, can be NULL
+ */
+void ODIN_seqlock_write_end(ODIN_seqlock_t *lock) {
+    if (lock == NULL) {
+        return;
+    }
+
+    atomic_fetch_add_explicit(&lock->sequence, 1, memory_order_release);
+}
+
+#endif
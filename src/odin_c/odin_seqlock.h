@@ -0,0 +1,21 @@
+#include "odin.h"
+
+#ifdef ODIN_SEQLOCK
+uint32_t ODIN_seqlock_read_begin(const ODIN_seqlock_t *lock);
+bool ODIN_seqlock_read_retry(const ODIN_seqlock_t *lock, uint32_t sequence);
+void ODIN_seqlock_write_begin(ODIN_seqlock_t *lock);
+void ODIN_seqlock_write_end(ODIN_seqlock_t *lock);
+
+// Copy the data of a parameter between these, and start over while ODIN_READ_RETRY is true
+#define ODIN_READ_BEGIN(parameter) ODIN_seqlock_read_begin((parameter)->seqlock)
+#define ODIN_READ_RETRY(parameter, sequence) ODIN_seqlock_read_retry((parameter)->seqlock, sequence)
+
+// Change the data of a parameter between these, the writers of a group wait for each other
+#define ODIN_WRITE_BEGIN(parameter) ODIN_seqlock_write_begin((parameter)->seqlock)
+#define ODIN_WRITE_END(parameter) ODIN_seqlock_write_end((parameter)->seqlock)
+#else
+#define ODIN_READ_BEGIN(parameter) 0u
+#define ODIN_READ_RETRY(parameter, sequence) ((void)(sequence), false)
+#define ODIN_WRITE_BEGIN(parameter) ((void)0)
+#define ODIN_WRITE_END(parameter) ((void)0)
+#endif
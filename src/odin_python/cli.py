@@ -1,10 +1,13 @@
 import json
 import os
+from contextlib import nullcontext
 
 import click
 
-from .generators.generator import generator, GeneratorTarget
+from .generators.cache import GenerationCache, user_cache_dir
+from .generators.generator import generate_targets, GeneratorTarget
 from .parameter.loader import AdvancedLoaderModel, ConfigurationReader
+from .utils.profiler import Profiler, profile_phase
 
 DEFAULT_NAME = "OD"
 
@@ -24,7 +27,34 @@ def cli():
     type=click.Choice([target.name for target in GeneratorTarget.all()]),
     help="Target language for code generation",
 )
-def generate(input_file: str, output_dir: str, name: str, target: list[str]):
+@click.option("no_cache", "--no-cache", is_flag=True, default=False, help="Regenerate all targets, even if they are up to date")
+@click.option(
+    "jobs",
+    "--jobs",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of targets to generate in parallel",
+)
+@click.option("profile", "--profile", type=click.Path(dir_okay=False), help="Write the time and memory used per phase as json")
+@click.option(
+    "profile_memory",
+    "--profile-memory/--no-profile-memory",
+    default=True,
+    help="Trace the peak memory per phase when profiling, makes the generation slower",
+)
+@click.option("cprofile_dir", "--cprofile-dir", type=click.Path(file_okay=False), help="Dump a cProfile per phase in this directory")
+def generate(
+    input_file: str,
+    output_dir: str,
+    name: str,
+    target: list[str],
+    no_cache: bool,
+    jobs: int,
+    profile: str | None,
+    profile_memory: bool,
+    cprofile_dir: str | None,
+):
     assert os.path.exists(input_file), f"Input file {input_file} does not exist"
     assert os.path.exists(output_dir), f"Output directory {output_dir} does not exist"
 
@@ -33,24 +63,68 @@ def generate(input_file: str, output_dir: str, name: str, target: list[str]):
 
     print(f"Converting {input_file} to {output_dir}")
 
-    reader = ConfigurationReader()
-    model_context, config_model = reader.load(input_file, "advanced")
-
     resolved_targets = [GeneratorTarget.from_string(t) for t in target]
 
     if len(resolved_targets) == 0:
         resolved_targets = GeneratorTarget.all()
 
-    for resolved_target in resolved_targets:
-        generator(
-            name=name,
-            model_context=model_context,
-            output_dir=output_dir,
-            target=resolved_target,
-            generator_config=config_model,
+    profiler = None
+    if profile is not None or cprofile_dir is not None:
+        profiler = Profiler(trace_memory=profile_memory, cprofile_dir=cprofile_dir)
+
+    try:
+        with profiler.activate() if profiler is not None else nullcontext():
+            errors = run_generate(input_file, output_dir, name, resolved_targets, no_cache, jobs)
+    finally:
+        if profiler is not None:
+            print(profiler.summary())
+
+            if profile is not None:
+                profiler.save(profile)
+                print(f"Profile written to {profile}")
+
+    if len(errors) > 0:
+        # Chained to the first failure, so it is kept when the command is called from Python
+        raise click.ClickException(f"Failed to generate targets: {', '.join(target.name for target in errors)}") from next(
+            iter(errors.values())
         )
 
 
+def run_generate(
+    input_file: str,
+    output_dir: str,
+    name: str,
+    targets: list[GeneratorTarget],
+    no_cache: bool,
+    jobs: int,
+) -> dict[GeneratorTarget, BaseException]:
+    cache = None
+    if not no_cache:
+        with profile_phase("generation_cache"):
+            cache = GenerationCache.from_input_file(input_file, output_dir, name)
+
+            # The configuration is part of the input file, so if nothing changed we can skip loading it at all
+            up_to_date = all(cache.is_up_to_date(target.name) for target in targets)
+
+        if up_to_date:
+            for target in targets:
+                print(f"Target '{target.name}' is up to date, reusing cached outputs")
+            return {}
+
+    reader = ConfigurationReader()
+    model_context, config_model = reader.load(input_file, "advanced", cache_dir=None if no_cache else user_cache_dir())
+
+    return generate_targets(
+        name=name,
+        model_context=model_context,
+        output_dir=output_dir,
+        targets=targets,
+        generator_config=config_model,
+        cache=cache,
+        jobs=jobs,
+    )
+
+
 @cli.command()
 @click.argument("output_file")
 def gen_schema(output_file: str, simple: bool = False):
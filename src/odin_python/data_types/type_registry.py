@@ -145,10 +145,10 @@ BASE_DATA_TYPES: List[DataType] = [
     BuiltinDataType(typename="u32", size=4, c_typename="uint32_t", struct_format="I", py_typename="OdinU32", default=0, primtive="int"),
     BuiltinDataType(typename="u16", size=2, c_typename="uint16_t", struct_format="H", py_typename="OdinU16", default=0, primtive="int"),
     BuiltinDataType(typename="u8", size=1, c_typename="uint8_t", struct_format="B", py_typename="OdinU8", default=0, primtive="int"),
-    BuiltinDataType(typename="i64", size=8, c_typename="int64_t", struct_format="Q", py_typename="OdinI64", default=0, primtive="int"),
-    BuiltinDataType(typename="i32", size=4, c_typename="int32_t", struct_format="I", py_typename="OdinI32", default=0, primtive="int"),
-    BuiltinDataType(typename="i16", size=2, c_typename="int16_t", struct_format="H", py_typename="OdinI16", default=0, primtive="int"),
-    BuiltinDataType(typename="i8", size=1, c_typename="int8_t", struct_format="B", py_typename="OdinI8", default=0, primtive="int"),
+    BuiltinDataType(typename="i64", size=8, c_typename="int64_t", struct_format="q", py_typename="OdinI64", default=0, primtive="int"),
+    BuiltinDataType(typename="i32", size=4, c_typename="int32_t", struct_format="i", py_typename="OdinI32", default=0, primtive="int"),
+    BuiltinDataType(typename="i16", size=2, c_typename="int16_t", struct_format="h", py_typename="OdinI16", default=0, primtive="int"),
+    BuiltinDataType(typename="i8", size=1, c_typename="int8_t", struct_format="b", py_typename="OdinI8", default=0, primtive="int"),
     BuiltinDataType(typename="f32", size=4, c_typename="float", struct_format="f", py_typename="OdinF32", default=0.0, primtive="float"),
     BuiltinDataType(typename="f64", size=8, c_typename="double", struct_format="d", py_typename="OdinF64", default=0.0, primtive="float"),
     BooleanCDataType(typename="bool", size=1, c_typename="bool", struct_format="?", py_typename="OdinBool", default=False, primtive="int"),
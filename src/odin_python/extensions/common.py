@@ -1,12 +1,17 @@
 from abc import ABC, abstractmethod
 
 from pydantic import BaseModel
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
+
+from ..generators.c.odin_defs import ODIN_ExtensionEnum
 
 if TYPE_CHECKING:
     from ..parameter.parameter import BaseParameterModel
 
 
 class BaseExtension(BaseModel, ABC):
+    # Kind of the extension, the extensions of a parameter are emitted sorted by it
+    extension_type: ClassVar[ODIN_ExtensionEnum]
+
     @abstractmethod
-    def as_literal(self, parameter: "BaseParameterModel", next: str | None) -> str: ...
+    def as_literal(self, parameter: "BaseParameterModel") -> str: ...
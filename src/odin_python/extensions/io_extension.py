@@ -1,8 +1,10 @@
+import math
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
 from pydantic import Field
 
-from ..generators.c.model import ODIN_ExtesionModel
+from ..generators.c.extension import ODIN_ExtesionModel
 from ..generators.c.odin_defs import ODIN_ExtensionEnum
 
 from .common import BaseExtension
@@ -12,7 +14,53 @@ if TYPE_CHECKING:
 
 
 class IOExtension(BaseExtension):
-    pass
+    extension_type = ODIN_ExtensionEnum.ODIN_EXTENSION_TYPE_IO
+
+
+# Types the fixed point mapping can read and write with their ranges, the products of up to 32 bit values fit in an int64
+FIXED_POINT_TYPES = {
+    "int8_t": (-(2**7), 2**7 - 1),
+    "int16_t": (-(2**15), 2**15 - 1),
+    "int32_t": (-(2**31), 2**31 - 1),
+    "uint8_t": (0, 2**8 - 1),
+    "uint16_t": (0, 2**16 - 1),
+    "uint32_t": (0, 2**32 - 1),
+}
+FIXED_POINT_MAX_SHIFT = 30
+INT32_MAX = 2**31 - 1
+
+# An approximate mapping is compared with the float mapping for every value it reads and writes, so it is limited to
+# small ranges like the ones of 16 bit references
+FIXED_POINT_MAX_CHECKED_VALUES = 2**17
+
+
+@dataclass
+class FixedPointMapping:
+    """value = (reference * multiplier + offset) / 2^shift, reference = (value * 2^shift - offset) / divisor
+
+    The multiplier is rounded up and the divisor down, so the results do not drop below an exact integer when they are
+    truncated towards zero. Both are the same when the mapping is exact.
+    """
+
+    multiplier: int
+    divisor: int
+    offset: int
+    shift: int
+
+    def read(self, reference: int) -> int:
+        """The read of the C ops, shifting the magnitude truncates towards zero"""
+        value = reference * self.multiplier + self.offset
+        return value >> self.shift if value >= 0 else -((-value) >> self.shift)
+
+    def write(self, value: int) -> int:
+        """The write of the C ops, the integer division truncates towards zero"""
+        numerator = value * 2**self.shift - self.offset
+        quotient = abs(numerator) // abs(self.divisor)
+        return quotient if (numerator >= 0) == (self.divisor > 0) else -quotient
+
+
+def within_tolerance(approximation: float, exact: float, tolerance: float) -> bool:
+    return abs(approximation - exact) <= tolerance * abs(exact)
 
 
 class MappedNumberIOExtension(IOExtension):
@@ -20,29 +68,115 @@ class MappedNumberIOExtension(IOExtension):
     reference: str = Field(description="Reference to another odin parameter")
     scale: float = Field(description="Scale factor", default=1.0)
     offset: float = Field(description="Offset", default=0.0)
-
-    def as_literal(self, parameter: "BaseParameterModel", next: str | None) -> str:
-        # Get root parameter
+    fixed_point: bool = Field(
+        description="Map with integer arithmetic when both parameters are integers and the scale and offset allow it",
+        default=True,
+    )
+    fixed_point_tolerance: float = Field(
+        description="Relative error of the scale and offset allowed for the fixed point mapping, 0 to only use it when "
+        "it is exact. An approximation is only used when it gives the same integers as the float mapping for every "
+        "value of a reference of up to 16 bits",
+        default=0.0,
+        ge=0.0,
+    )
+
+    def referenced_parameter(self, parameter: "BaseParameterModel") -> "BaseParameterModel":
         referenced_parameter = parameter.root.find_parameter_by_object_name(self.reference)
         assert referenced_parameter, f"Could not find parameter {self.reference}"
-
-        # TODO check if variables are set correctly
+        return referenced_parameter
+
+    def to_fixed_point(self, parameter: "BaseParameterModel") -> FixedPointMapping | None:
+        """The integer version of the mapping, None if it has to be done with floats"""
+
+        if not self.fixed_point or self.scale == 0 or not math.isfinite(self.scale) or not math.isfinite(self.offset):
+            return None
+
+        referenced_parameter = self.referenced_parameter(parameter)
+        typename = parameter._resolved_type.c_typename  # type: ignore
+        reference_typename = referenced_parameter._resolved_type.c_typename  # type: ignore
+        if typename not in FIXED_POINT_TYPES or reference_typename not in FIXED_POINT_TYPES:
+            return None
+
+        # The smallest shift keeps the multiplier small, so the products do not overflow
+        for shift in range(FIXED_POINT_MAX_SHIFT + 1):
+            multiplier = math.ceil(abs(self.scale) * 2**shift)
+            divisor = math.floor(abs(self.scale) * 2**shift)
+            offset = round(self.offset * 2**shift)
+            if multiplier > INT32_MAX or abs(offset) > INT32_MAX:
+                return None
+
+            sign = 1 if self.scale > 0 else -1
+            mapping = FixedPointMapping(multiplier=sign * multiplier, divisor=sign * divisor, offset=offset, shift=shift)
+            if multiplier == divisor and offset / 2**shift == self.offset:
+                return mapping
+
+            if (
+                divisor != 0
+                and within_tolerance(multiplier / 2**shift, abs(self.scale), self.fixed_point_tolerance)
+                and within_tolerance(divisor / 2**shift, abs(self.scale), self.fixed_point_tolerance)
+                and within_tolerance(offset / 2**shift, self.offset, self.fixed_point_tolerance)
+                and self.matches_float_mapping(mapping, FIXED_POINT_TYPES[reference_typename], FIXED_POINT_TYPES[typename])
+            ):
+                return mapping
+
+        return None
+
+    def matches_float_mapping(self, mapping: FixedPointMapping, reference_range: tuple[int, int], value_range: tuple[int, int]) -> bool:
+        """Whether an approximate mapping reads and writes the same integers as the float mapping
+
+        Every value of the reference is read, and every value which is written to a reference within its range.
+        """
+
+        minimum, maximum = reference_range
+        if maximum - minimum >= FIXED_POINT_MAX_CHECKED_VALUES:
+            return False
+
+        for reference in range(minimum, maximum + 1):
+            if mapping.read(reference) != math.trunc(reference * self.scale + self.offset):
+                return False
+
+        low, high = sorted((minimum * self.scale + self.offset, maximum * self.scale + self.offset))
+        low, high = max(math.floor(low), value_range[0]), min(math.ceil(high), value_range[1])
+        if high - low >= FIXED_POINT_MAX_CHECKED_VALUES:
+            return False
+
+        for value in range(low, high + 1):
+            expected = math.trunc((value - self.offset) / self.scale)
+            if minimum <= expected <= maximum and mapping.write(value) != expected:
+                return False
+
+        return True
+
+    def as_literal(self, parameter: "BaseParameterModel") -> str:
+        reference = self.referenced_parameter(parameter).absolute_object_reference
+
+        fixed_point = self.to_fixed_point(parameter)
+        if fixed_point is not None:
+            ops = "ODIN_extension_io_mapped_number_fixed_ops"
+            parameters = (
+                f"(mapped_number_fixed_parameters_t){{ .reference = &{reference}, .multiplier = {fixed_point.multiplier}, "
+                f".divisor = {fixed_point.divisor}, .offset = {fixed_point.offset}, .shift = {fixed_point.shift} }}"
+            )
+        else:
+            ops = "ODIN_extension_io_mapped_number_ops"
+            parameters = (
+                f"(mapped_number_parameters_t){{ .reference = &{reference}, .scale = {self.scale}, .offset = {self.offset} }}"
+            )
 
         model = ODIN_ExtesionModel(
             type=ODIN_ExtensionEnum.ODIN_EXTENSION_TYPE_IO,
-            ops="ODIN_extension_io_mapped_number_ops",
-            parameters=f"(mapped_number_parameters_t){{ .reference = &{referenced_parameter.absolute_object_reference}, .scale = {self.scale}, .offset = {self.offset} }}",
-            next=next if next else None,
+            ops=ops,
+            parameters=parameters,
         )
 
         return model.variable
 
 
-class ReferenceIOExtension(BaseExtension):
+class ReferenceIOExtension(IOExtension):
     type: Literal["custom_io"]
     reference: str = Field(description="Reference to the C extension")
 
-    def as_literal(self, parameter: "BaseParameterModel", next: str | None) -> str:
+    def as_literal(self, parameter: "BaseParameterModel") -> str:
         # Get root parameter
         # referenced_parameter = parameter.root.find_parameter_by_object_name(self.reference)
         # assert referenced_parameter, f"Could not find parameter {self.reference}"
@@ -53,7 +187,6 @@ class ReferenceIOExtension(BaseExtension):
             type=ODIN_ExtensionEnum.ODIN_EXTENSION_TYPE_IO,
             ops=self.reference,
             parameters=None,
-            next=next if next else None,
         )
 
         return model.variable
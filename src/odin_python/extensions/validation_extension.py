@@ -1,42 +1,104 @@
+import math
 from typing import TYPE_CHECKING, Literal
 
 from pydantic import Field
 
 from ..generators.c.odin_defs import ODIN_ExtensionEnum
-from ..generators.c.model import ODIN_ExtesionModel
+from ..generators.c.extension import ODIN_ExtesionModel
 from .common import BaseExtension
 
 if TYPE_CHECKING:
     from ..parameter.parameter import BaseParameterModel
 
 
-class ValidationExtension(BaseExtension): ...
+class ValidationExtension(BaseExtension):
+    extension_type = ODIN_ExtensionEnum.ODIN_EXTENSION_TYPE_VALIDATE
+
+
+# Range validators specialised per C type, with the bounds of the type as C expression and value
+INTEGER_RANGES: dict[str, tuple[str, int, str, int]] = {
+    "int8_t": ("INT8_MIN", -(2**7), "INT8_MAX", 2**7 - 1),
+    "int16_t": ("INT16_MIN", -(2**15), "INT16_MAX", 2**15 - 1),
+    "int32_t": ("INT32_MIN", -(2**31), "INT32_MAX", 2**31 - 1),
+    "int64_t": ("INT64_MIN", -(2**63), "INT64_MAX", 2**63 - 1),
+    "uint8_t": ("0", 0, "UINT8_MAX", 2**8 - 1),
+    "uint16_t": ("0", 0, "UINT16_MAX", 2**16 - 1),
+    "uint32_t": ("0", 0, "UINT32_MAX", 2**32 - 1),
+    "uint64_t": ("0", 0, "UINT64_MAX", 2**64 - 1),
+}
+
+FLOAT_TYPES = {"float", "double"}
+
+
+def integer_literal(value: int, bounds: tuple[str, int, str, int]) -> str:
+    min_name, min_value, max_name, max_value = bounds
+    if value == min_value:
+        return min_name
+    if value == max_value:
+        return max_name
+
+    # The u suffix makes the large uint64 values unsigned long long, instead of an out of range signed literal
+    return f"{value}u" if min_value == 0 else str(value)
+
+
+def float_literal(value: float) -> str:
+    if math.isinf(value):
+        return "INFINITY" if value > 0 else "-INFINITY"
+    return repr(float(value))
 
 
 class LimitValidationExtension(ValidationExtension):
     type: Literal["validation_limit_value"]
-    min: float | None = Field(default=None, title="Minimum value, if not set, no minimum value is enforced")
-    max: float | None = Field(
+    min: int | float | None = Field(default=None, title="Minimum value, if not set, no minimum value is enforced")
+    max: int | float | None = Field(
         default=None,
         title="Maximum allowed value, if not set, no maximum value is enforced",
     )
 
-    def as_literal(self, parameter: "BaseParameterModel", next: str | None) -> str:
-        # TODO check if paramter is a regular parameter that can be cast to float
+    def typed_range(self, c_typename: str) -> tuple[str, str, str] | None:
+        """Name and C bounds of the validator specialised for the type, None if there is none for the type"""
+
+        if c_typename in INTEGER_RANGES:
+            bounds = INTEGER_RANGES[c_typename]
+            _, min_value, _, max_value = bounds
+
+            # Only whole numbers can be written, so round a fractional bound inwards
+            low = min_value if self.min is None else max(math.ceil(self.min), min_value)
+            high = max_value if self.max is None else min(math.floor(self.max), max_value)
+            if low > high:
+                raise ValueError(f"Limits [{self.min}, {self.max}] do not allow any value of {c_typename}")
+
+            name = c_typename.removesuffix("_t")
+            return name, integer_literal(low, bounds), integer_literal(high, bounds)
+
+        if c_typename in FLOAT_TYPES:
+            low = -math.inf if self.min is None else self.min
+            high = math.inf if self.max is None else self.max
+            return c_typename, float_literal(low), float_literal(high)
+
+        return None
+
+    def as_literal(self, parameter: "BaseParameterModel") -> str:
+        typed_range = self.typed_range(parameter._resolved_type.c_typename)  # type: ignore
+
+        if typed_range is not None:
+            name, low, high = typed_range
+            ops = f"ODIN_validate_extension_{name}_ops"
+            parameters = f"(range_parameter_{name}_t){{ .max = {high}, .min = {low} }}"
 
-        if self.min is None:
-            self.min = -float("inf")
-        if self.max is None:
-            self.max = float("inf")
+        else:
+            # Compared as float, for the types ODIN_encode_data_to_float can convert
+            low = -math.inf if self.min is None else self.min
+            high = math.inf if self.max is None else self.max
+            ops = "ODIN_validate_extension_ops"
+            parameters = f"(range_parameter_t){{ .max = {float_literal(high)}, .min = {float_literal(low)} }}"
 
         model = ODIN_ExtesionModel(
             type=ODIN_ExtensionEnum.ODIN_EXTENSION_TYPE_VALIDATE,
-            ops="ODIN_validate_extension_ops",
-            parameters=f"(range_parameter_t){{ .max = {self.max}, .min = {self.min} }}",
-            next=next if next else None,
+            ops=ops,
+            parameters=parameters,
         )
 
         # value = f"(ODIN_extension_t[]){{ {{.type=ODIN_EXTENSION_TYPE_IO, .ops =  &ODIN_validate_extension_ops, .data = &(range_parameter_t){{ .max = {self.max}, .min = {self.min} }} }} }}"
         return model.variable
 
-    # next
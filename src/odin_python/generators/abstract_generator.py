@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from io import StringIO
+from typing import IO
 
 from pydantic import BaseModel
 
@@ -7,6 +8,8 @@ from odin_python.parameter.parameter import ParameterGroupModel
 
 from ..data_types.type_registry import TypeRegistry
 from ..parameter import RootParameterModel
+from ..utils.files import encode_text, write_if_changed
+from ..utils.profiler import profile_phase
 from dataclasses import dataclass
 
 
@@ -24,9 +27,10 @@ class AbstractGenerator(ABC):
     @abstractmethod
     def generate(self, model_context: ModelContext, output_path: str | StringIO) -> None: ...
 
-    def save_to_file(self, output_path: str | StringIO, data: str) -> None:
-        if isinstance(output_path, StringIO):
-            output_path.write(data)
-        else:
-            with open(output_path, "w") as f:
-                f.write(data)
+    def save_to_file(self, output_path: str | IO, data: str | bytes) -> None:
+        with profile_phase("write"):
+            if not isinstance(output_path, str):
+                output_path.write(data)  # type: ignore
+            else:
+                # Files with identical content are left untouched, to avoid needless rebuilds
+                write_if_changed(output_path, data if isinstance(data, bytes) else encode_text(data))
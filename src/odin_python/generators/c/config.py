@@ -0,0 +1,68 @@
+from pydantic import BaseModel, Field, model_validator
+
+from ...parameter.parameter import C_Names
+
+
+class CGeneratorConfig(BaseModel):
+    objects_type: str = "odin_objects_t"
+    objects_name: str = "odin_objects"
+    variables_type: str = "odin_variables_t"
+    variables_name: str = "odin_variables"
+    groups_name: str = "odin_store"
+    index_name: str = "odin_index"
+    name_table_name: str = "odin_names"
+    dirty_bitmap_name: str = "odin_dirty"
+    seqlock_name: str = "odin_seqlocks"
+
+    index_table: bool = Field(
+        default=True,
+        description="Generate a table of all the parameters sorted by global index, for a fast lookup by id",
+    )
+    name_table: bool = Field(
+        default=True,
+        description="Generate a perfect hash of the dotted names of all the parameters, for a fast lookup by name",
+    )
+    leaf_arrays: bool = Field(
+        default=True,
+        description="Generate a flat array of all the parameters below every group and collection, to export them without recursion",
+    )
+    dirty_tracking: bool = Field(
+        default=False,
+        description="Keep a bit per parameter which is set on every write, to export only the changed parameters. "
+        "The odin library has to be built with ODIN_DIRTY_TRACKING defined",
+    )
+    seqlock: bool = Field(
+        default=False,
+        description="Generate a sequence counter per group, so the parameters can be read without locks while other "
+        "threads write them. The odin library has to be built with ODIN_SEQLOCK defined",
+    )
+
+    extra_includes: list[str] = Field(
+        default_factory=list,
+    )
+    header_file_name: str = Field(
+        default="OD.h",
+    )
+    src_file_name: str = Field(
+        default="OD.c",
+    )
+
+    @model_validator(mode="after")
+    def check_dirty_tracking(self) -> "CGeneratorConfig":
+        if self.dirty_tracking and not self.leaf_arrays:
+            raise ValueError("dirty_tracking needs leaf_arrays, the delta export finds the parameters through them")
+        return self
+
+    @property
+    def types(self) -> C_Names:
+        return C_Names(
+            objects_name=self.objects_name,
+            objects_type=self.objects_type,
+            variables_name=self.variables_name,
+            variables_type=self.variables_type,
+            groups_name=self.groups_name,
+            index_name=self.index_name if self.index_table else None,
+            name_table_name=self.name_table_name if self.name_table else None,
+            dirty_bitmap_name=self.dirty_bitmap_name if self.dirty_tracking else None,
+            seqlock_name=self.seqlock_name if self.seqlock else None,
+        )
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+
+from .odin_defs import ODIN_ExtensionEnum
+
+
+class ODIN_ExtesionModel(BaseModel):
+    type: ODIN_ExtensionEnum = Field(description="Access group")
+    ops: str = Field(description="Opsset used for the extension")
+    parameters: str | None = Field(description="parameters associated with the extension")
+
+    @property
+    def variable(self):
+        """Initialiser of one element of the extension array of a parameter"""
+
+        param = "NULL"
+        if self.parameters:
+            param = f"&{self.parameters}"
+
+        return f"{{\n\t\t\t.type={self.type.name},\n\t\t\t.ops =  &{self.ops},\n\t\t\t.data = {param} }}"
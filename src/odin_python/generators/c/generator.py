@@ -1,49 +1,34 @@
+import logging
 from io import StringIO
 from typing import Literal
 
 import csnake as cc
-from pydantic import BaseModel, Field
 
+from ...extensions import MappedNumberIOExtension
+from ...parameter import BaseBaseParameterModel
+from ...utils.profiler import profile_phase
 from ..abstract_generator import AbstractGenerator, ModelContext
-from ...parameter.parameter import (
-    C_Names,
-)
+from .config import CGeneratorConfig
 from .objects import (
+    index_table_name,
+    name_table_name,
+    to_dirty_bitmap,
     to_group_initialiser,
+    to_index_table,
+    to_name_table,
     to_object_initialiser,
     to_object_type,
+    to_seqlocks,
+    to_size_header,
     to_variable_initialiser,
     to_variable_type,
 )
 
+logger = logging.getLogger(__name__)
 
-class CGenerator(AbstractGenerator):
-    class Config(BaseModel):
-        objects_type: str = "odin_objects_t"
-        objects_name: str = "odin_objects"
-        variables_type: str = "odin_variables_t"
-        variables_name: str = "odin_variables"
-        groups_name: str = "odin_store"
-
-        extra_includes: list[str] = Field(
-            default_factory=list,
-        )
-        header_file_name: str = Field(
-            default="OD.h",
-        )
-        src_file_name: str = Field(
-            default="OD.c",
-        )
 
-        @property
-        def types(self) -> C_Names:
-            return C_Names(
-                objects_name=self.objects_name,
-                objects_type=self.objects_type,
-                variables_name=self.variables_name,
-                variables_type=self.variables_type,
-                groups_name=self.groups_name,
-            )
+class CGenerator(AbstractGenerator):
+    Config = CGeneratorConfig
 
     config: Config
 
@@ -58,17 +43,48 @@ class CGenerator(AbstractGenerator):
         type: Literal["header", "source", "single_source"] = "header",
         **kwargs: dict[str, str],
     ) -> None:
-        if type == "header":
-            data = self.generate_header(model_context)
-        elif type == "source":
-            data = self.generate_source(model_context)
-        elif type == "single_source":
-            data = self.generate_header(model_context) + "\n" + self.generate_source(model_context, no_include=True)
-        else:
-            raise ValueError(f"Unknown type: {type}")
+        with profile_phase(type):
+            if type == "header":
+                data = self.generate_header(model_context)
+            elif type == "source":
+                data = self.generate_source(model_context)
+            elif type == "single_source":
+                data = self.generate_header(model_context) + "\n" + self.generate_source(model_context, no_include=True)
+            else:
+                raise ValueError(f"Unknown type: {type}")
+
+        if type != "header" and logger.isEnabledFor(logging.DEBUG):
+            for line in self.mapped_number_report(model_context):
+                logger.debug(line)
 
         self.save_to_file(output_path, data)
 
+    def mapped_number_report(self, model_context: ModelContext) -> list[str]:
+        """Which mapped number extensions got the fixed point ops, the others convert through a float"""
+
+        lines = []
+        for name, parameter in model_context.root_model.path_index.names.items():
+            if not isinstance(parameter, BaseBaseParameterModel):
+                continue
+
+            for extension in parameter.extensions:
+                if not isinstance(extension, MappedNumberIOExtension):
+                    continue
+
+                fixed_point = extension.to_fixed_point(parameter)
+                if fixed_point is None:
+                    lines.append(f"Mapped number '{name}': float")
+                else:
+                    line = (
+                        f"Mapped number '{name}': fixed point (x * {fixed_point.multiplier} "
+                        f"{'-' if fixed_point.offset < 0 else '+'} {abs(fixed_point.offset)}) >> {fixed_point.shift}"
+                    )
+                    if fixed_point.divisor != fixed_point.multiplier:
+                        line += f", written with divisor {fixed_point.divisor}"
+                    lines.append(line)
+
+        return lines
+
     def add_code_generation_disclaimer(self, cw: cc.CodeWriter) -> None:
         cw.add_line("// This file is generated by Odin Python C generator.")
         cw.add_line("// Do not edit this file directly.")
@@ -95,13 +111,41 @@ class CGenerator(AbstractGenerator):
             cw.add_variable_initialization(initaliser)  # type: ignore
             cw.add_line("")
 
-        value = to_object_initialiser(model_context.root_model)
+        # Bit per parameter, set on every write
+        dirty_bitmap = to_dirty_bitmap(model_context.root_model)
+        if dirty_bitmap is not None:
+            cw.add_variable_declaration(dirty_bitmap.variable)
+            cw.add_line("")
+
+        # Sequence counter per group, to read without locks while another thread writes
+        seqlocks = to_seqlocks(model_context.root_model)
+        if seqlocks is not None:
+            cw.add_variable_declaration(seqlocks.variable)
+            cw.add_line("")
+
+        value = to_object_initialiser(model_context.root_model, dirty_bitmap, seqlocks)
 
         value.qualifiers = ["const"]
         cw.add_variable_initialization(value)
         cw.add_line("")
 
-        values = to_group_initialiser(model_context.root_model)
+        # Lookup tables by id and name, referenced by the root group
+        lookup_tables: list[cc.Variable] = []
+
+        index_table = to_index_table(model_context.root_model)
+        if index_table is not None:
+            lookup_tables.extend([index_table.entries_variable, index_table.variable])
+
+        name_table = to_name_table(model_context.root_model)
+        if name_table is not None:
+            lookup_tables.extend([name_table.displacements_variable, name_table.entries_variable, name_table.variable])
+
+        for value in lookup_tables:
+            value.qualifiers = ["const"]
+            cw.add_variable_initialization(value)
+            cw.add_line("")
+
+        values = to_group_initialiser(model_context.root_model, self.config.leaf_arrays, dirty_bitmap)
 
         for value in values:
             value.qualifiers = ["const"]
@@ -112,7 +156,7 @@ class CGenerator(AbstractGenerator):
             for collection_name, collection in model_context.collections.items():
                 cw.add_line(f"// Collection: {collection_name}")
 
-                values = to_group_initialiser(collection)
+                values = to_group_initialiser(collection, self.config.leaf_arrays, dirty_bitmap)
                 for value in values:
                     value.qualifiers = ["const"]
                     cw.add_variable_initialization(value)
@@ -137,6 +181,19 @@ class CGenerator(AbstractGenerator):
         cw.add_line(f"#define {self.config.header_file_name.upper().replace('.', '_')}_H")
         cw.add_line("")
 
+        if self.config.dirty_tracking:
+            # The parameters have extra fields with dirty tracking, the library has to be built the same way
+            cw.add_line("#ifndef ODIN_DIRTY_TRACKING")
+            cw.add_line('#error "Generated with dirty_tracking, build odin with ODIN_DIRTY_TRACKING defined"')
+            cw.add_line("#endif")
+            cw.add_line("")
+
+        if self.config.seqlock:
+            cw.add_line("#ifndef ODIN_SEQLOCK")
+            cw.add_line('#error "Generated with seqlock, build odin with ODIN_SEQLOCK defined"')
+            cw.add_line("#endif")
+            cw.add_line("")
+
         # model_context.root_model.initialise_types(self.config.types)
 
         # Create odin variables struct
@@ -153,6 +210,15 @@ class CGenerator(AbstractGenerator):
         for line in model_context.root_model.to_access_control_header():
             cw.add_line(line)
 
+        # Worst case encoded sizes of the groups and collections, to allocate the export buffers statically
+        size_defines = to_size_header(model_context.root_model)
+        if model_context.collections is not None:
+            for collection in model_context.collections.values():
+                size_defines.extend(to_size_header(collection))
+
+        for line in size_defines:
+            cw.add_line(line)
+
         # Add external references
         initaliser = to_variable_initialiser(model_context.root_model)
         if initaliser is not None:
@@ -166,7 +232,22 @@ class CGenerator(AbstractGenerator):
             extern=True,
         )
 
-        for value in to_group_initialiser(model_context.root_model):
+        dirty_bitmap = to_dirty_bitmap(model_context.root_model)
+        if dirty_bitmap is not None:
+            cw.add_variable_declaration(dirty_bitmap.variable, extern=True)
+
+        seqlocks = to_seqlocks(model_context.root_model)
+        if seqlocks is not None:
+            cw.add_variable_declaration(seqlocks.variable, extern=True)
+
+        for name, primitive in [
+            (index_table_name(model_context.root_model), "ODIN_index_table_t"),
+            (name_table_name(model_context.root_model), "ODIN_name_table_t"),
+        ]:
+            if name is not None:
+                cw.add_variable_declaration(cc.Variable(name=name, primitive=primitive, qualifiers=["const"]), extern=True)
+
+        for value in to_group_initialiser(model_context.root_model, self.config.leaf_arrays):
             value.qualifiers = ["const"]
             cw.add_variable_declaration(
                 value,
@@ -175,7 +256,7 @@ class CGenerator(AbstractGenerator):
 
         if model_context.collections is not None:
             for collection_name, collection in model_context.collections.items():
-                values = to_group_initialiser(collection)
+                values = to_group_initialiser(collection, self.config.leaf_arrays)
                 for value in values:
                     value.qualifiers = ["const"]
                     cw.add_variable_declaration(
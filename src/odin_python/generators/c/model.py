@@ -1,11 +1,11 @@
-from typing import List
+from typing import Dict, List
 
 import csnake as cc
 from ...utils.string import escape_string
 from pydantic import BaseModel, Field
 
 from ...data_types.type_registry import DataType
-from .odin_defs import ODIN_ElementTypeEnum, ODIN_ExtensionEnum, ODIN_TypeEnum
+from .odin_defs import ODIN_ElementTypeEnum, ODIN_TypeEnum
 
 ODIN_PARAMETER_TYPE = "ODIN_parameter_t"
 MAX_ID_SIZE = 32
@@ -20,16 +20,19 @@ class ODIN_ParameterModel(BaseModel):
     type: DataType = Field(description="Resolved type of the parameter")
     name: str = Field(description="Name of the parameter")
     description: str = Field(description="Description of the parameter")
-    extensions: str | None = Field(description="Extensions", default=None)
+    extensions: List[str] = Field(description="Initialisers of the extensions, sorted by type", default_factory=list)
+    dirty_bitmap: str | None = Field(description="Dirty bitmap, if dirty tracking is enabled", default=None)
+    dirty_index: int = Field(description="Bit of the parameter in the dirty bitmap", default=0)
+    seqlock: str | None = Field(description="Sequence counter of the group, if seqlocks are enabled", default=None)
 
     @property
     def variable(self) -> cc.Variable:
         if self.extensions:
-            extension = cc.TextModifier(self.extensions)
+            extensions = cc.TextModifier(f"(const ODIN_extension_t[]){{ {', '.join(self.extensions)} }}")
         else:
-            extension = cc.TextModifier("NULL")
+            extensions = cc.TextModifier("NULL")
 
-        return cc.Variable(
+        variable = cc.Variable(
             name=self.name,
             primitive=ODIN_PARAMETER_TYPE,
             value={
@@ -40,11 +43,21 @@ class ODIN_ParameterModel(BaseModel):
                 "element_size": cc.TextModifier(f"sizeof({self.type.c_typename})"),
                 "data": cc.TextModifier(f"&{self.data}") if self.data else cc.TextModifier("NULL"),
                 "name_and_description": rf"{self.name}\0{escape_string(self.description)}",
-                "extension": extension,
+                "extensions": extensions,
+                "extension_count": cc.TextModifier(str(len(self.extensions))),
             },  # type: ignore
             comment=f"index: 0x{self.global_index:08X}",
         )
 
+        if self.dirty_bitmap is not None:
+            variable.value["dirty_index"] = cc.TextModifier(str(self.dirty_index))  # type: ignore
+            variable.value["dirty_bitmap"] = cc.TextModifier(self.dirty_bitmap)  # type: ignore
+
+        if self.seqlock is not None:
+            variable.value["seqlock"] = cc.TextModifier(f"&{self.seqlock}")  # type: ignore
+
+        return variable
+
 
 class ODIN_ParameterGroupModel(BaseModel):
     param_name: str = Field(description="Name of the parameter group")
@@ -54,6 +67,32 @@ class ODIN_ParameterGroupModel(BaseModel):
     id_space_shift: int = Field(description="ID space shift of the parameter group")
     # type: RegularCDataType = Field(description="Type of the parameter group")
     parameters_references: List[str] = Field(description="Parameters in the group")
+    index_table_reference: str | None = Field(default=None, description="Lookup table of the descendants")
+    name_table_reference: str | None = Field(default=None, description="Name lookup table of the descendants")
+    leaves_references: List[str] | None = Field(
+        default=None, description="All the parameters below the group in pre-order, without the groups"
+    )
+    dirty_first: int | None = Field(
+        default=None,
+        description="Dirty bit of the first leaf if the leaves are a contiguous range of bits, -1 if not, "
+        "None without dirty tracking",
+    )
+
+    @property
+    def leaves_name(self) -> str:
+        return f"{self.param_name}_leaves"
+
+    @property
+    def leaves_variable(self) -> cc.Variable | None:
+        if not self.leaves_references:
+            return None
+
+        return cc.Variable(
+            name=self.leaves_name,
+            primitive="ODIN_parameter_t *const",
+            array=len(self.leaves_references),
+            value=[cc.TextModifier(f"&{reference}") for reference in self.leaves_references],  # type: ignore
+        )
 
     @property
     def variable(self) -> cc.Variable:
@@ -61,22 +100,147 @@ class ODIN_ParameterGroupModel(BaseModel):
         for parameter in self.parameters_references:
             parameters.append(cc.TextModifier(f"&{parameter}"))
 
+        value = {
+            "name_and_description": rf"{self.name}\0{escape_string(self.description)}",
+            "odin_type": cc.TextModifier(str(ODIN_TypeEnum.ODIN_TYPE_GROUP.value)),
+            "global_index": cc.TextModifier(f"0x{self.global_id:08X}"),
+            "shift": cc.TextModifier(str(self.id_space_shift)),
+            "count": cc.TextModifier(str(len(parameters))),
+        }
+
+        if self.index_table_reference is not None:
+            value["index_table"] = cc.TextModifier(f"&{self.index_table_reference}")
+
+        if self.name_table_reference is not None:
+            value["name_table"] = cc.TextModifier(f"&{self.name_table_reference}")
+
+        if self.leaves_references:
+            value["leaf_count"] = cc.TextModifier(str(len(self.leaves_references)))
+            value["leaves"] = cc.TextModifier(self.leaves_name)
+
+        if self.dirty_first is not None:
+            value["dirty_first"] = cc.TextModifier(str(self.dirty_first))
+
+        value["parameters"] = parameters
+
         variable = cc.Variable(
             name=self.param_name,
             primitive="ODIN_parameter_group_t",
-            value={  # type: ignore
-                "name_and_description": rf"{self.name}\0{escape_string(self.description)}",
-                "odin_type": cc.TextModifier(str(ODIN_TypeEnum.ODIN_TYPE_GROUP.value)),
-                "global_index": cc.TextModifier(f"0x{self.global_id:08X}"),
-                "shift": cc.TextModifier(str(self.id_space_shift)),
-                "count": cc.TextModifier(str(len(parameters))),
-                "parameters": parameters,
-            },
+            value=value,  # type: ignore
             comment=f"index: 0x{self.global_id:08X}",
         )
         return variable
 
 
+class ODIN_IndexTableModel(BaseModel):
+    name: str = Field(description="Name of the lookup table")
+    entries: List[tuple[int, str]] = Field(description="Global index and reference of every entry, sorted by index")
+
+    @property
+    def entries_variable(self) -> cc.Variable:
+        return cc.Variable(
+            name=f"{self.name}_entries",
+            primitive="ODIN_index_entry_t",
+            array=len(self.entries),
+            value=[
+                {
+                    "global_index": cc.TextModifier(f"0x{global_index:08X}"),
+                    "parameter": cc.TextModifier(f"&{reference}"),
+                }
+                for global_index, reference in self.entries
+            ],  # type: ignore
+        )
+
+    @property
+    def variable(self) -> cc.Variable:
+        return cc.Variable(
+            name=self.name,
+            primitive="ODIN_index_table_t",
+            value={  # type: ignore
+                "count": cc.TextModifier(str(len(self.entries))),
+                "entries": cc.TextModifier(f"{self.name}_entries"),
+            },
+        )
+
+
+class ODIN_NameTableModel(BaseModel):
+    name: str = Field(description="Name of the name table")
+    seed: int = Field(description="Offset basis of the second hash")
+    displacements: List[int] = Field(description="Displacement of every bucket")
+    entries: List[tuple[str, str]] = Field(description="Dotted name and reference of every slot")
+
+    @property
+    def displacements_variable(self) -> cc.Variable:
+        return cc.Variable(
+            name=f"{self.name}_displacements",
+            primitive="uint32_t",
+            array=len(self.displacements),
+            value=[cc.TextModifier(str(displacement)) for displacement in self.displacements],  # type: ignore
+        )
+
+    @property
+    def entries_variable(self) -> cc.Variable:
+        return cc.Variable(
+            name=f"{self.name}_entries",
+            primitive="ODIN_name_entry_t",
+            array=len(self.entries),
+            value=[
+                {
+                    "name": name,
+                    "parameter": cc.TextModifier(f"&{reference}"),
+                }
+                for name, reference in self.entries
+            ],  # type: ignore
+        )
+
+    @property
+    def variable(self) -> cc.Variable:
+        return cc.Variable(
+            name=self.name,
+            primitive="ODIN_name_table_t",
+            value={  # type: ignore
+                "count": cc.TextModifier(str(len(self.entries))),
+                "bucket_count": cc.TextModifier(str(len(self.displacements))),
+                "seed": cc.TextModifier(f"0x{self.seed:08X}"),
+                "displacements": cc.TextModifier(f"{self.name}_displacements"),
+                "entries": cc.TextModifier(f"{self.name}_entries"),
+            },
+        )
+
+
+class ODIN_DirtyBitmapModel(BaseModel):
+    name: str = Field(description="Name of the dirty bitmap")
+    indices: Dict[int, int] = Field(description="Bit of every parameter, by id() of the parameter")
+
+    @property
+    def words(self) -> int:
+        return max(1, (len(self.indices) + 31) // 32)
+
+    def index_of(self, parameter: object) -> int:
+        return self.indices[id(parameter)]
+
+    @property
+    def variable(self) -> cc.Variable:
+        return cc.Variable(name=self.name, primitive="uint32_t", array=self.words)
+
+
+class ODIN_SeqlocksModel(BaseModel):
+    name: str = Field(description="Name of the sequence counter array")
+    indices: Dict[int, int] = Field(description="Counter of every group with parameters, by id() of the group")
+
+    @property
+    def count(self) -> int:
+        return max(1, len(self.indices))
+
+    def reference_of(self, parameter: object) -> str:
+        """Counter of the group the parameter is in"""
+        return f"{self.name}[{self.indices[id(parameter._parent)]}]"  # type: ignore
+
+    @property
+    def variable(self) -> cc.Variable:
+        return cc.Variable(name=self.name, primitive="ODIN_seqlock_t", array=self.count)
+
+
 class ODIN_ArrayModel(ODIN_ParameterModel):
     num_elements: int = Field(description="Number of elements in the array")
     fixed_size: bool = Field(description="Fixed size of the array", default=True)
@@ -111,22 +275,3 @@ class ODIN_ArrayModel(ODIN_ParameterModel):
 
 #         return TextModifier(value)
 # next
-
-
-class ODIN_ExtesionModel(BaseModel):
-    type: ODIN_ExtensionEnum = Field(description="Access group")
-    ops: str = Field(description="Opsset used for the extension")
-    parameters: str | None = Field(description="parameters associated with the extension")
-    next: str | None = Field(description="Next extension in the list")
-
-    @property
-    def variable(self):
-        next = "NULL"
-        if self.next:
-            next = f"{self.next}"
-
-        param = "NULL"
-        if self.parameters:
-            param = f"&{self.parameters}"
-
-        return f"(ODIN_extension_t[]){{ {{\n\t\t\t.type={self.type.name},\n\t\t\t.ops =  &{self.ops},\n\t\t\t.data = {param},\n\t\t\t.next = {next} }} }}"
@@ -1,4 +1,8 @@
+from .dirty import to_dirty_bitmap
 from .group import to_group_initialiser
+from .index import index_table_name, name_table_name, to_index_table, to_name_table
+from .seqlock import to_seqlocks
+from .size import to_size_header
 from .object import to_object_initialiser, to_object_type
 from .variable import to_variable_initialiser, to_variable_type
 
@@ -8,4 +12,11 @@ __all__ = [
     "to_variable_initialiser",
     "to_variable_type",
     "to_group_initialiser",
+    "to_index_table",
+    "to_name_table",
+    "index_table_name",
+    "name_table_name",
+    "to_size_header",
+    "to_dirty_bitmap",
+    "to_seqlocks",
 ]
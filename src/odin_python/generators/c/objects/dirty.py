@@ -0,0 +1,32 @@
+from ....generators.c.model import ODIN_DirtyBitmapModel
+from ....parameter import BaseBaseParameterModel, BaseParameterGroupModel, RootParameterModel
+
+
+def to_dirty_bitmap(root: RootParameterModel) -> ODIN_DirtyBitmapModel | None:
+    """Returns the dirty bitmap, None if dirty tracking is disabled in the config
+
+    The bits follow the leaves of the root group, so the parameters of a group are a contiguous range of bits.
+    """
+
+    assert root._c_types is not None, "Types are not initialised"
+    if root._c_types.dirty_bitmap_name is None:
+        return None
+
+    leaves = [parameter for parameter in root.to_flat_list() if isinstance(parameter, BaseBaseParameterModel)]
+    return ODIN_DirtyBitmapModel(
+        name=root._c_types.dirty_bitmap_name,
+        indices={id(parameter): index for index, parameter in enumerate(leaves)},
+    )
+
+
+def dirty_first(group: BaseParameterGroupModel, dirty_bitmap: ODIN_DirtyBitmapModel) -> int:
+    """Bit of the first leaf of the group if its leaves are a contiguous range of bits, in order, otherwise -1"""
+
+    bits = [
+        dirty_bitmap.index_of(parameter)
+        for parameter in group.to_flat_list()
+        if isinstance(parameter, BaseBaseParameterModel)
+    ]
+    if len(bits) == 0 or bits != list(range(bits[0], bits[0] + len(bits))):
+        return -1
+    return bits[0]
@@ -2,14 +2,35 @@ import csnake as cc
 
 from odin_python.parameter.parameter import CollectionModel
 
-from ....generators.c.model import ODIN_ParameterGroupModel
+from ....generators.c.model import ODIN_DirtyBitmapModel, ODIN_ParameterGroupModel
 from ....parameter import (
     BaseParameterGroupModel,
     ParameterGroupModel,
+    RootParameterModel,
 )
+from .dirty import dirty_first
+from .index import index_table_name, name_table_name
 
 
-def to_group_initialiser(self: BaseParameterGroupModel) -> list[cc.Variable]:
+def to_leaves_references(self: BaseParameterGroupModel) -> list[str]:
+    """References to all the parameters below the group in pre-order, the order the codecs export them in"""
+
+    return [
+        parameter.absolute_object_reference
+        for parameter in self.to_flat_list()
+        if not isinstance(parameter, BaseParameterGroupModel)
+    ]
+
+
+def to_group_model_variables(group: ODIN_ParameterGroupModel) -> list[cc.Variable]:
+    # The leaves array is referenced by the group, so it is defined first
+    leaves = group.leaves_variable
+    return [group.variable] if leaves is None else [leaves, group.variable]
+
+
+def to_group_initialiser(
+    self: BaseParameterGroupModel, leaf_arrays: bool = True, dirty_bitmap: ODIN_DirtyBitmapModel | None = None
+) -> list[cc.Variable]:
     variables = []
 
     # Create the data structures for this group
@@ -20,33 +41,49 @@ def to_group_initialiser(self: BaseParameterGroupModel) -> list[cc.Variable]:
         else:
             parameters_references.append(parameter.absolute_object_reference)
 
+    leaves_references = to_leaves_references(self) if leaf_arrays else None
+    first_dirty_bit = dirty_first(self, dirty_bitmap) if dirty_bitmap is not None else None
+
     if isinstance(self, CollectionModel):
-        variables.append(
-            ODIN_ParameterGroupModel(
-                param_name=f"collection_{self._name}",
-                name=self._name,
-                description=self.resolved_description,
-                global_id=0,
-                id_space_shift=0,
-                parameters_references=parameters_references,
-            ).variable
+        variables.extend(
+            to_group_model_variables(
+                ODIN_ParameterGroupModel(
+                    param_name=f"collection_{self._name}",
+                    name=self._name,
+                    description=self.resolved_description,
+                    global_id=0,
+                    id_space_shift=0,
+                    parameters_references=parameters_references,
+                    leaves_references=leaves_references,
+                    dirty_first=first_dirty_bit,
+                )
+            )
         )
 
     else:
-        variables.append(
-            ODIN_ParameterGroupModel(
-                param_name=self.absolute_group_reference,
-                name=self._name,
-                description=self.resolved_description,
-                global_id=self.global_id,
-                id_space_shift=self.id_space_shift,
-                parameters_references=parameters_references,
-            ).variable
+        # Only the root gets the lookup tables, they cover the whole tree
+        is_root = isinstance(self, RootParameterModel)
+
+        variables.extend(
+            to_group_model_variables(
+                ODIN_ParameterGroupModel(
+                    param_name=self.absolute_group_reference,
+                    name=self._name,
+                    description=self.resolved_description,
+                    global_id=self.global_id,
+                    id_space_shift=self.id_space_shift,
+                    parameters_references=parameters_references,
+                    index_table_reference=index_table_name(self) if is_root else None,
+                    name_table_reference=name_table_name(self) if is_root else None,
+                    leaves_references=leaves_references,
+                    dirty_first=first_dirty_bit,
+                )
+            )
         )
 
         # Create the data structures for the children
         for parameter in self.children.values():
             if isinstance(parameter, ParameterGroupModel):
-                variables.extend(to_group_initialiser(parameter))
+                variables.extend(to_group_initialiser(parameter, leaf_arrays, dirty_bitmap))
 
     return variables
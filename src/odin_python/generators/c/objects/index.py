@@ -0,0 +1,60 @@
+from ....generators.c.model import ODIN_IndexTableModel, ODIN_NameTableModel
+from ....parameter import BaseParameterGroupModel, BaseParameterModel, RootParameterModel
+from ....utils.perfect_hash import build_perfect_hash
+
+
+def c_reference(parameter: BaseParameterModel) -> str:
+    if isinstance(parameter, BaseParameterGroupModel):
+        return parameter.absolute_group_reference
+    return parameter.absolute_object_reference
+
+
+def index_table_name(root: RootParameterModel) -> str | None:
+    """Name of the lookup table by id, None if the table is disabled in the config or there is nothing to look up"""
+
+    assert root._c_types is not None, "Types are not initialised"
+    if len(root.children) == 0:
+        return None
+    return root._c_types.index_name
+
+
+def name_table_name(root: RootParameterModel) -> str | None:
+    """Name of the lookup table by name, None if the table is disabled in the config or there is nothing to look up"""
+
+    assert root._c_types is not None, "Types are not initialised"
+    if len(root.children) == 0:
+        return None
+    return root._c_types.name_table_name
+
+
+def to_index_table(root: RootParameterModel) -> ODIN_IndexTableModel | None:
+    """Returns the lookup table of all the parameters and groups, sorted by global index"""
+
+    name = index_table_name(root)
+    if name is None:
+        return None
+
+    entries: dict[int, str] = {}
+    for parameter in root.to_flat_list():
+        # The tree walk returns the first match in pre-order, so keep the first one on an id collision
+        entries.setdefault(parameter.global_id, c_reference(parameter))
+
+    return ODIN_IndexTableModel(name=name, entries=sorted(entries.items()))
+
+
+def to_name_table(root: RootParameterModel) -> ODIN_NameTableModel | None:
+    """Returns the perfect hash table of the dotted names of all the parameters and groups"""
+
+    name = name_table_name(root)
+    if name is None:
+        return None
+
+    names = list(root.path_index.names.items())
+    table = build_perfect_hash([dotted_name.encode("utf-8") for dotted_name, _ in names])
+
+    return ODIN_NameTableModel(
+        name=name,
+        seed=table.seed,
+        displacements=table.displacements,
+        entries=[(names[key][0], c_reference(names[key][1])) for key in table.slots],
+    )
@@ -1,6 +1,6 @@
 import csnake as cc
 
-from ....generators.c.model import ODIN_ArrayModel, ODIN_ParameterModel
+from ....generators.c.model import ODIN_ArrayModel, ODIN_DirtyBitmapModel, ODIN_ParameterModel, ODIN_SeqlocksModel
 from ....parameter import (
     ArrayParameterModel,
     BaseBaseParameterModel,
@@ -13,8 +13,19 @@ from ....parameter import (
 from ....utils.csnake_custom import StructVariable
 
 
-def to_object_initialiser(parameter) -> cc.Variable:
+def to_object_initialiser(
+    parameter,
+    dirty_bitmap: ODIN_DirtyBitmapModel | None = None,
+    seqlocks: ODIN_SeqlocksModel | None = None,
+) -> cc.Variable:
     if isinstance(parameter, BaseBaseParameterModel):
+        # Optional runtime fields of the parameter
+        runtime = {}
+        if dirty_bitmap is not None:
+            runtime.update(dirty_bitmap=dirty_bitmap.name, dirty_index=dirty_bitmap.index_of(parameter))
+        if seqlocks is not None:
+            runtime.update(seqlock=seqlocks.reference_of(parameter))
+
         # If the reference is set, then we don't need to initialise the variable
         if parameter.reference:
             parameter._absolute_variable_reference = parameter.reference
@@ -24,43 +35,41 @@ def to_object_initialiser(parameter) -> cc.Variable:
         if isinstance(parameter, ParameterModel):
             """Returns the odin C initialiser for the parameter"""
 
-            formatted_extension = None
-            if len(parameter.extensions) > 0:
-                next = None
-                for extension in parameter.extensions:
-                    formatted_extension = extension.as_literal(parameter, next)
-                    next = formatted_extension
+            # Sorted by type so the runtime can stop searching early, stable to keep the order of the config
+            extensions = sorted(parameter.extensions, key=lambda extension: extension.extension_type.order)
 
             if parameter.type == "void":
                 data_address = None
 
             return ODIN_ParameterModel(
                 type=parameter._resolved_type,
-                access_group=parameter.access_control.collapse().to_c_definition(),
+                access_group=parameter.access_control_c_definition,
                 local_index=parameter.local_id,
                 global_index=parameter.global_id,
                 data=data_address,
                 name=parameter._name,
                 description=parameter.resolved_description,
-                extensions=formatted_extension,
+                extensions=[extension.as_literal(parameter) for extension in extensions],
+                **runtime,
             ).variable
 
         elif isinstance(parameter, ArrayParameterModel):
             return ODIN_ArrayModel(
                 type=parameter._resolved_type,
-                access_group=parameter.access_control.collapse().to_c_definition(),
+                access_group=parameter.access_control_c_definition,
                 local_index=parameter.local_id,
                 global_index=parameter.global_id,
                 data=data_address,
                 name=parameter._name,
                 description=parameter.resolved_description,
                 num_elements=parameter.elements,
+                **runtime,
             ).variable
 
         elif isinstance(parameter, VectorParameterModel):
             return ODIN_ArrayModel(
                 type=parameter._resolved_type,
-                access_group=parameter.access_control.collapse().to_c_definition(),
+                access_group=parameter.access_control_c_definition,
                 local_index=parameter.local_id,
                 global_index=parameter.global_id,
                 data=data_address,
@@ -68,6 +77,7 @@ def to_object_initialiser(parameter) -> cc.Variable:
                 description=parameter.resolved_description,
                 num_elements=parameter.max_elements,
                 fixed_size=False,
+                **runtime,
             ).variable
         else:
             raise ValueError("Unknown type")
@@ -85,7 +95,7 @@ def to_object_initialiser(parameter) -> cc.Variable:
             name=name,
             primitive=type,
             value={
-                parameter_name: to_object_initialiser(parameter).value
+                parameter_name: to_object_initialiser(parameter, dirty_bitmap, seqlocks).value
                 for parameter_name, parameter in parameter.children.items()  # type: ignore
             },
         )
@@ -0,0 +1,26 @@
+from ....generators.c.model import ODIN_SeqlocksModel
+from ....parameter import BaseBaseParameterModel, BaseParameterGroupModel, RootParameterModel
+
+
+def to_seqlocks(root: RootParameterModel) -> ODIN_SeqlocksModel | None:
+    """Returns the sequence counters, None if seqlocks are disabled in the config
+
+    Every group with parameters directly in it gets a counter, shared by those parameters. The groups are numbered in
+    pre-order, starting with the root.
+    """
+
+    assert root._c_types is not None, "Types are not initialised"
+    if root._c_types.seqlock_name is None:
+        return None
+
+    groups = [root] + [parameter for parameter in root.to_flat_list() if isinstance(parameter, BaseParameterGroupModel)]
+    groups = [
+        group
+        for group in groups
+        if any(isinstance(child, BaseBaseParameterModel) for child in group.children.values())
+    ]
+
+    return ODIN_SeqlocksModel(
+        name=root._c_types.seqlock_name,
+        indices={id(group): index for index, group in enumerate(groups)},
+    )
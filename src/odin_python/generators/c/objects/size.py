@@ -0,0 +1,145 @@
+import json
+
+from ....generators.c.odin_defs import ODIN_ElementTypeEnum
+from ....parameter import (
+    ArrayParameterModel,
+    BaseBaseParameterModel,
+    BaseParameterGroupModel,
+    ParameterGroupModel,
+    ParameterModel,
+    VectorParameterModel,
+)
+from ....parameter.parameter import CollectionModel
+
+# Longest string ODIN_element_to_string prints for an element, the floats are printed with %f
+STRING_ELEMENT_MAX_LENGTH: dict[ODIN_ElementTypeEnum, int] = {
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_BOOL: len("false"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_HEX: len("0xff"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_UINT8: len("255"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_UINT16: len("65535"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_UINT32: len("4294967295"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_UINT64: len("18446744073709551615"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_INT8: len("-128"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_INT16: len("-32768"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_INT32: len("-2147483648"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_INT64: len("-9223372036854775808"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_FLOAT32: len(f"{-3.4028234663852886e38:f}"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_FLOAT64: len(f"{-1.7976931348623157e308:f}"),
+    ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_CHAR: 1,
+}
+
+# Printed by ODIN_encode_parameter_to_string for an empty vector
+STRING_NO_DATA = "No data"
+
+
+def elements_of(parameter: BaseBaseParameterModel) -> int:
+    if isinstance(parameter, ArrayParameterModel):
+        return parameter.elements
+    if isinstance(parameter, VectorParameterModel):
+        return parameter.max_elements
+    return 1
+
+
+def leaves_of(group: BaseParameterGroupModel) -> list[BaseBaseParameterModel]:
+    return [parameter for parameter in group.to_flat_list() if isinstance(parameter, BaseBaseParameterModel)]
+
+
+def tlv_max_size(group: BaseParameterGroupModel) -> str:
+    """C expression of the largest ODIN_encode_parameter_group_to_bytes output, every vector full
+
+    The element sizes are left to the compiler with sizeof, python does not know the layout of the custom structs.
+    """
+
+    leaves = leaves_of(group)
+    if len(leaves) == 0:
+        return "0"
+
+    elements: dict[str, int] = {}
+    for parameter in leaves:
+        c_typename = parameter._resolved_type.c_typename
+        elements[c_typename] = elements.get(c_typename, 0) + elements_of(parameter)
+
+    terms = [f"ODIN_TLV_HEADER_SIZE * {len(leaves)}"]
+    terms.extend(f"sizeof({c_typename}) * {count}" for c_typename, count in elements.items())
+    return f"({' + '.join(terms)})"
+
+
+def string_max_length(parameter: BaseBaseParameterModel) -> int | None:
+    """Longest ODIN_encode_parameter_to_string output without the terminator, None if it has no bound"""
+
+    element_type = ODIN_ElementTypeEnum.from_c_type(parameter._resolved_type.c_typename)
+    if element_type not in STRING_ELEMENT_MAX_LENGTH:
+        # The custom string serialisers can print anything
+        return None
+
+    element_length = STRING_ELEMENT_MAX_LENGTH[element_type]
+    if isinstance(parameter, ParameterModel):
+        return element_length
+
+    elements = elements_of(parameter)
+    if element_type == ODIN_ElementTypeEnum.ODIN_ELEMENT_TYPE_CHAR:
+        # Printed as a quoted string
+        length = elements + 2
+    else:
+        # Printed as [a, b, c]
+        length = 2 + elements * element_length + (elements - 1) * len(", ")
+
+    if isinstance(parameter, VectorParameterModel):
+        length = max(length, len(STRING_NO_DATA))
+
+    return length
+
+
+def string_max_size(group: BaseParameterGroupModel) -> int | None:
+    """Buffer size for the string of any single parameter in the group, including the terminator"""
+
+    lengths = [string_max_length(parameter) for parameter in leaves_of(group)]
+    if len(lengths) == 0 or any(length is None for length in lengths):
+        return None
+
+    return max(length for length in lengths if length is not None) + 1
+
+
+def json_length(group: BaseParameterGroupModel) -> int:
+    """Length of the unformatted JSON printed by cJSON for ODIN_encode_parameter_group_to_JSON"""
+
+    members = []
+    for name, parameter in group.children.items():
+        key = len(json.dumps(name, ensure_ascii=False).encode("utf-8")) + len(":")
+        if isinstance(parameter, BaseParameterGroupModel):
+            members.append(key + json_length(parameter))
+        else:
+            # The global index is printed as an integer
+            members.append(key + len(str(parameter.global_id)))
+
+    return len("{}") + sum(members) + max(len(members) - 1, 0)
+
+
+def to_size_defines(group: BaseParameterGroupModel, reference: str) -> list[str]:
+    """Defines with the worst case encoded size of the group, to allocate the export buffers statically"""
+
+    prefix = reference.upper()
+    defines = [
+        f"#define {prefix}_TLV_MAX_SIZE {tlv_max_size(group)}",
+        f"#define {prefix}_JSON_MAX_SIZE {json_length(group) + 1}",
+    ]
+
+    string_size = string_max_size(group)
+    if string_size is not None:
+        defines.append(f"#define {prefix}_STRING_MAX_SIZE {string_size}")
+
+    return defines
+
+
+def to_size_header(group: BaseParameterGroupModel) -> list[str]:
+    """Size defines of the group and all the groups below it, or of a collection"""
+
+    if isinstance(group, CollectionModel):
+        return to_size_defines(group, f"collection_{group._name}")
+
+    defines = to_size_defines(group, group.absolute_group_reference)
+    for parameter in group.to_flat_list():
+        if isinstance(parameter, ParameterGroupModel):
+            defines.extend(to_size_defines(parameter, parameter.absolute_group_reference))
+
+    return defines
@@ -6,6 +6,18 @@ class ODIN_ExtensionEnum(Enum):
     ODIN_EXTENSION_TYPE_VALIDATE = "ODIN_EXTENSION_TYPE_VALIDATE"
     ODIN_EXTENSION_TYPE_STRING_CODEC = "ODIN_EXTENSION_TYPE_STRING_CODEC"
 
+    @property
+    def order(self) -> int:
+        """Position in ODIN_extension_type_t, the extensions of a parameter are sorted by it"""
+        return EXTENSION_ORDER.index(self)
+
+
+EXTENSION_ORDER = [
+    ODIN_ExtensionEnum.ODIN_EXTENSION_TYPE_VALIDATE,
+    ODIN_ExtensionEnum.ODIN_EXTENSION_TYPE_IO,
+    ODIN_ExtensionEnum.ODIN_EXTENSION_TYPE_STRING_CODEC,
+]
+
 
 class ODIN_TypeEnum(Enum):
     ODIN_TYPE_PARAMETER = "ODIN_TYPE_PARAMETER"
@@ -0,0 +1,179 @@
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import sys
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from ..utils.files import file_digest, list_files
+
+CACHE_FORMAT_VERSION = 1
+
+
+def odin_python_version() -> str:
+    """Version of the installed odin_python package, generated code may change between versions"""
+
+    try:
+        return importlib.metadata.version("odin-python")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class CachedTargetModel(BaseModel):
+    input_hash: str = Field(description="Hash of the input file and the odin_python version")
+    config_hash: str = Field(description="Hash of the generator configuration")
+    outputs: dict[str, str] = Field(description="Hash of every generated file, relative to the output directory")
+
+
+class CacheFileModel(BaseModel):
+    version: int = CACHE_FORMAT_VERSION
+    targets: dict[str, CachedTargetModel] = Field(default_factory=dict)
+
+
+class GenerationCache:
+    """On-disk cache of the generated targets, stored next to the generated files
+
+    A target is up to date when the hash of the input (and the odin_python version) matches and all
+    the generated files still exist with their original content.
+    """
+
+    def __init__(self, output_dir: str, name: str, input_hash: str):
+        self.output_dir = output_dir
+        self.input_hash = input_hash
+        self.path = os.path.join(output_dir, f".{name}.odin-cache.json")
+        self.data = self.load()
+
+    @classmethod
+    def from_input_file(cls, input_file: str, output_dir: str, name: str) -> "GenerationCache":
+        digest = hashlib.sha256()
+        digest.update(odin_python_version().encode("utf-8"))
+        digest.update(file_digest(input_file).encode("utf-8"))
+
+        return cls(output_dir, name, digest.hexdigest())
+
+    @staticmethod
+    def hash_config(config: BaseModel) -> str:
+        return hashlib.sha256(config.model_dump_json().encode("utf-8")).hexdigest()
+
+    def load(self) -> CacheFileModel:
+        try:
+            with open(self.path, "r") as f:
+                data = CacheFileModel.model_validate_json(f.read())
+        except (OSError, ValueError):
+            return CacheFileModel()
+
+        # Ignore caches written by a different format
+        if data.version != CACHE_FORMAT_VERSION:
+            return CacheFileModel()
+
+        return data
+
+    def save(self) -> None:
+        with open(self.path, "w") as f:
+            f.write(self.data.model_dump_json(indent=2))
+
+    def is_up_to_date(self, target: str, config: BaseModel | None = None) -> bool:
+        """Checks if the outputs of the target can be reused
+
+        The config can be omitted when it is read from the input file, as it is then covered by the input hash.
+        """
+
+        entry = self.data.targets.get(target)
+        if entry is None or entry.input_hash != self.input_hash:
+            return False
+
+        if config is not None and entry.config_hash != self.hash_config(config):
+            return False
+
+        for relative_path, digest in entry.outputs.items():
+            path = os.path.join(self.output_dir, relative_path)
+            if not os.path.isfile(path) or file_digest(path) != digest:
+                return False
+
+        return True
+
+    def store(self, target: str, config: BaseModel, outputs: list[str]) -> None:
+        """Records the generated outputs (files or directories) of the target and saves the cache"""
+
+        hashes = {}
+        for output in outputs:
+            for path in list_files(output):
+                hashes[os.path.relpath(path, self.output_dir)] = file_digest(path)
+
+        self.data.targets[target] = CachedTargetModel(
+            input_hash=self.input_hash,
+            config_hash=self.hash_config(config),
+            outputs=hashes,
+        )
+        self.save()
+
+    def invalidate(self, target: str) -> None:
+        if self.data.targets.pop(target, None) is not None:
+            self.save()
+
+
+def user_cache_dir() -> str:
+    """Per user directory for the model caches
+
+    The pickled models are never stored next to the generated files, these are often committed to a repository and
+    unpickling a cache from someone else can execute arbitrary code.
+    """
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+    return os.path.join(base, "odin_python")
+
+
+class ModelContextCache:
+    """Cache of the loaded and resolved model, stored as a pickle in a cache directory, by default user_cache_dir
+
+    Loading from the cache skips parsing and validating the yaml file, the type registration and the resolving
+    of the parameters. The cache is keyed by the content of the input file, the odin_python and python version.
+    Only load caches written by yourself, as unpickling can execute arbitrary code.
+    """
+
+    def __init__(self, cache_dir: str, input_file: str):
+        self.input_file = input_file
+        self.cache_dir = cache_dir
+
+        # Input files with the same name in different directories get their own cache
+        location = hashlib.sha256(os.path.abspath(input_file).encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(cache_dir, f"{os.path.basename(input_file)}-{location}.odin-model.pickle")
+
+    @property
+    def key(self) -> str:
+        digest = hashlib.sha256()
+        digest.update(odin_python_version().encode("utf-8"))
+        digest.update(sys.version.encode("utf-8"))
+        digest.update(file_digest(self.input_file).encode("utf-8"))
+        return digest.hexdigest()
+
+    def load(self) -> Any | None:
+        """Returns the cached model, or None if there is no valid cache for the input file"""
+
+        try:
+            with open(self.path, "rb") as f:
+                key, data = pickle.load(f)
+        except Exception:
+            # Missing, corrupted or created by incompatible classes, just load the yaml again
+            return None
+
+        if key != self.key:
+            return None
+
+        return data
+
+    def store(self, data: Any) -> None:
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            with open(self.path, "wb") as f:
+                pickle.dump((self.key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError, RecursionError) as error:
+            print(f"Could not cache the model: {error}")
+
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class ODIN_DB_generatorConfig(BaseModel):
+    desctription: str = "Generic description"
+    name: str = "ODIN"
+
+    indent: int | None = 4
@@ -1,22 +1,19 @@
 import hashlib
+import os
 import time
 from io import StringIO
 
 from odin_db import OdinDBModel, OdinDBTypeDefinitionModel
-from pydantic import BaseModel
 
 from odin_python.data_types.type_registry import CustomDataType
 
 from ..abstract_generator import AbstractGenerator, ModelContext
+from .config import ODIN_DB_generatorConfig
 from .convertors import parameter_group_to_db, type_to_odin_db
 
 
 class ODIN_DB_generator(AbstractGenerator):
-    class Config(BaseModel):
-        desctription: str = "Generic description"
-        name: str = "ODIN"
-
-        indent: int | None = 4
+    Config = ODIN_DB_generatorConfig
 
     config: Config
 
@@ -51,4 +48,15 @@ class ODIN_DB_generator(AbstractGenerator):
             types=db_types,
         )
 
+        # Keep the timestamp of the existing database if nothing else changed, so the file is left untouched
+        if isinstance(output_path, str) and os.path.isfile(output_path):
+            try:
+                with open(output_path, "r") as f:
+                    existing_model = OdinDBModel.model_validate_json(f.read())
+
+                if existing_model.model_copy(update={"creation_timestamp": db_model.creation_timestamp}) == db_model:
+                    db_model.creation_timestamp = existing_model.creation_timestamp
+            except ValueError:
+                pass
+
         self.save_to_file(output_path, db_model.model_dump_json(indent=self.config.indent))
@@ -1,12 +1,17 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from enum import Enum
 from pydantic import ConfigDict, Field
 from .abstract_generator import ModelContext
-from .c.generator import CGenerator
-from .db.generator import ODIN_DB_generator
-from .py.generator import PYGenerator
-from .pdf.generator import DocGenerator
+from .c.config import CGeneratorConfig
+from .db.config import ODIN_DB_generatorConfig
+from .py.config import PYGeneratorConfig
+from .pdf.config import DocGeneratorConfig
 from .abstract_generator import BaseModel
+from .cache import GenerationCache
+from ..utils.profiler import PhaseStats, Profiler, active_profiler, profile_phase
 import os
+import traceback
 
 
 class GeneratorConfigurations(BaseModel):
@@ -14,20 +19,20 @@ class GeneratorConfigurations(BaseModel):
         extra="forbid",
     )
 
-    c_generator: CGenerator.Config = Field(
-        default_factory=CGenerator.Config,
+    c_generator: CGeneratorConfig = Field(
+        default_factory=CGeneratorConfig,
         description="C generator configuration",
     )
-    python_generator: PYGenerator.Config = Field(
-        default_factory=PYGenerator.Config,
+    python_generator: PYGeneratorConfig = Field(
+        default_factory=PYGeneratorConfig,
         description="Python generator configuration",
     )
-    doc_generator: DocGenerator.Config = Field(
-        default_factory=DocGenerator.Config,
+    doc_generator: DocGeneratorConfig = Field(
+        default_factory=DocGeneratorConfig,
         description="Doc generator configuration",
     )
-    db_generator: ODIN_DB_generator.Config = Field(
-        default_factory=ODIN_DB_generator.Config,
+    db_generator: ODIN_DB_generatorConfig = Field(
+        default_factory=ODIN_DB_generatorConfig,
         description="DB generator configuration",
     )
 
@@ -53,47 +58,205 @@ class GeneratorTarget(Enum):
         raise ValueError(f"Unknown generator target: {name}")
 
 
+def target_outputs(name: str, output_dir: str, target: GeneratorTarget) -> list[str]:
+    """Returns the files (or directories) created by the target"""
+
+    if target == GeneratorTarget.C:
+        return [os.path.join(output_dir, f"{name}.c"), os.path.join(output_dir, f"{name}.h")]
+    elif target == GeneratorTarget.PY:
+        return [os.path.join(output_dir, f"{name}")]
+    elif target == GeneratorTarget.DB:
+        return [os.path.join(output_dir, f"{name}.odin")]
+    elif target == GeneratorTarget.DOC:
+        return [os.path.join(output_dir, f"{name}.pdf")]
+    else:
+        raise ValueError(f"Unknown generator target: {target}")
+
+
 def generator(
     name: str,
     model_context: ModelContext,
     output_dir: str,
     target: GeneratorTarget,
     generator_config: GeneratorConfigurations,
+    cache: GenerationCache | None = None,
+    profiler: Profiler | None = None,
 ):
-    # Generate C code
-    if target == GeneratorTarget.C:
-        c_generator = CGenerator(generator_config.c_generator)
-        c_generator.generate(
-            model_context=model_context,
-            output_path=os.path.join(output_dir, f"{name}.c"),
-            type="source",
-        )
-
-        c_generator.generate(
-            model_context=model_context,
-            output_path=os.path.join(output_dir, f"{name}.h"),
-            type="header",
-        )
+    """Generates a single target, if a profiler is given the phases of the generation are recorded in it"""
 
-    elif target == GeneratorTarget.PY:
-        py_generator = PYGenerator(generator_config.python_generator)
-        py_generator.generate(
-            model_context=model_context,
-            output_path=os.path.join(output_dir, f"{name}"),
-        )
+    with profiler.activate() if profiler is not None else nullcontext():
+        # Skip the target if the outputs are already up to date
+        if cache is not None and cache.is_up_to_date(target.name, generator_config):
+            print(f"Target '{target.name}' is up to date, reusing cached outputs")
+            return
 
-    elif target == GeneratorTarget.DB:
-        db_generator = ODIN_DB_generator(generator_config.db_generator)
-        db_generator.generate(
-            model_context=model_context,
-            output_path=os.path.join(output_dir, f"{name}.odin"),
-        )
+        generate_target(name, model_context, output_dir, target, generator_config)
 
-    elif target == GeneratorTarget.DOC:
-        doc_generator = DocGenerator(generator_config.doc_generator)
-        doc_generator.generate(
-            model_context=model_context,
-            output_path=os.path.join(output_dir, f"{name}.pdf"),
-        )
+        if cache is not None:
+            cache.store(target.name, generator_config, target_outputs(name, output_dir, target))
+
+
+def generate_targets(
+    name: str,
+    model_context: ModelContext,
+    output_dir: str,
+    targets: list[GeneratorTarget],
+    generator_config: GeneratorConfigurations,
+    cache: GenerationCache | None = None,
+    jobs: int = 1,
+    profiler: Profiler | None = None,
+) -> dict[GeneratorTarget, BaseException]:
+    """Generates multiple targets, in parallel on a process pool if jobs > 1
+
+    The targets do not share any state once the model is resolved, so each one can run in its own process.
+    A failing target does not stop the others, the errors are returned per target.
+    If a profiler is given (or active), the phases of every target are recorded in it, also from the worker processes.
+    """
+
+    with profiler.activate() if profiler is not None else nullcontext():
+        return _generate_targets(name, model_context, output_dir, targets, generator_config, cache, jobs)
+
+
+def _generate_targets(
+    name: str,
+    model_context: ModelContext,
+    output_dir: str,
+    targets: list[GeneratorTarget],
+    generator_config: GeneratorConfigurations,
+    cache: GenerationCache | None,
+    jobs: int,
+) -> dict[GeneratorTarget, BaseException]:
+    pending: list[GeneratorTarget] = []
+    for target in targets:
+        if cache is not None and cache.is_up_to_date(target.name, generator_config):
+            print(f"Target '{target.name}' is up to date, reusing cached outputs")
+        else:
+            pending.append(target)
+
+    results: dict[GeneratorTarget, BaseException | None] = {}
+
+    if jobs > 1 and len(pending) > 1:
+        profiler = active_profiler()
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+            futures = {}
+            for target in pending:
+                if profiler is not None:
+                    futures[target] = executor.submit(
+                        profile_target,
+                        name,
+                        model_context,
+                        output_dir,
+                        target,
+                        generator_config,
+                        profiler.trace_memory,
+                        profiler.cprofile_dir,
+                    )
+                else:
+                    futures[target] = executor.submit(
+                        generate_target, name, model_context, output_dir, target, generator_config
+                    )
+
+            for target, future in futures.items():
+                results[target] = future.exception()
+
+                if profiler is not None and results[target] is None:
+                    profiler.merge(future.result())
     else:
-        raise ValueError(f"Unknown generator target: {target}")
+        for target in pending:
+            try:
+                generate_target(name, model_context, output_dir, target, generator_config)
+                results[target] = None
+            except Exception as error:
+                results[target] = error
+
+    # Report in the order of the targets, so the output does not depend on which process finished first
+    errors: dict[GeneratorTarget, BaseException] = {}
+    for target in pending:
+        error = results[target]
+
+        if error is None:
+            print(f"Target '{target.name}' generated")
+            if cache is not None:
+                cache.store(target.name, generator_config, target_outputs(name, output_dir, target))
+        else:
+            print(f"Target '{target.name}' failed:\n{''.join(traceback.format_exception(error)).rstrip()}")
+            errors[target] = error
+            if cache is not None:
+                cache.invalidate(target.name)
+
+    return errors
+
+
+def profile_target(
+    name: str,
+    model_context: ModelContext,
+    output_dir: str,
+    target: GeneratorTarget,
+    generator_config: GeneratorConfigurations,
+    trace_memory: bool,
+    cprofile_dir: str | None,
+) -> dict[str, PhaseStats]:
+    """Generates a target with its own profiler, used in the worker processes as the profiler can not be shared"""
+
+    profiler = Profiler(trace_memory=trace_memory, cprofile_dir=cprofile_dir)
+    with profiler.activate():
+        generate_target(name, model_context, output_dir, target, generator_config)
+
+    return profiler.phases
+
+
+def generate_target(
+    name: str,
+    model_context: ModelContext,
+    output_dir: str,
+    target: GeneratorTarget,
+    generator_config: GeneratorConfigurations,
+):
+    with profile_phase(f"generate.{target.name}"):
+        # The generators are imported when used, so their (heavy) dependencies are only loaded when needed
+        # Generate C code
+        if target == GeneratorTarget.C:
+            from .c.generator import CGenerator
+
+            c_generator = CGenerator(generator_config.c_generator)
+            c_generator.generate(
+                model_context=model_context,
+                output_path=os.path.join(output_dir, f"{name}.c"),
+                type="source",
+            )
+
+            c_generator.generate(
+                model_context=model_context,
+                output_path=os.path.join(output_dir, f"{name}.h"),
+                type="header",
+            )
+
+        elif target == GeneratorTarget.PY:
+            from .py.generator import PYGenerator
+
+            py_generator = PYGenerator(generator_config.python_generator)
+            py_generator.generate(
+                model_context=model_context,
+                output_path=os.path.join(output_dir, f"{name}"),
+            )
+
+        elif target == GeneratorTarget.DB:
+            from .db.generator import ODIN_DB_generator
+
+            db_generator = ODIN_DB_generator(generator_config.db_generator)
+            db_generator.generate(
+                model_context=model_context,
+                output_path=os.path.join(output_dir, f"{name}.odin"),
+            )
+
+        elif target == GeneratorTarget.DOC:
+            from .pdf.generator import DocGenerator
+
+            doc_generator = DocGenerator(generator_config.doc_generator)
+            doc_generator.generate(
+                model_context=model_context,
+                output_path=os.path.join(output_dir, f"{name}.pdf"),
+            )
+        else:
+            raise ValueError(f"Unknown generator target: {target}")
@@ -1,3 +1,4 @@
+from io import BytesIO
 from typing import IO
 from pydantic import BaseModel
 from reportlab.lib import colors
@@ -7,6 +8,7 @@ from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer,
 
 from ...parameter import BaseParameterGroupModel, ParameterModel, ParameterGroupModel
 from ..abstract_generator import AbstractGenerator, ModelContext
+from .config import DocGeneratorConfig
 
 TABLESTYLE = TableStyle(
     [
@@ -81,8 +83,7 @@ def generate_group_description(group: BaseParameterGroupModel, doc: SimpleDocTem
 
 
 class DocGenerator(AbstractGenerator):
-    class Config(BaseModel):
-        pass
+    Config = DocGeneratorConfig
 
     config: BaseModel
 
@@ -91,8 +92,17 @@ class DocGenerator(AbstractGenerator):
         self.config = config
 
     def generate(self, model_context: ModelContext, output_path: str | IO) -> None:
-        # Create PDF document
-        doc = SimpleDocTemplate(output_path, pagesize=LETTER, rightMargin=40, leftMargin=40, topMargin=40, bottomMargin=40)
+        # Create PDF document, invariant to leave out the creation date, so identical input gives an identical file
+        buffer = BytesIO()
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=LETTER,
+            rightMargin=40,
+            leftMargin=40,
+            topMargin=40,
+            bottomMargin=40,
+            invariant=True,
+        )
 
         # Stylesheet for consistent styling
         styles = getSampleStyleSheet()
@@ -114,3 +124,4 @@ class DocGenerator(AbstractGenerator):
 
         # Generate PDF
         doc.build(content)
+        self.save_to_file(output_path, buffer.getvalue())
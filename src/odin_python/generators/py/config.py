@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+
+class PYGeneratorConfig(BaseModel):
+    numpy: bool = Field(
+        default=False,
+        description="Return the arrays and vectors as numpy arrays viewing the received data, instead of lists with an "
+        "object per element. The generated interface needs numpy installed",
+    )
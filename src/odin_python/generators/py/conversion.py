@@ -1,13 +1,14 @@
 from odin_python.parameter.parameter import ArrayParameterModel, VectorParameterModel
 from ...parameter import BaseParameterGroupModel, ParameterModel, ParameterGroupModel
 
-from ...data_types.type_registry import CustomDataType, BuiltinDataType, DataType
+from ...data_types.type_registry import CustomDataType, BuiltinDataType, DataType, DataTypeModelDefinition
 
 
-def generate_class(name: str, model: BaseParameterGroupModel, tab_indent: int, parent_model: str) -> str:
+def generate_class(name: str, model: BaseParameterGroupModel, tab_indent: int, parent_model: str, numpy: bool = False) -> str:
     data = ""
     indent = "    " * tab_indent
     data += f"{indent}class {name}(BaseRootModel):\n"
+    data += f"{indent}    _id = 0x{model.global_id:08X}\n\n"
 
     data += f"{indent}    class Model(ConfiguredBaseModel):\n"
 
@@ -19,6 +20,8 @@ def generate_class(name: str, model: BaseParameterGroupModel, tab_indent: int, p
             # Special case for bytes
             if child._resolved_type.c_typename == "uint8_t":
                 data += f"{indent}        {child_name}: bytes\n"
+            elif numpy:
+                data += f"{indent}        {child_name}: NDArray\n"
             else:
                 data += f"{indent}        {child_name}: list[{child._resolved_type.python_primitive_typename}]\n"
 
@@ -28,6 +31,8 @@ def generate_class(name: str, model: BaseParameterGroupModel, tab_indent: int, p
                 data += f"{indent}        {child_name}: str\n"
             elif child._resolved_type.c_typename == "uint8_t":
                 data += f"{indent}        {child_name}: bytes\n"
+            elif numpy:
+                data += f"{indent}        {child_name}: NDArray\n"
             else:
                 data += f"{indent}        {child_name}: list[{child._resolved_type.python_primitive_typename}]\n"
 
@@ -51,26 +56,33 @@ def generate_class(name: str, model: BaseParameterGroupModel, tab_indent: int, p
 
             # Generate the class
             data += "\n"
-            data += generate_class(class_child_name, child, tab_indent + 1, f"{parent_model}.{class_child_name}")
+            data += generate_class(class_child_name, child, tab_indent + 1, f"{parent_model}.{class_child_name}", numpy)
             children[child_name] = f"self.{child_name}"
 
+    # The numpy entries view the received data as an array instead of decoding every element
+    array_entry = "ODINNumpyArrayEntry" if numpy else "ODINArrayEntry"
+    vector_entry = "ODINNumpyVectorEntry" if numpy else "ODINVectorEntry"
+
     data += f"{indent}    def __init__(self, interface: TemplateInterface):\n"
 
     for child_name, child in model.children.items():
+        # Only set for the read only parameters, these can be cached until written
+        writable = "" if child.writable else ",writable=False"
+
         if isinstance(child, ParameterModel):
-            data += f"{indent}        self.{child_name} = ODINEntry[{child._resolved_type.py_typename}](0x{child.global_id:08X}, cls={child._resolved_type.py_typename},interface=interface)\n"
+            data += f"{indent}        self.{child_name} = ODINEntry[{child._resolved_type.py_typename}](0x{child.global_id:08X}, cls={child._resolved_type.py_typename},interface=interface{writable})\n"
         elif isinstance(child, ArrayParameterModel):
             if child._resolved_type.c_typename == "uint8_t":
-                data += f"{indent}        self.{child_name} = ODINBytesEntry(0x{child.global_id:08X}, interface=interface,max_length={child.elements}, fixed_length=True)\n"
+                data += f"{indent}        self.{child_name} = ODINBytesEntry(0x{child.global_id:08X}, interface=interface,max_length={child.elements}, fixed_length=True{writable})\n"
             else:
-                data += f"{indent}        self.{child_name} = ODINArrayEntry[{child._resolved_type.py_typename}](0x{child.global_id:08X}, cls={child._resolved_type.py_typename},elements={child.elements},element_size={child._resolved_type.size},interface=interface)\n"
+                data += f"{indent}        self.{child_name} = {array_entry}[{child._resolved_type.py_typename}](0x{child.global_id:08X}, cls={child._resolved_type.py_typename},elements={child.elements},element_size={child._resolved_type.size},interface=interface{writable})\n"
         elif isinstance(child, VectorParameterModel):
             if child._resolved_type.c_typename == "char":
-                data += f"{indent}        self.{child_name} = ODINStringEntry(0x{child.global_id:08X}, interface=interface,max_length={child.max_elements})\n"
+                data += f"{indent}        self.{child_name} = ODINStringEntry(0x{child.global_id:08X}, interface=interface,max_length={child.max_elements}{writable})\n"
             elif child._resolved_type.c_typename == "uint8_t":
-                data += f"{indent}        self.{child_name} = ODINBytesEntry(0x{child.global_id:08X}, interface=interface,max_length={child.max_elements},fixed_length=False)\n"
+                data += f"{indent}        self.{child_name} = ODINBytesEntry(0x{child.global_id:08X}, interface=interface,max_length={child.max_elements},fixed_length=False{writable})\n"
             else:
-                data += f"{indent}        self.{child_name} = ODINVectorEntry[{child._resolved_type.py_typename}](0x{child.global_id:08X}, cls={child._resolved_type.py_typename},max_elements={child.max_elements},element_size={child._resolved_type.size},interface=interface)\n"
+                data += f"{indent}        self.{child_name} = {vector_entry}[{child._resolved_type.py_typename}](0x{child.global_id:08X}, cls={child._resolved_type.py_typename},max_elements={child.max_elements},element_size={child._resolved_type.size},interface=interface{writable})\n"
 
         children[child_name] = f"self.{child_name}"
 
@@ -86,8 +98,8 @@ def generate_class(name: str, model: BaseParameterGroupModel, tab_indent: int, p
     data += f"{indent}        super().__init__(interface)\n\n"
 
     # Read mehtod
-    data += f"{indent}    async def read(self) -> Model:\n"
-    data += f"{indent}        data = await self.read_all()\n"
+    data += f"{indent}    async def read(self, whole_group: bool = False) -> Model:\n"
+    data += f"{indent}        data = await (self.read_group() if whole_group else self.read_all())\n"
 
     data += f"{indent}        return self.Model(\n"
     for child_name, child in model.children.items():
@@ -197,9 +209,42 @@ def generate_class(name: str, model: BaseParameterGroupModel, tab_indent: int, p
 #     return output
 
 
-def generate_basemodel_type(name: str, datatype: CustomDataType) -> str:
-    output = f"""class {datatype.py_typename}(GenericModel,ConfiguredBaseModel):
+def numpy_dtype(model: DataTypeModelDefinition) -> str:
+    """Python literal of the numpy dtype of a model, a structured dtype without padding like the struct format"""
+
+    if isinstance(model.root, BuiltinDataType):
+        return repr(f"<{model.root.to_python_struct()}")
+    if isinstance(model.root, CustomDataType):
+        return numpy_dtype(model.root.model)
+    if not isinstance(model.root, dict):
+        raise ValueError(f"Unknown type {model.root}")
+
+    fields = []
+    for name, sub_model in model.to_flat_dict(depth=1).items():
+        if sub_model.elements == 1:
+            fields.append(f"({name!r}, {numpy_dtype(sub_model)})")
+        else:
+            fields.append(f"({name!r}, {numpy_dtype(sub_model)}, ({sub_model.elements},))")
+    return f"[{', '.join(fields)}]"
+
+
+def struct_name(py_typename: str) -> str:
+    """Module level name of the precompiled struct.Struct of a generated type"""
+
+    return f"{py_typename}_STRUCT"
+
+
+def generate_basemodel_type(name: str, datatype: CustomDataType, numpy: bool = False) -> str:
+    struct_variable = struct_name(datatype.py_typename)
+
+    output = f"""{struct_variable} = struct.Struct('<{datatype.struct_format}')
+
+class {datatype.py_typename}(GenericModel,ConfiguredBaseModel):
+    STRUCT: ClassVar[struct.Struct] = {struct_variable}
 """
+    if numpy:
+        output += f"    DTYPE: ClassVar[np.dtype] = np.dtype({numpy_dtype(datatype.model)})\n"
+    output += "\n"
     resolved_types = datatype.model.to_flat_dict(depth=1)
 
     for sub_name, sub_datatype in resolved_types.items():
@@ -223,8 +268,7 @@ def generate_basemodel_type(name: str, datatype: CustomDataType) -> str:
     #
     output += f"""
     def encode_to_bytes(self) -> bytes:
-        packed_data = struct.pack(
-            '<{datatype.struct_format}',
+        packed_data = {struct_variable}.pack(
 """
     for i, (name, sub_datatype) in enumerate(resolved_types.items()):
         # if isinstance(sub_datatype, list):
@@ -245,8 +289,11 @@ def generate_basemodel_type(name: str, datatype: CustomDataType) -> str:
         return packed_data
 
     @classmethod
-    def decode_from_bytes(cls, data: bytes) -> "{datatype.py_typename}":
-        unpacked_data = struct.unpack('<{datatype.struct_format}', data)
+    def decode_from_bytes(cls, data: bytes | memoryview) -> "{datatype.py_typename}":
+        return cls.from_unpacked({struct_variable}.unpack(data))
+
+    @classmethod
+    def from_unpacked(cls, unpacked_data: tuple) -> "{datatype.py_typename}":
         return cls(
 """
 
@@ -277,23 +324,37 @@ def generate_basemodel_type(name: str, datatype: CustomDataType) -> str:
     return output
 
 
-def generate_standard_type(name: str, type_class: BuiltinDataType) -> str:
+def generate_standard_type(name: str, type_class: BuiltinDataType, numpy: bool = False) -> str:
     python_type = type_class.python_primitive_typename
     format_string = type_class.to_python_struct()
     type_name = type_class.py_typename
+    struct_variable = struct_name(type_name)
+    dtype = f"    DTYPE: ClassVar[np.dtype] = np.dtype('<{format_string}')\n" if numpy else ""
+
+    # Arrays of a builtin type are packed and unpacked in a single call
+    data = f"""{struct_variable} = struct.Struct('<{format_string}')
 
-    data = f"""class {type_name}(GenericModel,{python_type}):
+class {type_name}(GenericModel,{python_type}):
+    STRUCT: ClassVar[struct.Struct] = {struct_variable}
+{dtype}
     def encode_to_bytes(self) -> bytes:
-        return struct.pack(
-            '<{format_string}',
-            self,
-        )
+        return {struct_variable}.pack(self)
 
     @classmethod
-    def decode_from_bytes(cls, data: bytes) -> "{type_name}":
-        return cls(
-            *struct.unpack('<{format_string}', data)
-        )
+    def decode_from_bytes(cls, data: bytes | memoryview) -> "{type_name}":
+        return cls(*{struct_variable}.unpack(data))
+
+    @classmethod
+    def from_unpacked(cls, unpacked_data: tuple) -> "{type_name}":
+        return cls(*unpacked_data)
+
+    @classmethod
+    def decode_array(cls, data: bytes | memoryview) -> list[{python_type}]:
+        return list(array_struct('{format_string}', len(data) // {struct_variable}.size).unpack(data))
+
+    @classmethod
+    def encode_array(cls, values: Sequence[{python_type}]) -> bytes:
+        return array_struct('{format_string}', len(values)).pack(*values)
 
 """
     return data
@@ -1,42 +1,55 @@
-from pydantic import BaseModel
-
 from odin_python.data_types.type_registry import CustomDataType, BuiltinDataType, DataType
 
+from .config import PYGeneratorConfig
 from .conversion import generate_class, generate_basemodel_type, generate_standard_type
 from ..abstract_generator import AbstractGenerator, ModelContext
+from ...utils.files import copy_if_changed
+from io import StringIO
 import pathlib
 import shutil
 
 TEMPLATE_PROJECT_DIR = (pathlib.Path(__file__).parent / "template").resolve()
+NUMPY_TYPES_FILE = "numpy_types.py"
 # print(f"TEMPLATE_PROJECT_DIR: {TEMPLATE_PROJECT_DIR}")
 
 
 class PYGenerator(AbstractGenerator):
-    class Config(BaseModel):
-        pass
+    Config = PYGeneratorConfig
 
-    config: BaseModel
+    config: PYGeneratorConfig
 
-    def __init__(self, config: BaseModel):
+    def __init__(self, config: PYGeneratorConfig):
         super().__init__(config)
         self.config = config
 
     def generate(self, model_context: ModelContext, output_path: str) -> None:  # type: ignore
-        # copy the template project to the output path
+        # copy the template project to the output path, the numpy entries need numpy so they are only copied when used
+        ignored = ["*.pyc", "__pycache__", ".venv"]
+        if not self.config.numpy:
+            ignored.append(NUMPY_TYPES_FILE)
 
         shutil.copytree(
             TEMPLATE_PROJECT_DIR,
             output_path,
             dirs_exist_ok=True,
-            ignore=shutil.ignore_patterns("*.pyc", "__pycache__", ".venv"),
+            ignore=shutil.ignore_patterns(*ignored),
+            copy_function=copy_if_changed,
         )
 
-        with open(pathlib.Path(output_path) / "src" / "odin_interface" / "type_definitions.py", "w") as f:
+        # Left over from an earlier generation with numpy enabled
+        numpy_types = pathlib.Path(output_path) / "src" / "odin_interface" / NUMPY_TYPES_FILE
+        if not self.config.numpy:
+            numpy_types.unlink(missing_ok=True)
+
+        with StringIO() as f:
             f.write("# This file is generated by the odin_python generator\n")
             f.write("# Do not edit this file\n")
             f.write("# Generated by odin_python\n\n")
-            f.write("from .base_types import GenericModel,ConfiguredBaseModel\n")
+            f.write("from .base_types import GenericModel,ConfiguredBaseModel,array_struct\n")
+            f.write("from typing import ClassVar, Sequence\n")
             f.write("import struct\n")
+            if self.config.numpy:
+                f.write("import numpy as np\n")
             f.write("\n")
 
             # Generate the type class
@@ -45,17 +58,21 @@ class PYGenerator(AbstractGenerator):
                     if isinstance(datatype.model.root, DataType):
                         f.write(generate_rootmodel_type(type_name, datatype))
                     else:
-                        f.write(generate_basemodel_type(type_name, datatype))
+                        f.write(generate_basemodel_type(type_name, datatype, self.config.numpy))
                 elif isinstance(datatype, BuiltinDataType):
-                    f.write(generate_standard_type(type_name, datatype))
+                    f.write(generate_standard_type(type_name, datatype, self.config.numpy))
 
-        with open(pathlib.Path(output_path) / "src" / "odin_interface" / "model.py", "w") as f:
+            self.save_to_file(str(pathlib.Path(output_path) / "src" / "odin_interface" / "type_definitions.py"), f.getvalue())
+
+        with StringIO() as f:
             f.write("# This file is generated by the odin_python generator\n")
             f.write("# Do not edit this file\n")
             f.write("# Generated by odin_python\n\n")
             f.write(
                 "from .base_types import ODINEntry,ODINArrayEntry,ODINVectorEntry,ODINStringEntry,ODINBytesEntry,BaseRootModel,TemplateInterface,ConfiguredBaseModel\n"
             )
+            if self.config.numpy:
+                f.write("from .numpy_types import ODINNumpyArrayEntry,ODINNumpyVectorEntry,NDArray\n")
             f.write("import struct\n")
             f.write("\n")
 
@@ -65,4 +82,6 @@ class PYGenerator(AbstractGenerator):
             f.write(f"from .type_definitions import {', '.join(types)}\n\n")
 
             # Generate the model classes
-            f.write(generate_class("RootModel", model_context.root_model, 0, "RootModel"))
+            f.write(generate_class("RootModel", model_context.root_model, 0, "RootModel", self.config.numpy))
+
+            self.save_to_file(str(pathlib.Path(output_path) / "src" / "odin_interface" / "model.py"), f.getvalue())
@@ -1,15 +1,98 @@
 import asyncio
+import math
+import struct
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Self, Type, TypeVar
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Any, Callable, ClassVar, Generic, Iterable, Iterator, Self, Sequence, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
 T = TypeVar("T")
 
+# Index and length in front of every value in the TLV encoding, see byte_package_format_t in TLV_codec.c
+TLV_HEADER = struct.Struct("<IH")
+TLV_MAX_LENGTH = 0xFFFF
+
+
+def encode_tlv(data: dict[int, bytes], sort: bool = True) -> bytes:
+    """Encodes the values by global index as a TLV stream
+
+    The values are sorted by global index by default, so ODIN_decode_bytes_to_parameter_group_batch can resolve
+    them in a single pass over the index table, instead of looking up every index.
+    """
+
+    items = sorted(data.items()) if sort else data.items()
+
+    chunks = []
+    for id, value in items:
+        if len(value) > TLV_MAX_LENGTH:
+            raise ValueError(f"Value of 0x{id:08X} is {len(value)} bytes, the maximum is {TLV_MAX_LENGTH}")
+        chunks.append(TLV_HEADER.pack(id, len(value)))
+        chunks.append(value)
+
+    return b"".join(chunks)
+
+
+def decode_tlv(data: bytes | memoryview) -> Iterator[tuple[int, memoryview]]:
+    """Parses a TLV stream as written by ODIN_encode_parameter_group_to_bytes
+
+    The values are views into the data, nothing is copied until the entries decode them.
+    """
+
+    view = memoryview(data)
+    offset = 0
+    while offset < len(view):
+        if len(view) - offset < TLV_HEADER.size:
+            raise ValueError(f"Truncated TLV header at offset {offset}")
+
+        id, length = TLV_HEADER.unpack_from(view, offset)
+        offset += TLV_HEADER.size
+
+        if offset + length > len(view):
+            raise ValueError(f"Value of 0x{id:08X} at offset {offset} is {length} bytes, only {len(view) - offset} are left")
+
+        yield id, view[offset : offset + length]
+        offset += length
+
+
+@lru_cache(maxsize=None)
+def array_struct(format: str, count: int) -> struct.Struct:
+    """Layout of count consecutive values of a single field format, like '<f' for 10 elements to '<10f'"""
+
+    return struct.Struct(f"<{count}{format.lstrip('<')}")
+
+
+def batches(ids: list[int], size: int) -> list[list[int]]:
+    """Splits the ids into consecutive batches of at most size ids"""
+
+    if size < 1:
+        raise ValueError(f"Batch size {size} needs to be at least 1")
+    return [ids[i : i + size] for i in range(0, len(ids), size)]
+
 
 class TemplateInterface:
+    # Most ids the transport can read in a single get_multi request
+    max_batch_size: int = 64
+
     async def get_single(self, id: int) -> bytes: ...
 
+    async def get_multi(self, ids: list[int]) -> dict[int, bytes]:
+        """Reads several parameters in one request, ids missing from the response were not readable
+
+        Transports without a batched request only implement get_single, this falls back to one request per id and
+        leaves out the ids whose request failed.
+        """
+
+        results = await asyncio.gather(*[self.get_single(id) for id in ids], return_exceptions=True)
+        return {id: result for id, result in zip(ids, results) if not isinstance(result, BaseException)}
+
+    async def get_group(self, id: int) -> bytes:
+        """Reads every parameter of the group in one request, as the TLV stream of ODIN_encode_parameter_group_to_bytes"""
+
+        raise NotImplementedError("The transport does not support group reads")
+
     async def set_request(self, data: dict[int, bytes]): ...
 
 
@@ -19,34 +102,66 @@ class ConfiguredBaseModel(BaseModel):
     )
 
 class GenericModel(ABC):
+    # Little endian layout of the type, precompiled once by the generated types
+    STRUCT: ClassVar[struct.Struct]
+    # Matching numpy dtype, only set by the interfaces generated with numpy enabled
+    DTYPE: ClassVar[Any]
+
     @abstractmethod
     def encode_to_bytes(self) -> bytes:
         pass
 
     @classmethod
     @abstractmethod
-    def decode_from_bytes(cls, data: bytes) -> Self:
+    def decode_from_bytes(cls, data: bytes | memoryview) -> Self:
         pass
 
+    @classmethod
+    @abstractmethod
+    def from_unpacked(cls, values: tuple[Any, ...]) -> Self:
+        """Builds the value from the fields unpacked with STRUCT"""
+
+    @classmethod
+    def decode_array(cls, data: bytes | memoryview) -> list[Any]:
+        """Decodes consecutive values in a single pass over the data, without slicing out the elements"""
+
+        return [cls.from_unpacked(values) for values in cls.STRUCT.iter_unpack(data)]
+
+    @classmethod
+    def encode_array(cls, values: Sequence[Any]) -> bytes:
+        return b"".join([cls.encode_to_bytes(value) for value in values])
+
 
 class ODINArrayEntry(Generic[T]):
     interface: TemplateInterface
 
-    def __init__(self, id: int, cls: Type[GenericModel], element_size: int, elements: int, interface: TemplateInterface):
+    def __init__(
+        self,
+        id: int,
+        cls: Type[GenericModel],
+        element_size: int,
+        elements: int,
+        interface: TemplateInterface,
+        writable: bool = True,
+    ):
         self.id = id
         self.type_class = cls
         self.interface = interface
+        self.writable = writable
         self.element_size = element_size
         self.elements = elements
 
-    def decode_from_bytes(self, data: bytes) -> list[T]:
-        array = [self.type_class.decode_from_bytes(data[i : i + self.element_size]) for i in range(0, len(data), self.element_size)]  # type: ignore
+    def decode_from_bytes(self, data: bytes | memoryview) -> list[T]:
+        array = self.type_class.decode_array(memoryview(data))
 
         if len(array) != self.elements:
             raise ValueError(f"Value length {len(array)} does not match expected length {self.elements}")
 
         return array  # type: ignore
 
+    def encode_to_bytes(self, value: Sequence[T]) -> bytes:
+        return self.type_class.encode_array(value)
+
     async def read(self) -> list[T]:
         return self.decode_from_bytes(await self.interface.get_single(self.id))  # type: ignore
 
@@ -54,22 +169,25 @@ class ODINArrayEntry(Generic[T]):
         if len(value) != self.elements:
             raise ValueError(f"Value length {len(value)} does not match expected length {self.elements}")
 
-        await self.interface.set_request({self.id: b"".join([self.type_class.encode_to_bytes(v) for v in value])})  # type: ignore
+        await self.interface.set_request({self.id: self.encode_to_bytes(value)})
 
 
 class ODINStringEntry:
     interface: TemplateInterface
 
-    def __init__(self, id: int, max_length: int, interface: TemplateInterface):
+    def __init__(self, id: int, max_length: int, interface: TemplateInterface, writable: bool = True):
         self.id = id
         self.interface = interface
+        self.writable = writable
         self.max_length = max_length
 
-    async def read(self) -> str:
-        data = await self.interface.get_single(self.id)
+    def decode_from_bytes(self, data: bytes | memoryview) -> str:
         if len(data) > self.max_length:
             raise ValueError(f"String length {len(data)} exceeds maximum length {self.max_length}")
-        return data.decode("utf-8", errors="ignore")  # type: ignore
+        return bytes(data).decode("utf-8", errors="ignore")
+
+    async def read(self) -> str:
+        return self.decode_from_bytes(await self.interface.get_single(self.id))
 
     async def write(self, value: str):
         if len(value) > self.max_length:
@@ -80,21 +198,23 @@ class ODINStringEntry:
 class ODINBytesEntry:
     interface: TemplateInterface
 
-    def __init__(self, id: int, max_length: int, interface: TemplateInterface, fixed_length: bool):
+    def __init__(self, id: int, max_length: int, interface: TemplateInterface, fixed_length: bool, writable: bool = True):
         self.id = id
         self.interface = interface
+        self.writable = writable
         self.max_length = max_length
         self.fixed_length = fixed_length
 
-    async def read(self) -> bytes:
-        data = await self.interface.get_single(self.id)
-
+    def decode_from_bytes(self, data: bytes | memoryview) -> bytes:
         if self.fixed_length and len(data) != self.max_length:
             raise ValueError(f"Bytes length {len(data)} does not match expected length {self.max_length}")
 
         if len(data) > self.max_length:
             raise ValueError(f"Bytes length {len(data)} exceeds maximum length {self.max_length}")
-        return data  # type: ignore
+        return bytes(data)
+
+    async def read(self) -> bytes:
+        return self.decode_from_bytes(await self.interface.get_single(self.id))
 
     async def write(self, value: bytes):
         if self.fixed_length and len(value) != self.max_length:
@@ -108,21 +228,33 @@ class ODINBytesEntry:
 class ODINVectorEntry(Generic[T]):
     interface: TemplateInterface
 
-    def __init__(self, id: int, cls: Type[GenericModel], element_size: int, max_elements: int, interface: TemplateInterface):
+    def __init__(
+        self,
+        id: int,
+        cls: Type[GenericModel],
+        element_size: int,
+        max_elements: int,
+        interface: TemplateInterface,
+        writable: bool = True,
+    ):
         self.id = id
         self.type_class = cls
         self.interface = interface
+        self.writable = writable
         self.element_size = element_size
         self.max_elements = max_elements
 
-    def decode_from_bytes(self, data: bytes) -> list[T]:
-        array = [self.type_class.decode_from_bytes(data[i : i + self.element_size]) for i in range(0, len(data), self.element_size)]  # type: ignore
+    def decode_from_bytes(self, data: bytes | memoryview) -> list[T]:
+        array = self.type_class.decode_array(memoryview(data))
 
         if len(array) > self.max_elements:
             raise ValueError(f"Value length {len(array)} exceeds maximum length {self.max_elements}")
 
         return array  # type: ignore
 
+    def encode_to_bytes(self, value: Sequence[T]) -> bytes:
+        return self.type_class.encode_array(value)
+
     async def read(self) -> list[T]:
         return self.decode_from_bytes(await self.interface.get_single(self.id))  # type: ignore
 
@@ -130,43 +262,284 @@ class ODINVectorEntry(Generic[T]):
         if len(value) > self.max_elements:
             raise ValueError(f"Value length {len(value)} exceeds maximum length {self.max_elements}")
 
-        await self.interface.set_request({self.id: b"".join([self.type_class.encode_to_bytes(v) for v in value])})  # type: ignore
+        await self.interface.set_request({self.id: self.encode_to_bytes(value)})
 
 
 class ODINEntry(Generic[T]):
     interface: TemplateInterface
 
-    def __init__(self, id: int, cls: Type[GenericModel], interface: TemplateInterface):
+    def __init__(self, id: int, cls: Type[GenericModel], interface: TemplateInterface, writable: bool = True):
         self.id = id
         self.type_class = cls
         self.interface = interface
+        self.writable = writable
+
+    def decode_from_bytes(self, data: bytes | memoryview) -> T:
+        return self.type_class.decode_from_bytes(data)  # type: ignore
 
     async def read(self) -> T:
-        return self.type_class.decode_from_bytes(await self.interface.get_single(self.id))  # type: ignore
+        return self.decode_from_bytes(await self.interface.get_single(self.id))
 
     async def write(self, value: T):
-        await self.interface.set_request({self.id: self.type_class.encode(value)})  # type: ignore
+        await self.interface.set_request({self.id: self.type_class.encode_to_bytes(value)})  # type: ignore
+
+
+ODINLeafEntry = ODINEntry | ODINArrayEntry | ODINVectorEntry | ODINStringEntry | ODINBytesEntry
 
 
 class BaseRootModel:
     _children: dict[str, "ODINEntry|ODINArrayEntry|ODINVectorEntry|BaseRootModel|ODINStringEntry|ODINBytesEntry"]
 
+    # Global index of the group, set by the generated classes
+    _id: int = 0
+
     def __init__(self, interface: TemplateInterface):
         self.interface = interface
 
+        if isinstance(interface, CachedInterface):
+            for child in self._children.values():
+                if not isinstance(child, BaseRootModel):
+                    interface.register(child)
+
+    def _leaves(self) -> list[ODINLeafEntry]:
+        """Every parameter below the group, in the order of the model"""
+
+        leaves = []
+        for child in self._children.values():
+            if isinstance(child, BaseRootModel):
+                leaves.extend(child._leaves())
+            else:
+                leaves.append(child)
+        return leaves
+
+    @cached_property
+    def _index(self) -> dict[int, ODINLeafEntry]:
+        """Parameters below the group by global index, the first one in the model decodes a shared index"""
+
+        index: dict[int, ODINLeafEntry] = {}
+        for leaf in self._leaves():
+            index.setdefault(leaf.id, leaf)
+        return index
+
+    async def _read_multi(self, ids: list[int]) -> dict[int, bytes | BaseException]:
+        """Reads the ids in batches of the transport size, a failed batch returns its exception for all of its ids"""
+
+        requests = batches(ids, self.interface.max_batch_size)
+        responses = await asyncio.gather(*[self.interface.get_multi(batch) for batch in requests], return_exceptions=True)
+
+        values: dict[int, bytes | BaseException] = {}
+        for batch, response in zip(requests, responses):
+            for id in batch:
+                if isinstance(response, BaseException):
+                    values[id] = response
+                elif id in response:
+                    values[id] = response[id]
+                else:
+                    values[id] = KeyError(f"0x{id:08X} is missing from the response")
+        return values
+
+    def _decode(self, records: Iterable[tuple[int, bytes | memoryview | BaseException]]) -> dict[int, Any]:
+        """Decodes the raw values with the entry of their global index, failures are kept as exceptions
+
+        Indices outside of the group are skipped, newer firmware can have parameters the model does not know.
+        """
+
+        values: dict[int, Any] = {}
+        for id, value in records:
+            entry = self._index.get(id)
+            if entry is None:
+                continue
+
+            if isinstance(value, BaseException):
+                values[id] = value
+                continue
+
+            try:
+                values[id] = entry.decode_from_bytes(value)
+            except Exception as exception:
+                values[id] = exception
+        return values
+
+    def _assemble(self, values: dict[int, Any]) -> dict[str, Any]:
+        """Nests the decoded values by global index into the dictionary the Model is built from"""
+
+        data: dict[str, Any] = {}
+        for name, child in self._children.items():
+            if isinstance(child, BaseRootModel):
+                data[name] = child._assemble(values)
+            elif child.id in values:
+                data[name] = values[child.id]
+            else:
+                data[name] = KeyError(f"0x{child.id:08X} is missing from the response")
+        return data
+
     async def read_all(self) -> dict[str, Any]:
-        # Prepare tasks for reading all children
-        tasks = {}
-        for name, odin_var in self._children.items():
-            if isinstance(odin_var, BaseRootModel):
-                tasks[name] = odin_var.read_all()
+        # Every parameter of the subtree is read once, parameters sharing an id share the request
+        values = await self._read_multi(list(self._index))
+        return self._assemble(self._decode(values.items()))
+
+    async def read_group(self) -> dict[str, Any]:
+        """Reads the whole group in a single request, see TemplateInterface.get_group"""
+
+        data = await self.interface.get_group(self._id)
+        return self._assemble(self._decode(decode_tlv(data)))
+
+
+class CachedInterface(TemplateInterface):
+    """Caches the raw values read through another interface by global index
+
+    A value is kept for the default ttl, unless set_ttl changed it for the parameter or its group. Parameters which
+    no access group can write are kept for read_only_ttl, None keeps them until they are written. Writes through the
+    cache drop the written values, and the least recently used value is evicted when more than max_entries are cached.
+
+    Create the models with the cache as their interface, so it knows which parameters are read only.
+    """
+
+    def __init__(
+        self,
+        interface: TemplateInterface,
+        ttl: float | None = 1.0,
+        max_entries: int = 1024,
+        read_only_ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError(f"Cache size {max_entries} needs to be at least 1")
+
+        self.interface = interface
+        self.ttl = ttl
+        self.read_only_ttl = read_only_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Value and expiry time by global index, in the order of use
+        self._values: OrderedDict[int, tuple[bytes, float]] = OrderedDict()
+        self._ttls: dict[int, float | None] = {}
+        self._read_only: set[int] = set()
+
+        # A read started before a write to the same index does not store the value it received
+        self._write_count = 0
+        self._written_at: dict[int, int] = {}
+
+    @property
+    def max_batch_size(self) -> int:  # type: ignore
+        return self.interface.max_batch_size
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def register(self, entry: ODINLeafEntry) -> None:
+        """Called by the models for their parameters"""
+
+        if not entry.writable:
+            self._read_only.add(entry.id)
+
+    def set_ttl(self, target: "BaseRootModel | ODINLeafEntry", ttl: float | None) -> None:
+        """Sets the time to live of a parameter, or of every parameter in a group, None keeps them until written"""
+
+        leaves = target._leaves() if isinstance(target, BaseRootModel) else [target]
+        for leaf in leaves:
+            self._ttls[leaf.id] = ttl
+            self._values.pop(leaf.id, None)
+
+    def ttl_of(self, id: int) -> float | None:
+        if id in self._ttls:
+            return self._ttls[id]
+        if id in self._read_only:
+            return self.read_only_ttl
+        return self.ttl
+
+    def invalidate(self, ids: Iterable[int] | None = None) -> None:
+        """Drops the cached values of the ids, or all of them"""
+
+        if ids is None:
+            self._values.clear()
+            return
+
+        for id in ids:
+            self._values.pop(id, None)
+
+    def _lookup(self, id: int) -> bytes | None:
+        cached = self._values.get(id)
+        if cached is not None:
+            value, expiry = cached
+            if self.clock() < expiry:
+                self._values.move_to_end(id)
+                self.hits += 1
+                return value
+            del self._values[id]
+
+        self.misses += 1
+        return None
+
+    def _store(self, id: int, value: bytes | memoryview, started: int) -> None:
+        if self._written_at.get(id, 0) > started:
+            return
+
+        ttl = self.ttl_of(id)
+        if ttl is not None and ttl <= 0:
+            return
+
+        self._values[id] = (bytes(value), math.inf if ttl is None else self.clock() + ttl)
+        self._values.move_to_end(id)
+
+        if len(self._values) > self.max_entries:
+            self._values.popitem(last=False)
+            self.evictions += 1
+
+    def _written(self, ids: Iterable[int]) -> None:
+        self._write_count += 1
+        for id in ids:
+            self._written_at[id] = self._write_count
+            self._values.pop(id, None)
+
+    async def get_single(self, id: int) -> bytes:
+        value = self._lookup(id)
+        if value is not None:
+            return value
+
+        started = self._write_count
+        value = await self.interface.get_single(id)
+        self._store(id, value, started)
+        return value
+
+    async def get_multi(self, ids: list[int]) -> dict[int, bytes]:
+        values: dict[int, bytes] = {}
+        missing = []
+        for id in ids:
+            value = self._lookup(id)
+            if value is None:
+                missing.append(id)
             else:
-                tasks[name] = odin_var.read()
+                values[id] = value
 
-        # Execute all tasks concurrently
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        if len(missing) > 0:
+            started = self._write_count
+            response = await self.interface.get_multi(missing)
+            for id in missing:
+                if id in response:
+                    self._store(id, response[id], started)
+                    values[id] = response[id]
 
-        # Combine task results into a dictionary
-        data = {name: result for name, result in zip(tasks.keys(), results)}
+        return values
 
+    async def get_group(self, id: int) -> bytes:
+        """Always reads the group, the received values are cached for the next single reads"""
+
+        started = self._write_count
+        data = await self.interface.get_group(id)
+        for record_id, value in decode_tlv(data):
+            self._store(record_id, value, started)
         return data
+
+    async def set_request(self, data: dict[int, bytes]):
+        # Also after the write, a read running alongside may have received the old value
+        self._written(data)
+        try:
+            return await self.interface.set_request(data)
+        finally:
+            self._written(data)
@@ -0,0 +1,59 @@
+"""Array and vector entries returning numpy arrays, only imported by interfaces generated with numpy enabled"""
+
+from typing import Annotated, Any, Sequence, Type
+
+import numpy as np
+from pydantic import PlainSerializer, PlainValidator
+
+from .base_types import GenericModel, ODINArrayEntry, ODINVectorEntry, T
+
+
+def to_ndarray(value: Any) -> np.ndarray:
+    return value if isinstance(value, np.ndarray) else np.asarray(value)
+
+
+# Kept as is in the Model, pydantic does not know numpy arrays
+NDArray = Annotated[np.ndarray, PlainValidator(to_ndarray), PlainSerializer(lambda array: array.tolist())]
+
+
+def decode_ndarray(cls: Type[GenericModel], data: bytes | memoryview) -> np.ndarray:
+    """Views the data as an array of the type, without copying
+
+    The array shares the memory of the received data, so it is read only. Copy it to change the values.
+    """
+
+    return np.frombuffer(data, dtype=cls.DTYPE)  # type: ignore
+
+
+def encode_ndarray(cls: Type[GenericModel], value: np.ndarray | Sequence[Any]) -> bytes:
+    """Encodes an array in one go, lists are still encoded element by element"""
+
+    if isinstance(value, np.ndarray):
+        return np.ascontiguousarray(value, dtype=cls.DTYPE).tobytes()  # type: ignore
+    return cls.encode_array(value)
+
+
+class ODINNumpyArrayEntry(ODINArrayEntry[T]):
+    def decode_from_bytes(self, data: bytes | memoryview) -> np.ndarray:  # type: ignore
+        array = decode_ndarray(self.type_class, data)
+
+        if len(array) != self.elements:
+            raise ValueError(f"Value length {len(array)} does not match expected length {self.elements}")
+
+        return array
+
+    def encode_to_bytes(self, value: np.ndarray | Sequence[T]) -> bytes:  # type: ignore
+        return encode_ndarray(self.type_class, value)
+
+
+class ODINNumpyVectorEntry(ODINVectorEntry[T]):
+    def decode_from_bytes(self, data: bytes | memoryview) -> np.ndarray:  # type: ignore
+        array = decode_ndarray(self.type_class, data)
+
+        if len(array) > self.max_elements:
+            raise ValueError(f"Value length {len(array)} exceeds maximum length {self.max_elements}")
+
+        return array
+
+    def encode_to_bytes(self, value: np.ndarray | Sequence[T]) -> bytes:  # type: ignore
+        return encode_ndarray(self.type_class, value)
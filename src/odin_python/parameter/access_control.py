@@ -135,7 +135,8 @@ class AccesControlDefinition(BaseModel):
 
         permissions = []
 
-        for permission in self.default:
+        # Sorted, so the generated code does not depend on the set iteration order
+        for permission in sorted(self.default, key=lambda permission: permission.value):  # type: ignore
             assert isinstance(permission, AccessControlEnum), "Invalid permission type"
             permissions.append(f"{ACTION_PREFIX}{permission.name.upper()}")
 
@@ -150,6 +151,12 @@ class AccessControlCollection(RootModel[Dict[str, AccesControlDefinition | Set[s
     _parent: "BaseParameterModel | None" = PrivateAttr(default=None)
     _access_groups: Dict[int, str] | None = PrivateAttr(default=None)
 
+    # Cached results of the top-down inheritance pass, see resolve_inheritance
+    _inherited: "AccessControlCollection | None" = PrivateAttr(default=None)
+    _inherited_reset: "AccessControlCollection | None" = PrivateAttr(default=None)
+    _collapsed: "AccessControlCollection | None" = PrivateAttr(default=None)
+    _collapsed_c_definition: str | None = PrivateAttr(default=None)
+
     pass
 
     @model_validator(mode="after")  # type: ignore
@@ -193,7 +200,13 @@ class AccessControlCollection(RootModel[Dict[str, AccesControlDefinition | Set[s
         return self
 
     def collapse(self) -> "AccessControlCollection":
-        """Collapses the access control collection into a single access control collection"""
+        """Collapses the access control collection into a single access control collection
+
+        Returns the cached result of resolve_inheritance if available, otherwise walks up the tree
+        """
+
+        if self._collapsed is not None:
+            return self._collapsed
 
         # Create a list of all the access control collections from the root to the current collection
         collections = self.recursive_get_build_permission_chain()
@@ -207,6 +220,82 @@ class AccessControlCollection(RootModel[Dict[str, AccesControlDefinition | Set[s
 
         return merged_collection
 
+    @property
+    def collapsed_c_definition(self) -> str:
+        """C definition of the collapsed access control, cached after resolve_inheritance"""
+
+        if self._collapsed_c_definition is not None:
+            return self._collapsed_c_definition
+
+        return self.collapse().to_c_definition()
+
+    def resolve_inheritance(self, parent: "AccessControlCollection | None", inheritable: bool) -> None:
+        """Collapses the access control using the cached results of the parent, instead of walking up the tree
+
+        Must be called top-down, the parent needs to be resolved first (None for the root).
+        The result is identical to the chain based collapse, which merges
+        [self, root, ..., parent, self], this is split into:
+        * the plain merge of [root, ..., parent], used for the groups not set on this level
+        * the merge of [empty, root, ..., parent], which is what the groups set on this level are merged onto
+
+        Args:
+            parent (AccessControlCollection | None): The access control of the parent parameter
+            inheritable (bool): If set, also caches the merged results for the children (for groups)
+        """
+
+        inherited = parent._inherited if parent is not None else None
+        inherited_reset = parent._inherited_reset if parent is not None else None
+
+        if inherited is None:
+            inherited = AccessControlCollection.empty()
+        if inherited_reset is None:
+            inherited_reset = AccessControlCollection.empty()
+
+        items: Dict[str, AccesControlDefinition] = {}
+
+        for name, item in self.root.items():
+            assert isinstance(item, AccesControlDefinition), "Invalid item type"
+
+            base = inherited_reset.root.get(name, AccesControlDefinition())
+            assert isinstance(base, AccesControlDefinition), "Invalid item type"
+
+            items[name] = base.merge(item)
+
+        for name, item in inherited.root.items():
+            assert isinstance(item, AccesControlDefinition), "Invalid item type"
+
+            if name not in items:
+                items[name] = item
+
+        self._collapsed = AccessControlCollection(root=items)  # type: ignore
+        self._collapsed_c_definition = self._collapsed.to_c_definition()
+
+        if inheritable:
+            self._inherited = inherited.merge(self)
+            self._inherited_reset = inherited_reset.merge(self.reset_copy())
+        else:
+            self._inherited = None
+            self._inherited_reset = None
+
+    def invalidate(self) -> None:
+        """Drops the cached results of resolve_inheritance"""
+
+        self._inherited = None
+        self._inherited_reset = None
+        self._collapsed = None
+        self._collapsed_c_definition = None
+
+    def reset_copy(self) -> "AccessControlCollection":
+        """Copy where every definition is merged onto an empty definition, removing the defaults hidden by an override"""
+
+        items: Dict[str, AccesControlDefinition] = {}
+
+        for name, item in self.root.items():
+            assert isinstance(item, AccesControlDefinition), "Invalid item type"
+            items[name] = AccesControlDefinition().merge(item)
+
+        return AccessControlCollection(root=items)  # type: ignore
+
     def recursive_get_build_permission_chain(self) -> "List[AccessControlCollection]":
         """Recursively gets the build permission chain"""
 
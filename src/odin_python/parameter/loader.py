@@ -1,14 +1,15 @@
 from typing import Dict, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, RootModel, ValidationError
-from pydantic_yaml import parse_yaml_file_as
 
 from odin_python.data_types.type_definition import ModelDataTypeDefintion
+from odin_python.generators.cache import ModelContextCache
 from odin_python.generators.generator import GeneratorConfigurations
 
 # from ..data_types.input_type_model import TypeSpecifciationCollectionModel
 from ..data_types.type_registry import BASE_DATA_TYPES, TypeRegistry
 from ..generators.abstract_generator import ModelContext
+from ..utils.profiler import profile_phase
 from .parameter import (
     AccessControlCollection,
     ArrayParameterModel,
@@ -92,8 +93,17 @@ class AdvancedLoaderModel(BaseModel):
 
     @classmethod
     def from_yaml(cls, file_path: str):
+        # Imported here, so commands that do not parse yaml files start faster
+        from ruamel.yaml import YAML
+
         try:
-            return parse_yaml_file_as(cls, file_path)
+            # Same as pydantic_yaml.parse_yaml_file_as, split up so reading and validating can be profiled separately
+            with profile_phase("yaml"):
+                with open(file_path, "r") as f:
+                    data = YAML(typ="safe", pure=True).load(f)
+
+            with profile_phase("validate"):
+                return cls.model_validate(data)
         except ValidationError as validation_error:
             print(validation_error.errors())
             for error in validation_error.errors():
@@ -107,16 +117,53 @@ class ConfigurationReader:
     def __init__(self):
         pass
 
-    def load(self, file_path: str, type: Literal["advanced"]) -> tuple[ModelContext, GeneratorConfigurations]:
+    def load(
+        self,
+        file_path: str,
+        type: Literal["advanced"],
+        cache_dir: str | None = None,
+    ) -> tuple[ModelContext, GeneratorConfigurations]:
+        """Loads and resolves the model, if a cache directory is given the resolved model is cached there"""
+
+        if cache_dir is None:
+            return self.load_uncached(file_path, type)
+
+        cache = ModelContextCache(cache_dir, file_path)
+
+        with profile_phase("model_cache"):
+            cached = cache.load()
+        if cached is not None:
+            print(f"Reusing cached model for {file_path}")
+            return cached
+
+        result = self.load_uncached(file_path, type)
+        with profile_phase("model_cache"):
+            cache.store(result)
+        return result
+
+    def load_uncached(self, file_path: str, type: Literal["advanced"]) -> tuple[ModelContext, GeneratorConfigurations]:
+        return self.resolve(self.parse(file_path, type))
+
+    def parse(self, file_path: str, type: Literal["advanced"]) -> AdvancedLoaderModel:
+        """Parses and validates the yaml file, without resolving the parameters"""
+
+        if type == "advanced":
+            with profile_phase("parse"):
+                return AdvancedLoaderModel.from_yaml(file_path)
+
+        raise ValueError("Invalid type. Use 'advanced'.")
+
+    def resolve(self, model: AdvancedLoaderModel) -> tuple[ModelContext, GeneratorConfigurations]:
+        """Registers the types and resolves the parsed parameters into the model context"""
+
         registry = TypeRegistry()
         registry.register(BASE_DATA_TYPES)
 
         try:
-            if type == "advanced":
-                model = AdvancedLoaderModel.from_yaml(file_path)
-
-                for type_name, type_definition in model.types.items():
-                    registry.register_custom_datatype(type_name, type_definition)
+            with profile_phase("resolve"):
+                with profile_phase("types"):
+                    for type_name, type_definition in model.types.items():
+                        registry.register_custom_datatype(type_name, type_definition)
 
                 root_parameters = RootParameterModel(
                     children=model.parameters,
@@ -124,14 +171,17 @@ class ConfigurationReader:
                     id_space_shift=model.id_space_shift,
                 )
 
-            else:
-                raise ValueError("Invalid type. Use 'advanced'.")
+                with profile_phase("parameters"):
+                    root_parameters.post_load_resolve(None, "root", registry)
 
-            root_parameters.post_load_resolve(None, "root", registry)
+                # Cache the global ids, names and access control, the tree is not modified after this point
+                with profile_phase("finalize"):
+                    root_parameters.finalize()
 
-            collections = {}
-            for group_name, group in model.collections.items():
-                collections[group_name] = group.to_group_model(group_name, root_parameters)
+                with profile_phase("collections"):
+                    collections = {}
+                    for group_name, group in model.collections.items():
+                        collections[group_name] = group.to_group_model(group_name, root_parameters)
 
             return ModelContext(
                 root_model=root_parameters,
@@ -146,4 +196,3 @@ class ConfigurationReader:
                 print(error["msg"])
 
             raise Exception("Failed to parse yaml file")
-        
\ No newline at end of file
@@ -11,7 +11,8 @@ from ..data_types.type_registry import (
 )
 from ..extensions import Extensions
 from ..extensions.string_codec_extension import ReferenceStringCodecExtension
-from ..parameter.access_control import AccessControlCollection
+from ..parameter.access_control import AccessControlCollection, AccessControlEnum
+from .path_index import ParameterPathIndex
 
 MAX_ID_SIZE = 32
 
@@ -23,6 +24,10 @@ class C_Names:
     variables_type: str
     variables_name: str
     groups_name: str
+    index_name: str | None = None
+    name_table_name: str | None = None
+    dirty_bitmap_name: str | None = None
+    seqlock_name: str | None = None
 
 
 class BaseParameterModel(BaseModel, ABC):
@@ -54,6 +59,12 @@ class BaseParameterModel(BaseModel, ABC):
     # Reference to the odin parameter, which represents the parameter in the odin runtime
     _absolute_object_reference: str | None = PrivateAttr(default=None)
 
+    # Cached position in the tree, set by the finalize method and cleared by invalidate
+    _resolved_global_id: int | None = PrivateAttr(default=None)
+    _resolved_global_shift: int | None = PrivateAttr(default=None)
+    _resolved_global_name: str | None = PrivateAttr(default=None)
+    _resolved_root: "RootParameterModel | None" = PrivateAttr(default=None)
+
     def post_load_resolve(
         self,
         parent: "BaseParameterModel | None",
@@ -67,6 +78,43 @@ class BaseParameterModel(BaseModel, ABC):
         self._name = name
         self.access_control._parent = self
 
+        # The position in the tree might have changed, so drop the cached values
+        self._clear_resolved_index()
+
+    def finalize(self) -> None:
+        """Caches the global id, shift, name and root of this parameter and all its children
+
+        Must be called after post_load_resolve, the parent has to be finalized first (or be None).
+        The values are computed top-down, so every node only looks at its direct parent, making this O(n).
+        If the tree is changed afterwards, call invalidate and finalize again on the root.
+        """
+
+        self._clear_resolved_index()
+
+        self._resolved_global_shift = self._calculate_global_shift()
+        self._resolved_global_id = self._calculate_global_id()
+        self._resolved_global_name = self._calculate_global_name()
+
+        if self._parent is not None or isinstance(self, RootParameterModel):
+            self._resolved_root = self._calculate_root()
+
+        self.access_control.resolve_inheritance(
+            self._parent.access_control if self._parent is not None else None,
+            inheritable=isinstance(self, BaseParameterGroupModel),
+        )
+
+    def invalidate(self) -> None:
+        """Drops the cached values set by finalize, the properties are calculated by walking the tree again"""
+
+        self._clear_resolved_index()
+
+    def _clear_resolved_index(self) -> None:
+        self._resolved_global_id = None
+        self._resolved_global_shift = None
+        self._resolved_global_name = None
+        self._resolved_root = None
+        self.access_control.invalidate()
+
     def initialise_types(self):
         assert self._parent is not None, "Parent is not set"
 
@@ -90,6 +138,25 @@ class BaseParameterModel(BaseModel, ABC):
         assert self._absolute_object_reference is not None, "Object reference is not set"
         return self._absolute_object_reference
 
+    @property
+    def effective_access_control(self) -> AccessControlCollection:
+        """Access control after inheriting from all the parents, cached after finalize"""
+        return self.access_control.collapse()
+
+    @property
+    def writable(self) -> bool:
+        """Whether any access group can write the parameter, the firmware itself can always write it
+
+        Without access groups in the dictionary nothing is known about the writers, so every parameter is writable.
+        """
+        definitions = self.effective_access_control.root.values()
+        return not definitions or any(AccessControlEnum.WRITE in definition.default for definition in definitions)  # type: ignore
+
+    @property
+    def access_control_c_definition(self) -> str:
+        """C expression of the effective access control, used as the flags of the parameter"""
+        return self.access_control.collapsed_c_definition
+
     @property
     def resolved_description(self) -> str:
         """Returns the description of the parameter, if not set returns a default value"""
@@ -97,6 +164,41 @@ class BaseParameterModel(BaseModel, ABC):
 
     @property
     def global_id(self) -> int:
+        """Global id of the parameter, cached after finalize"""
+
+        if self._resolved_global_id is not None:
+            return self._resolved_global_id
+
+        return self._calculate_global_id()
+
+    @property
+    def global_name(self) -> str:
+        """Global name of the parameter, cached after finalize"""
+
+        if self._resolved_global_name is not None:
+            return self._resolved_global_name
+
+        return self._calculate_global_name()
+
+    @property
+    def global_shift(self) -> int:
+        """Shift of all the parents, cached after finalize"""
+
+        if self._resolved_global_shift is not None:
+            return self._resolved_global_shift
+
+        return self._calculate_global_shift()
+
+    @property
+    def root(self) -> "RootParameterModel":
+        """Returns the root of the tree, cached after finalize"""
+
+        if self._resolved_root is not None:
+            return self._resolved_root
+
+        return self._calculate_root()
+
+    def _calculate_global_id(self) -> int:
         """Calculates the global id of the parameter, by going up the tree"""
 
         if self._parent is None:
@@ -110,8 +212,7 @@ class BaseParameterModel(BaseModel, ABC):
         else:
             raise ValueError("Parent is not a ParameterGroupModel")
 
-    @property
-    def global_name(self) -> str:
+    def _calculate_global_name(self) -> str:
         """Calculates the global name of the parameter, by going up the tree"""
 
         if self._parent is None:
@@ -119,8 +220,7 @@ class BaseParameterModel(BaseModel, ABC):
 
         return f"{self._parent.global_name}.{self._name}"
 
-    @property
-    def global_shift(self) -> int:
+    def _calculate_global_shift(self) -> int:
         """Adds the shift of all the parents to upstream"""
 
         if self._parent is None:
@@ -135,9 +235,8 @@ class BaseParameterModel(BaseModel, ABC):
         else:
             raise ValueError("Parent is not a ParameterGroupModel")
 
-    @property
-    def root(self) -> "RootParameterModel":
-        """Returns the root of the tree"""
+    def _calculate_root(self) -> "RootParameterModel":
+        """Finds the root of the tree, by going up the tree"""
 
         if self._parent is None:
             assert isinstance(self, RootParameterModel), "Root is not set"
@@ -231,6 +330,9 @@ class BaseParameterGroupModel(BaseParameterModel):
     # Reference to the variable which stores the group
     _absolute_group_reference: str | None = PrivateAttr(default=None)
 
+    # Index of the object names below this group, built on the first lookup
+    _path_index: ParameterPathIndex | None = PrivateAttr(default=None)
+
     @property
     def absolute_group_reference(self) -> str:
         assert self._absolute_group_reference is not None, "Group reference is not set"
@@ -243,6 +345,8 @@ class BaseParameterGroupModel(BaseParameterModel):
         type_registry: TypeRegistry,
     ):
         super().post_load_resolve(parent, name, type_registry)
+        self._path_index = None
+
         for child_name, child in self.children.items():
             child.post_load_resolve(self, child_name, type_registry)
 
@@ -257,6 +361,19 @@ class BaseParameterGroupModel(BaseParameterModel):
             val += f"\n{child.one_line_summary(level + 1)}"
         return val
 
+    def finalize(self) -> None:
+        super().finalize()
+
+        for child in self.children.values():
+            child.finalize()
+
+    def invalidate(self) -> None:
+        super().invalidate()
+        self._path_index = None
+
+        for child in self.children.values():
+            child.invalidate()
+
     def validate_local_id(self):
         local_id_map = {}
         for child in self.children.values():
@@ -297,28 +414,19 @@ class BaseParameterGroupModel(BaseParameterModel):
 
         return child_map
 
-    def find_parameters_by_object_name(self, name: str) -> list[BaseParameterModel]:
-        # Based name
-        split_name = name.split(".")
-        base_name = split_name[0]
-
-        child_map = self.child_map
-
-        if base_name == "*":
-            return list(child_map.values())
+    @property
+    def path_index(self) -> ParameterPathIndex:
+        """Index of the object names below this group, built once, cleared by invalidate"""
 
-        if base_name not in child_map:
-            return []
+        if self._path_index is None:
+            self._path_index = ParameterPathIndex(self)
 
-        parameter = child_map[base_name]
+        return self._path_index
 
-        if isinstance(parameter, BaseParameterGroupModel):
-            if len(split_name) == 1:
-                return [parameter]
-            else:
-                return parameter.find_parameters_by_object_name(".".join(split_name[1:]))
+    def find_parameters_by_object_name(self, name: str) -> list[BaseParameterModel]:
+        """Finds parameters by their dotted name relative to this group, supports `*` and a trailing `**`"""
 
-        return [parameter]
+        return self.path_index.find(name)
 
     def find_parameter_by_object_name(self, name: str) -> BaseParameterModel | None:
         parameters = self.find_parameters_by_object_name(name)
@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from .parameter import BaseParameterGroupModel, BaseParameterModel  # pragma: no cover
+
+WILDCARD = "*"
+RECURSIVE_WILDCARD = "**"
+
+
+@dataclass
+class PathIndexNode:
+    """Node of the path trie, one node per object name segment"""
+
+    parameter: "BaseParameterModel"
+    children: "Dict[str, PathIndexNode]" = field(default_factory=dict)
+
+
+class ParameterPathIndex:
+    """Index of all the dotted object names below a group
+
+    Exact names are answered from a flat dict, wildcard queries walk a trie of the name segments,
+    so the cost of a query is proportional to the number of results instead of the size of the tree.
+
+    Supported queries:
+    * `group.parameter` exact match
+    * `group.*` all direct children of the group
+    * `group.**` all the descendants of the group, in pre-order
+    """
+
+    def __init__(self, group: "BaseParameterGroupModel"):
+        self.names: Dict[str, BaseParameterModel] = {}
+        self.trie = PathIndexNode(parameter=group)
+
+        self._add_children(group, self.trie, "")
+
+    def _add_children(self, group: "BaseParameterGroupModel", node: PathIndexNode, prefix: str):
+        # Same trick as in the access control, avoids a circular import
+        from .parameter import BaseParameterGroupModel
+
+        for child in group.children.values():
+            child_node = PathIndexNode(parameter=child)
+            node.children[child._name] = child_node
+
+            name = f"{prefix}{child._name}"
+            self.names[name] = child
+
+            if isinstance(child, BaseParameterGroupModel):
+                self._add_children(child, child_node, f"{name}.")
+
+    def find(self, name: str) -> "List[BaseParameterModel]":
+        """Finds all the parameters matching the (wildcard) name"""
+
+        if WILDCARD not in name:
+            parameter = self.names.get(name)
+            return [parameter] if parameter is not None else []
+
+        segments = name.split(".")
+        nodes = [self.trie]
+
+        for position, segment in enumerate(segments):
+            if segment == RECURSIVE_WILDCARD:
+                if position != len(segments) - 1:
+                    raise ValueError(f"'{RECURSIVE_WILDCARD}' is only allowed at the end of a name: {name}")
+
+                results: List[BaseParameterModel] = []
+                for node in nodes:
+                    self._collect_descendants(node, results)
+                return results
+
+            if segment == WILDCARD:
+                nodes = [child for node in nodes for child in node.children.values()]
+            else:
+                nodes = [node.children[segment] for node in nodes if segment in node.children]
+
+        return [node.parameter for node in nodes]
+
+    def _collect_descendants(self, node: PathIndexNode, results: "List[BaseParameterModel]"):
+        for child in node.children.values():
+            results.append(child.parameter)
+            self._collect_descendants(child, results)
@@ -0,0 +1,75 @@
+import hashlib
+import io
+import os
+import shutil
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+
+def file_digest(path: str) -> str:
+    """Calculates the sha256 of a file, without loading it completely into memory"""
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def list_files(path: str) -> list[str]:
+    """Lists all the files in a directory recursively, sorted, or the path itself if it is a file"""
+
+    if not os.path.isdir(path):
+        return [path]
+
+    files = []
+    for directory, _, file_names in os.walk(path):
+        for file_name in file_names:
+            files.append(os.path.join(directory, file_name))
+
+    return sorted(files)
+
+
+def encode_text(data: str) -> bytes:
+    """Encodes text exactly like a file opened in text mode would (encoding and line endings)"""
+
+    buffer = io.BytesIO()
+    wrapper = io.TextIOWrapper(buffer)
+    wrapper.write(data)
+    wrapper.flush()
+
+    encoded = buffer.getvalue()
+    wrapper.detach()
+    return encoded
+
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    """Writes the data to the file, unless the file already has exactly this content
+
+    Unchanged files keep their modification time, so build systems do not rebuild everything that depends on them.
+
+    Returns:
+        bool: True if the file was written
+    """
+
+    if os.path.isfile(path) and os.path.getsize(path) == len(data) and file_digest(path) == hashlib.sha256(data).hexdigest():
+        return False
+
+    with open(path, "wb") as f:
+        f.write(data)
+
+    return True
+
+
+def copy_if_changed(source: str, destination: str) -> str:
+    """Copy function for shutil.copytree, which leaves files with identical content untouched"""
+
+    if (
+        os.path.isfile(destination)
+        and os.path.getsize(destination) == os.path.getsize(source)
+        and file_digest(destination) == file_digest(source)
+    ):
+        return destination
+
+    return shutil.copy2(source, destination)
@@ -0,0 +1,164 @@
+"""Minimal perfect hash over a fixed set of keys, computed at generation time
+
+Hash and displace: every key is hashed twice with 32 bit FNV-1a, once with the seed as offset basis. The unseeded
+hash selects a bucket, every bucket gets a displacement `d` so the keys land on distinct slots:
+
+    slot = (finalize(h1 ^ (d / count)) % count + d % count) % count
+
+all with unsigned 32 bit arithmetic, matching ODIN_find_in_name_table in odin_lookup.c. Mixing the outer part of the
+displacement into the hash (instead of the usual h1 + d * h2) keeps the slots independent of the low bits of the
+hashes, which matters when the number of keys is a power of two.
+"""
+
+from dataclasses import dataclass
+from typing import Iterator
+
+FNV_PRIME = 16777619
+FNV_OFFSET_BASIS = 2166136261
+DEFAULT_SEED = 0x9747B28C
+
+UINT32_MASK = 0xFFFFFFFF
+
+KEYS_PER_BUCKET = 4
+MAX_ATTEMPTS = 8
+MAX_OUTER_DISPLACEMENT = 1024
+
+
+def fnv1a_32(data: bytes, basis: int = FNV_OFFSET_BASIS) -> int:
+    value = basis
+    for byte in data:
+        value = ((value ^ byte) * FNV_PRIME) & UINT32_MASK
+    return value
+
+
+def finalize(value: int) -> int:
+    """Murmur3 finalizer, FNV-1a mixes the last bytes poorly and the two hashes would be correlated without it"""
+
+    value ^= value >> 16
+    value = (value * 0x85EBCA6B) & UINT32_MASK
+    value ^= value >> 13
+    value = (value * 0xC2B2AE35) & UINT32_MASK
+    value ^= value >> 16
+    return value
+
+
+def name_hashes(key: bytes, seed: int) -> tuple[int, int]:
+    """Returns the seeded hash used for the slot and the unseeded hash used for the bucket"""
+
+    return finalize(fnv1a_32(key, seed)), finalize(fnv1a_32(key))
+
+
+@dataclass
+class PerfectHashTable:
+    seed: int
+    displacements: list[int]
+    # Index of the key stored in every slot
+    slots: list[int]
+
+    @property
+    def count(self) -> int:
+        return len(self.slots)
+
+    def slot(self, key: bytes) -> int:
+        h1, h2 = name_hashes(key, self.seed)
+        return self._slot(h1, h2, self.displacements[h2 % len(self.displacements)])
+
+    def _slot(self, h1: int, h2: int, displacement: int) -> int:
+        count = self.count
+        return (finalize(h1 ^ (displacement // count)) % count + displacement % count) % count
+
+
+def _free_slots(occupied: bytearray, start: int) -> Iterator[int]:
+    """Free slots from start, wrapping around
+
+    Starting at the slot of the key (instead of the start of the table) keeps the free slots spread out,
+    otherwise the start of the table fills up first and the larger buckets need a lot more tries.
+    """
+
+    slot = occupied.find(0, start)
+    while slot != -1:
+        yield slot
+        slot = occupied.find(0, slot + 1)
+
+    slot = occupied.find(0, 0, start)
+    while slot != -1:
+        yield slot
+        slot = occupied.find(0, slot + 1, start)
+
+
+def _place_buckets(hashes: list[tuple[int, int]], seed: int, bucket_count: int) -> PerfectHashTable | None:
+    count = len(hashes)
+    table = PerfectHashTable(seed=seed, displacements=[0] * bucket_count, slots=[-1] * count)
+
+    buckets: list[list[int]] = [[] for _ in range(bucket_count)]
+    for key_index, (_, h2) in enumerate(hashes):
+        buckets[h2 % bucket_count].append(key_index)
+
+    # The largest buckets are the hardest to place, do them while the table is still empty
+    order = sorted(range(bucket_count), key=lambda bucket: len(buckets[bucket]), reverse=True)
+
+    # Zero for the free slots, searched with bytearray.find which is a lot faster than iterating in python
+    occupied = bytearray(count)
+
+    # The displacement is stored as a uint32, if a bucket does not fit after this many tries the seed is changed
+    max_outer = min(MAX_OUTER_DISPLACEMENT, UINT32_MASK // count)
+
+    for bucket in order:
+        keys = buckets[bucket]
+        if len(keys) == 0:
+            break
+
+        placement = None
+        for outer in range(max_outer):
+            # The inner displacement rotates the keys over the table, so instead of trying every displacement,
+            # only try the ones that move the first key to a free slot
+            residues = [finalize(hashes[key][0] ^ outer) % count for key in keys]
+            if len(set(residues)) != len(keys):
+                continue
+
+            for free_slot in _free_slots(occupied, residues[0]):
+                inner = (free_slot - residues[0]) % count
+                slots = [(residue + inner) % count for residue in residues]
+                if not any(occupied[slot] for slot in slots):
+                    placement = (outer * count + inner, slots)
+                    break
+
+            if placement is not None:
+                break
+
+        if placement is None:
+            return None
+
+        displacement, slots = placement
+        table.displacements[bucket] = displacement
+        for key, slot in zip(keys, slots):
+            table.slots[slot] = key
+            occupied[slot] = 1
+
+    return table
+
+
+def build_perfect_hash(keys: list[bytes], seed: int = DEFAULT_SEED) -> PerfectHashTable:
+    """Builds a minimal perfect hash, the table has exactly one slot per key"""
+
+    if len(keys) == 0:
+        raise ValueError("A perfect hash needs at least one key")
+
+    if len(set(keys)) != len(keys):
+        raise ValueError("The keys of a perfect hash need to be unique")
+
+    h2_values = [finalize(fnv1a_32(key)) for key in keys]
+
+    for _ in range(MAX_ATTEMPTS):
+        hashes = [(finalize(fnv1a_32(key, seed)), h2) for key, h2 in zip(keys, h2_values)]
+
+        # Keys with identical hashes can never be separated, try another seed
+        if len(set(hashes)) == len(hashes):
+            bucket_count = max(1, len(keys) // KEYS_PER_BUCKET)
+            table = _place_buckets(hashes, seed, bucket_count)
+            if table is not None:
+                return table
+
+        seed = fnv1a_32(seed.to_bytes(4, "little"), seed)
+
+    raise ValueError(f"Unable to build a perfect hash for {len(keys)} keys")
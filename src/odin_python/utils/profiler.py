@@ -0,0 +1,161 @@
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from typing import Any, ContextManager, Iterator
+
+PROFILE_FORMAT_VERSION = 1
+
+# Profiler used by profile_phase, set with Profiler.activate
+_active_profiler: "Profiler | None" = None
+
+
+@dataclass
+class PhaseStats:
+    calls: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_bytes: int | None = None
+
+    def add(self, other: "PhaseStats") -> None:
+        self.calls += other.calls
+        self.wall_s += other.wall_s
+        self.cpu_s += other.cpu_s
+        if other.peak_bytes is not None:
+            self.peak_bytes = max(self.peak_bytes or 0, other.peak_bytes)
+
+
+@dataclass
+class _OpenPhase:
+    name: str
+    start_memory: int = 0
+    peak_memory: int = 0
+    cprofile: cProfile.Profile | None = field(default=None, repr=False)
+
+
+class Profiler:
+    """Records the wall time, cpu time and peak traced memory of the (nested) phases of a generation
+
+    Nested phases are named after their parents, e.g. `resolve.parameters`. A phase that runs multiple
+    times is accumulated, the peak memory is the highest of all the calls and is relative to the memory
+    in use when the phase started. If a cprofile directory is given, every top level phase is also profiled
+    with cProfile and dumped as `<phase>.prof`, which can be inspected with pstats or snakeviz.
+    """
+
+    def __init__(self, trace_memory: bool = True, cprofile_dir: str | None = None):
+        self.trace_memory = trace_memory
+        self.cprofile_dir = cprofile_dir
+        self.phases: dict[str, PhaseStats] = {}
+        self._stack: list[_OpenPhase] = []
+
+    @contextmanager
+    def activate(self) -> Iterator["Profiler"]:
+        """Makes this the profiler used by profile_phase, and traces the memory allocations while active"""
+
+        global _active_profiler
+
+        previous = _active_profiler
+        _active_profiler = self
+
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        try:
+            yield self
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            _active_profiler = previous
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        full_name = f"{self._stack[-1].name}.{name}" if self._stack else name
+        current = _OpenPhase(name=full_name)
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # The peak is global, keep the peak of the enclosing phases before resetting it
+            memory, peak = tracemalloc.get_traced_memory()
+            for parent in self._stack:
+                parent.peak_memory = max(parent.peak_memory, peak)
+            tracemalloc.reset_peak()
+            current.start_memory = memory
+
+        if self.cprofile_dir is not None and len(self._stack) == 0:
+            current.cprofile = cProfile.Profile()
+
+        # Registered on entry, so the phases are listed before their nested phases
+        total = self.phases.setdefault(full_name, PhaseStats())
+        self._stack.append(current)
+
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        if current.cprofile is not None:
+            current.cprofile.enable()
+
+        try:
+            yield
+        finally:
+            if current.cprofile is not None:
+                current.cprofile.disable()
+
+            stats = PhaseStats(
+                calls=1,
+                wall_s=time.perf_counter() - start_wall,
+                cpu_s=time.process_time() - start_cpu,
+            )
+
+            self._stack.pop()
+
+            if tracing and tracemalloc.is_tracing():
+                _, peak = tracemalloc.get_traced_memory()
+                current.peak_memory = max(current.peak_memory, peak)
+                for parent in self._stack:
+                    parent.peak_memory = max(parent.peak_memory, peak)
+                stats.peak_bytes = current.peak_memory - current.start_memory
+
+            if current.cprofile is not None and self.cprofile_dir is not None:
+                os.makedirs(self.cprofile_dir, exist_ok=True)
+                current.cprofile.dump_stats(os.path.join(self.cprofile_dir, f"{full_name}.prof"))
+
+            total.add(stats)
+
+    def merge(self, phases: dict[str, PhaseStats]) -> None:
+        """Adds the phases recorded by another profiler, e.g. in a worker process"""
+
+        for name, stats in phases.items():
+            self.phases.setdefault(name, PhaseStats()).add(stats)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": PROFILE_FORMAT_VERSION,
+            "phases": {name: asdict(stats) for name, stats in self.phases.items()},
+        }
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def summary(self) -> str:
+        lines = []
+        for name, stats in self.phases.items():
+            peak = f"{stats.peak_bytes / 2**20:9.1f} MiB" if stats.peak_bytes is not None else ""
+            lines.append(f"{name:<32} {stats.wall_s * 1000:10.1f} ms wall {stats.cpu_s * 1000:10.1f} ms cpu {peak}")
+        return "\n".join(lines)
+
+
+def active_profiler() -> Profiler | None:
+    return _active_profiler
+
+
+def profile_phase(name: str) -> ContextManager[None]:
+    """Measures a phase with the active profiler, does nothing if no profiler is active"""
+
+    if _active_profiler is None:
+        return nullcontext()
+
+    return _active_profiler.phase(name)
@@ -0,0 +1,245 @@
+"""Benchmark of the loader and the generators on synthetic object dictionaries
+
+Every phase (parsing the yaml, resolving the model and each generator target) is measured on its own.
+The wall and cpu time are the best of the repeated runs, the peak memory is measured in a separate run
+with tracemalloc, as tracing slows down the code considerably.
+
+The results are written as json and can be compared against a stored baseline:
+
+    python test/benchmark.py -p 1000 -p 10000 -o results.json
+    python test/benchmark.py -p 1000 -p 10000 --baseline results.json
+"""
+
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+import click
+from ruamel.yaml import YAML
+from synthetic_dictionary import SyntheticDictionarySpec, generate_dictionary
+
+from odin_python.generators.cache import odin_python_version
+from odin_python.generators.generator import GeneratorTarget, generate_target
+from odin_python.parameter.loader import ConfigurationReader
+
+RESULTS_FORMAT_VERSION = 1
+
+
+@dataclass
+class PhaseResult:
+    wall_s: float = float("inf")
+    cpu_s: float = float("inf")
+    peak_bytes: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"wall_s": self.wall_s, "cpu_s": self.cpu_s, "peak_bytes": self.peak_bytes}
+
+
+@dataclass
+class BenchmarkRun:
+    spec: SyntheticDictionarySpec
+    phases: dict[str, PhaseResult] = field(default_factory=dict)
+
+    def phase(self, name: str) -> PhaseResult:
+        return self.phases.setdefault(name, PhaseResult())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "spec": self.spec.to_dict(),
+            "phases": {name: phase.to_dict() for name, phase in self.phases.items()},
+        }
+
+
+@contextmanager
+def measure(result: PhaseResult, trace_memory: bool) -> Iterator[None]:
+    if trace_memory:
+        tracemalloc.reset_peak()
+        start_memory, _ = tracemalloc.get_traced_memory()
+
+        yield
+
+        _, peak = tracemalloc.get_traced_memory()
+        result.peak_bytes = peak - start_memory
+        return
+
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+
+    yield
+
+    result.wall_s = min(result.wall_s, time.perf_counter() - start_wall)
+    result.cpu_s = min(result.cpu_s, time.process_time() - start_cpu)
+
+
+def write_dictionary(spec: SyntheticDictionarySpec, path: str) -> None:
+    with open(path, "w") as f:
+        YAML().dump(generate_dictionary(spec), f)
+
+
+def run_phases(run: BenchmarkRun, input_file: str, output_dir: str, targets: list[GeneratorTarget], trace_memory: bool):
+    reader = ConfigurationReader()
+
+    with measure(run.phase("parse"), trace_memory):
+        model = reader.parse(input_file, "advanced")
+
+    # Type registration, post_load_resolve, finalize and the collections
+    with measure(run.phase("resolve"), trace_memory):
+        model_context, generator_config = reader.resolve(model)
+
+    for target in targets:
+        with measure(run.phase(f"generate.{target.name}"), trace_memory):
+            generate_target("OD", model_context, output_dir, target, generator_config)
+
+
+def run_benchmark(
+    spec: SyntheticDictionarySpec,
+    targets: list[GeneratorTarget],
+    repeat: int = 3,
+    trace_memory: bool = True,
+) -> BenchmarkRun:
+    run = BenchmarkRun(spec=spec)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_file = os.path.join(work_dir, "synthetic.yaml")
+        write_dictionary(spec, input_file)
+
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory(dir=work_dir) as output_dir:
+                run_phases(run, input_file, output_dir, targets, trace_memory=False)
+
+        if trace_memory:
+            tracemalloc.start()
+            try:
+                with tempfile.TemporaryDirectory(dir=work_dir) as output_dir:
+                    run_phases(run, input_file, output_dir, targets, trace_memory=True)
+            finally:
+                tracemalloc.stop()
+
+    return run
+
+
+def results_to_dict(runs: list[BenchmarkRun]) -> dict[str, Any]:
+    return {
+        "version": RESULTS_FORMAT_VERSION,
+        "odin_python": odin_python_version(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "runs": [run.to_dict() for run in runs],
+    }
+
+
+def compare_results(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Returns a description of every phase that is slower or uses more memory than the baseline allows"""
+
+    baseline_runs = {json.dumps(run["spec"], sort_keys=True): run for run in baseline["runs"]}
+    regressions = []
+
+    for run in results["runs"]:
+        baseline_run = baseline_runs.get(json.dumps(run["spec"], sort_keys=True))
+        if baseline_run is None:
+            continue
+
+        for phase_name, phase in run["phases"].items():
+            baseline_phase = baseline_run["phases"].get(phase_name)
+            if baseline_phase is None:
+                continue
+
+            for metric in ["wall_s", "peak_bytes"]:
+                value, reference = phase.get(metric), baseline_phase.get(metric)
+                if value is None or not reference:
+                    continue
+
+                if value > reference * (1 + tolerance):
+                    regressions.append(
+                        f"{run['spec']['parameters']} parameters, {phase_name}: {metric} {value:.6g} > {reference:.6g}"
+                        f" (+{(value / reference - 1) * 100:.1f}%)"
+                    )
+
+    return regressions
+
+
+def print_run(run: BenchmarkRun) -> None:
+    print(f"{run.spec.parameters} parameters (depth {run.spec.depth}, fanout {run.spec.fanout})")
+    for name, phase in run.phases.items():
+        peak = f"{phase.peak_bytes / 2**20:9.1f} MiB" if phase.peak_bytes is not None else ""
+        print(f"  {name:<16} {phase.wall_s * 1000:10.1f} ms wall {phase.cpu_s * 1000:10.1f} ms cpu {peak}")
+
+
+@click.command()
+@click.option("-p", "--parameters", multiple=True, type=click.IntRange(1), default=[1000, 10000], show_default=True)
+@click.option("--depth", type=click.IntRange(1), default=2, show_default=True)
+@click.option("--fanout", type=click.IntRange(1), default=4, show_default=True)
+@click.option("--custom-types", type=click.IntRange(0), default=4, show_default=True)
+@click.option("--collections", type=click.IntRange(0), default=4, show_default=True)
+@click.option("--access-groups", type=click.IntRange(0), default=3, show_default=True)
+@click.option(
+    "-t",
+    "--target",
+    "targets",
+    multiple=True,
+    type=click.Choice([target.name for target in GeneratorTarget]),
+    help="Generator targets to benchmark, all by default",
+)
+@click.option("--repeat", type=click.IntRange(1), default=3, show_default=True, help="Timed runs, the best is kept")
+@click.option("--memory/--no-memory", default=True, show_default=True, help="Measure the peak memory per phase")
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write the results as json")
+@click.option("--baseline", type=click.Path(exists=True, dir_okay=False), help="Compare against stored results")
+@click.option("--tolerance", type=float, default=0.2, show_default=True, help="Allowed relative regression")
+def main(
+    parameters: tuple[int, ...],
+    depth: int,
+    fanout: int,
+    custom_types: int,
+    collections: int,
+    access_groups: int,
+    targets: tuple[str, ...],
+    repeat: int,
+    memory: bool,
+    output: str | None,
+    baseline: str | None,
+    tolerance: float,
+):
+    selected_targets = [GeneratorTarget.from_string(name) for name in targets] or GeneratorTarget.all()
+
+    runs = []
+    for count in parameters:
+        spec = SyntheticDictionarySpec(
+            parameters=count,
+            depth=depth,
+            fanout=fanout,
+            custom_types=custom_types,
+            collections=collections,
+            access_groups=access_groups,
+        )
+        run = run_benchmark(spec, selected_targets, repeat=repeat, trace_memory=memory)
+        print_run(run)
+        runs.append(run)
+
+    results = results_to_dict(runs)
+
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is not None:
+        with open(baseline, "r") as f:
+            regressions = compare_results(results, json.load(f), tolerance)
+
+        for regression in regressions:
+            print(f"Regression: {regression}")
+
+        if regressions:
+            raise click.ClickException(f"{len(regressions)} phase(s) regressed more than {tolerance * 100:.0f}%")
+
+        print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
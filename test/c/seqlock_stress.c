@@ -0,0 +1,131 @@
+/*
+ * Stress and throughput test of the seqlock mode, generated from seqlock.yaml
+ *
+ * Writers fill every parameter with a single value, the readers check that they never see a mix of two writes.
+ *
+ * usage: seqlock_stress [readers] [writers] [milliseconds]
+ */
+#include <pthread.h>
+#include <stdatomic.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "OD.h"
+#include "odin_core.h"
+
+#define BLOCK_ELEMENTS 16
+#define HISTORY_ELEMENTS 32
+
+uint64_t current_time_in_microseconds;
+struct my_struct my;
+
+static atomic_bool running = true;
+
+typedef struct {
+    pthread_t thread;
+    uint32_t seed;
+    uint64_t operations;
+    uint64_t torn;
+    uint64_t errors;
+} worker_t;
+
+static void *writer(void *arg) {
+    worker_t *worker = arg;
+    uint32_t block[BLOCK_ELEMENTS];
+    uint32_t history[HISTORY_ELEMENTS];
+
+    for (uint32_t value = worker->seed; atomic_load(&running); value += 0x10001) {
+        for (int i = 0; i < BLOCK_ELEMENTS; i++) {
+            block[i] = value;
+        }
+        for (int i = 0; i < HISTORY_ELEMENTS; i++) {
+            history[i] = value;
+        }
+        uint64_t counter = ((uint64_t)value << 32) | value;
+        size_t history_size = (value % HISTORY_ELEMENTS + 1) * sizeof(uint32_t);
+
+        worker->errors += ODIN_parameter_write(&odin_objects.samples.block, block, sizeof(block), ODIN_ACCESS_GROUP_INTERNAL) < 0;
+        worker->errors += ODIN_parameter_write(&odin_objects.samples.history, history, history_size, ODIN_ACCESS_GROUP_INTERNAL) < 0;
+        worker->errors += ODIN_parameter_write(&odin_objects.samples.counter, &counter, sizeof(counter), ODIN_ACCESS_GROUP_INTERNAL) < 0;
+        worker->operations += 3;
+    }
+    return NULL;
+}
+
+static void *reader(void *arg) {
+    worker_t *worker = arg;
+    uint32_t block[BLOCK_ELEMENTS];
+    uint32_t history[HISTORY_ELEMENTS];
+    uint64_t counter;
+
+    while (atomic_load(&running)) {
+        if (ODIN_parameter_read(&odin_objects.samples.block, block, sizeof(block), ODIN_ACCESS_GROUP_INTERNAL) < 0) {
+            worker->errors++;
+        } else {
+            for (int i = 1; i < BLOCK_ELEMENTS; i++) {
+                if (block[i] != block[0]) {
+                    worker->torn++;
+                    break;
+                }
+            }
+        }
+
+        int size = ODIN_parameter_read(&odin_objects.samples.history, history, sizeof(history), ODIN_ACCESS_GROUP_INTERNAL);
+        if (size < 0) {
+            worker->errors++;
+        } else if (size > 0) {
+            // The length is written together with the elements
+            int elements = size / sizeof(uint32_t);
+            if (elements != history[0] % HISTORY_ELEMENTS + 1) {
+                worker->torn++;
+            }
+            for (int i = 1; i < elements; i++) {
+                if (history[i] != history[0]) {
+                    worker->torn++;
+                    break;
+                }
+            }
+        }
+
+        if (ODIN_parameter_read(&odin_objects.samples.counter, &counter, sizeof(counter), ODIN_ACCESS_GROUP_INTERNAL) < 0) {
+            worker->errors++;
+        } else if ((uint32_t)(counter >> 32) != (uint32_t)counter) {
+            worker->torn++;
+        }
+
+        worker->operations += 3;
+    }
+    return NULL;
+}
+
+int main(int argc, char **argv) {
+    int readers = argc > 1 ? atoi(argv[1]) : 4;
+    int writers = argc > 2 ? atoi(argv[2]) : 2;
+    int milliseconds = argc > 3 ? atoi(argv[3]) : 1000;
+
+    worker_t *workers = calloc(readers + writers, sizeof(worker_t));
+    for (int i = 0; i < readers + writers; i++) {
+        workers[i].seed = i + 1;
+        pthread_create(&workers[i].thread, NULL, i < readers ? reader : writer, &workers[i]);
+    }
+
+    struct timespec duration = {.tv_sec = milliseconds / 1000, .tv_nsec = (milliseconds % 1000) * 1000000L};
+    nanosleep(&duration, NULL);
+    atomic_store(&running, false);
+
+    uint64_t reads = 0, writes = 0, torn = 0, errors = 0;
+    for (int i = 0; i < readers + writers; i++) {
+        pthread_join(workers[i].thread, NULL);
+        *(i < readers ? &reads : &writes) += workers[i].operations;
+        torn += workers[i].torn;
+        errors += workers[i].errors;
+    }
+    free(workers);
+
+    double seconds = milliseconds / 1000.0;
+    printf("readers %d writers %d reads/s %.0f writes/s %.0f torn %llu errors %llu\n", readers, writers, reads / seconds,
+           writes / seconds, (unsigned long long)torn, (unsigned long long)errors);
+
+    return torn != 0 || errors != 0 || reads == 0 || writes == 0;
+}
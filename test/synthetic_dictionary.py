@@ -0,0 +1,169 @@
+"""Generator of synthetic object dictionaries, used to benchmark the loader and the generators
+
+The dictionary is a balanced tree of groups, `depth` levels deep with `fanout` groups per level.
+The parameters are evenly distributed over the deepest groups and cycle through the primitives,
+arrays, vectors and the custom types, so every generator has representative work to do.
+"""
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Any
+
+PRIMITIVES = ["u8", "i8", "u16", "i16", "u32", "i32", "u64", "i64", "f32", "f64", "bool"]
+ACCESS_PERMISSIONS = [["read"], ["read", "write"], ["read", "log_write"], []]
+
+
+@dataclass
+class SyntheticDictionarySpec:
+    parameters: int = 1000
+    depth: int = 2
+    fanout: int = 4
+    custom_types: int = 4
+    collections: int = 4
+    access_groups: int = 3
+
+    # One in every n parameters is an array / vector / custom type
+    array_every: int = 7
+    vector_every: int = 11
+    custom_type_every: int = 5
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def id_bits(count: int) -> int:
+    """Number of bits needed for local ids 1..count, 0 is kept free"""
+
+    return max(1, math.ceil(math.log2(count + 1)))
+
+
+def leaf_groups(spec: SyntheticDictionarySpec) -> int:
+    return spec.fanout**spec.depth
+
+
+def parameter_entry(spec: SyntheticDictionarySpec, index: int, local_id: int) -> dict[str, Any]:
+    primitive = PRIMITIVES[index % len(PRIMITIVES)]
+
+    if spec.custom_types > 0 and index % spec.custom_type_every == 0:
+        return {
+            "type": "parameter",
+            "local_id": local_id,
+            "primitive": f"type_{index % spec.custom_types}",
+            "description": f"Synthetic custom type parameter {index}",
+        }
+
+    if index % spec.array_every == 0:
+        return {
+            "type": "array",
+            "local_id": local_id,
+            "primitive": primitive,
+            "elements": 4,
+            "default": [True] * 4 if primitive == "bool" else [1, 2, 3, 4],
+        }
+
+    if index % spec.vector_every == 0:
+        return {
+            "type": "vector",
+            "local_id": local_id,
+            "primitive": primitive,
+            "max_elements": 8,
+            "default": [True] if primitive == "bool" else [1],
+        }
+
+    return {
+        "type": "parameter",
+        "local_id": local_id,
+        "primitive": primitive,
+        "description": f"Synthetic parameter {index}",
+        "default": True if primitive == "bool" else 1,
+    }
+
+
+def custom_type_entry(index: int) -> dict[str, Any]:
+    model: dict[str, Any] = {
+        "x": "f32",
+        "y": "f32",
+        "count": {"type": "u16", "default": index % 100},
+        "samples": {"type": "i32", "elements": 4},
+    }
+
+    # Every other type nests the previous one, so nested types are resolved as well
+    if index > 0 and index % 2 == 1:
+        model["nested"] = f"type_{index - 1}"
+
+    return {"model": model}
+
+
+def access_control_entry(spec: SyntheticDictionarySpec, index: int) -> dict[str, Any]:
+    group = f"access_{index % spec.access_groups}"
+    return {group: ACCESS_PERMISSIONS[index % len(ACCESS_PERMISSIONS)]}
+
+
+def generate_dictionary(spec: SyntheticDictionarySpec) -> dict[str, Any]:
+    """Creates the yaml content of a synthetic object dictionary, as plain python objects"""
+
+    if spec.parameters < 1 or spec.depth < 1 or spec.fanout < 1:
+        raise ValueError("The parameter count, depth and fanout need to be at least 1")
+
+    groups = leaf_groups(spec)
+    parameters_per_group = math.ceil(spec.parameters / groups)
+
+    total_bits = spec.depth * id_bits(spec.fanout) + id_bits(parameters_per_group)
+    if total_bits > 32:
+        raise ValueError(f"The synthetic dictionary needs {total_bits} id bits, reduce the depth, fanout or parameters")
+
+    names: list[str] = []
+    next_group = 0
+
+    def build_group(level: int, prefix: str) -> dict[str, Any]:
+        nonlocal next_group
+
+        children: dict[str, Any] = {}
+        if level == spec.depth:
+            for local_id in range(1, parameters_per_group + 1):
+                index = len(names)
+                if index >= spec.parameters:
+                    break
+
+                children[f"param_{index}"] = parameter_entry(spec, index, local_id)
+                names.append(f"{prefix}param_{index}")
+            return children
+
+        for local_id in range(1, spec.fanout + 1):
+            name = f"group_{next_group}"
+            next_group += 1
+
+            group: dict[str, Any] = {
+                "type": "group",
+                "local_id": local_id,
+                "id_space_shift": id_bits(parameters_per_group if level + 1 == spec.depth else spec.fanout),
+            }
+            if spec.access_groups > 0 and next_group % 3 == 1:
+                group["access_control"] = access_control_entry(spec, next_group)
+
+            group["children"] = build_group(level + 1, f"{prefix}{name}.")
+            children[name] = group
+
+        return children
+
+    parameters = build_group(0, "")
+
+    collections = {}
+    top_groups = list(parameters)
+    step = max(1, len(names) // 4)
+    for index in range(spec.collections):
+        # A wildcard over the children of a top-level group and a few exact names spread over the dictionary
+        collections[f"collection_{index}"] = {
+            "description": f"Synthetic collection {index}",
+            "children": [f"{top_groups[index % len(top_groups)]}.*", *names[index % step :: step]],
+        }
+
+    dictionary: dict[str, Any] = {
+        "id_space_shift": id_bits(spec.fanout),
+        "access_control": {f"access_{index}": {"default": ["read"]} for index in range(spec.access_groups)},
+        "types": {f"type_{index}": custom_type_entry(index) for index in range(spec.custom_types)},
+        "collections": collections,
+        "parameters": parameters,
+    }
+
+    return dictionary
@@ -1,4 +1,5 @@
 from odin_python.parameter.loader import ConfigurationReader
+from odin_python.generators.cache import ModelContextCache
 from odin_python.generators.generator import GeneratorTarget, generator
 from pathlib import Path
 
@@ -37,3 +38,22 @@ def test_all_flawed_configs(config: Path):
     print(f"processing config: '{config}")
     with pytest.raises(Exception):
         process_config(config)
+
+
+@pytest.mark.parametrize("config", POSTITIVE_TEST_CONFIGS, ids=[str(config.name) for config in POSTITIVE_TEST_CONFIGS])
+def test_cached_model_generates_identical_output(config: Path, tmp_path: Path):
+    model_context, config_model = ConfigurationReader().load(config.as_posix(), "advanced", cache_dir=tmp_path.as_posix())
+    assert ModelContextCache(tmp_path.as_posix(), config.as_posix()).load() is not None
+
+    cached_context, cached_config = ConfigurationReader().load(config.as_posix(), "advanced", cache_dir=tmp_path.as_posix())
+    assert cached_config == config_model
+
+    original, cached = tmp_path / "original", tmp_path / "cached"
+    for context, output_dir in [(model_context, original), (cached_context, cached)]:
+        output_dir.mkdir()
+        for target in [GeneratorTarget.C, GeneratorTarget.PY]:
+            generator(name="OD", model_context=context, output_dir=output_dir.as_posix(), target=target, generator_config=config_model)
+
+    for path in original.rglob("*"):
+        if path.is_file():
+            assert path.read_bytes() == (cached / path.relative_to(original)).read_bytes(), f"{path.name} differs"
@@ -0,0 +1,36 @@
+import pytest
+from benchmark import compare_results, results_to_dict, run_benchmark
+from synthetic_dictionary import SyntheticDictionarySpec, generate_dictionary
+
+from odin_python.generators.generator import GeneratorTarget
+
+SMALL_SPEC = SyntheticDictionarySpec(parameters=60, depth=2, fanout=2, custom_types=2, collections=2)
+
+
+def test_synthetic_dictionary_layout():
+    dictionary = generate_dictionary(SMALL_SPEC)
+
+    assert list(dictionary["parameters"]) == ["group_0", "group_3"]
+    assert list(dictionary["types"]) == ["type_0", "type_1"]
+    assert dictionary["collections"]["collection_1"]["children"][0] == "group_3.*"
+
+    with pytest.raises(ValueError):
+        generate_dictionary(SyntheticDictionarySpec(parameters=200000, depth=8, fanout=16))
+
+
+def test_benchmark_measures_every_phase():
+    run = run_benchmark(SMALL_SPEC, GeneratorTarget.all(), repeat=1)
+
+    assert list(run.phases) == ["parse", "resolve", "generate.DOC", "generate.DB", "generate.PY", "generate.C"]
+    for phase in run.phases.values():
+        assert 0 < phase.wall_s < float("inf")
+        assert phase.peak_bytes is not None and phase.peak_bytes > 0
+
+    results = results_to_dict([run])
+    assert compare_results(results, results, tolerance=0.0) == []
+
+    # A phase that got twice as fast in the "baseline" is reported as a regression
+    baseline = results_to_dict([run])
+    baseline["runs"][0]["phases"]["resolve"]["wall_s"] /= 2
+    regressions = compare_results(results, baseline, tolerance=0.2)
+    assert len(regressions) == 1 and "resolve: wall_s" in regressions[0]
@@ -0,0 +1,308 @@
+import json
+import logging
+import math
+import re
+import struct
+
+import pytest
+
+from odin_python.extensions import LimitValidationExtension
+from odin_python.extensions.io_extension import FixedPointMapping
+from odin_python.generators.c.config import CGeneratorConfig
+from odin_python.generators.c.generator import CGenerator
+from odin_python.generators.c.objects.size import json_length
+from odin_python.parameter import BaseParameterGroupModel
+from odin_python.parameter.loader import ConfigurationReader
+
+
+def generate_c(config: str, c_config: CGeneratorConfig | None = None) -> tuple[str, str]:
+    model_context, config_model = ConfigurationReader().load(config, "advanced")
+    generator = CGenerator(c_config or config_model.c_generator)
+    return generator.generate_source(model_context), generator.generate_header(model_context)
+
+
+def test_index_table_is_sorted_and_complete():
+    source, header = generate_c("test/test_configs/access_control.yaml")
+
+    entries = re.findall(r"\.global_index = (0x[0-9A-F]+),\n\s+\.parameter = &([\w.]+)", source)
+    indices = [int(index, 16) for index, _ in entries]
+
+    assert indices == sorted(indices)
+    assert ("0x01000000", "odin_store_basic_group") in entries
+    assert ("0x02030000", "odin_objects.another_group.test_variable_small") in entries
+    assert len(entries) == 8
+
+    assert "const ODIN_index_table_t odin_index = {\n    .count = 8,\n    .entries = odin_index_entries\n};" in source
+    assert ".index_table = &odin_index," in source
+    assert "extern const ODIN_index_table_t odin_index;" in header
+
+    # Only the root group uses the table
+    assert source.count(".index_table") == 1
+
+
+def test_index_table_can_be_disabled():
+    source, header = generate_c("test/test_configs/access_control.yaml", CGeneratorConfig(index_table=False))
+
+    assert "odin_index" not in source
+    assert "odin_index" not in header
+
+
+def test_name_table_contains_all_names():
+    source, header = generate_c("test/test_configs/access_control.yaml")
+
+    entries = re.findall(r'\.name = "([\w.]+)",\n\s+\.parameter = &([\w.]+)', source)
+
+    assert len(entries) == 8
+    assert ("basic_group", "odin_store_basic_group") in entries
+    assert ("another_group.test_variable_small", "odin_objects.another_group.test_variable_small") in entries
+
+    assert ".name_table = &odin_names," in source
+    assert "extern const ODIN_name_table_t odin_names;" in header
+    assert source.count(".name_table") == 1
+
+
+def test_name_table_can_be_disabled():
+    source, header = generate_c("test/test_configs/access_control.yaml", CGeneratorConfig(name_table=False))
+
+    assert "odin_names" not in source
+    assert "odin_names" not in header
+    assert "odin_index" in source
+
+
+def test_leaf_arrays_are_in_pre_order():
+    source, header = generate_c("test/test_configs/access_control.yaml")
+
+    leaves = re.search(r"const ODIN_parameter_t \*const odin_store_leaves\[6\] = \{(.*)\};", source)
+    assert leaves is not None
+    assert leaves.group(1).split(", ") == [
+        "&odin_objects.basic_group.test_variable_A",
+        "&odin_objects.basic_group.test_variable_B",
+        "&odin_objects.basic_group.test_variable_small",
+        "&odin_objects.another_group.test_variable_A",
+        "&odin_objects.another_group.test_variable_B",
+        "&odin_objects.another_group.test_variable_small",
+    ]
+    assert "    .leaf_count = 6,\n    .leaves = odin_store_leaves," in source
+    assert "const ODIN_parameter_t *const odin_store_basic_group_leaves[3]" in source
+    assert "extern const ODIN_parameter_t *const odin_store_leaves[6];" in header
+
+
+def test_leaf_arrays_for_collections():
+    source, _ = generate_c("test/test_configs/collections.yaml")
+
+    assert (
+        "const ODIN_parameter_t *const collection_test_collection_leaves[2] = "
+        "{&odin_objects.param_float, &odin_objects.param_float_array};" in source
+    )
+
+
+def test_leaf_arrays_can_be_disabled():
+    source, header = generate_c("test/test_configs/access_control.yaml", CGeneratorConfig(leaf_arrays=False))
+
+    assert "_leaves" not in source
+    assert "_leaves" not in header
+
+
+def test_size_defines():
+    _, header = generate_c("test/test_configs/access_control.yaml")
+
+    assert (
+        "#define ODIN_STORE_TLV_MAX_SIZE (ODIN_TLV_HEADER_SIZE * 6 + sizeof(float) * 4 + sizeof(uint8_t) * 2)" in header
+    )
+    assert (
+        "#define ODIN_STORE_BASIC_GROUP_TLV_MAX_SIZE (ODIN_TLV_HEADER_SIZE * 3 + sizeof(float) * 2 + sizeof(uint8_t) * 1)"
+        in header
+    )
+
+    # -340282346638528859811704183484516925440.000000 and the terminator
+    assert "#define ODIN_STORE_STRING_MAX_SIZE 48" in header
+
+
+def test_json_size_matches_unformatted_json():
+    model_context, _ = ConfigurationReader().load("test/test_configs/access_control.yaml", "advanced")
+
+    def to_json(group: BaseParameterGroupModel) -> dict:
+        return {
+            name: to_json(child) if isinstance(child, BaseParameterGroupModel) else child.global_id
+            for name, child in group.children.items()
+        }
+
+    # cJSON_PrintUnformatted prints the same as json without whitespace, the size includes the terminator
+    expected = len(json.dumps(to_json(model_context.root_model), separators=(",", ":"))) + 1
+    assert json_length(model_context.root_model) + 1 == expected
+
+    _, header = generate_c("test/test_configs/access_control.yaml")
+    assert f"#define ODIN_STORE_JSON_MAX_SIZE {expected}" in header
+
+
+def test_size_defines_for_collections_and_custom_types():
+    _, header = generate_c("test/test_configs/collections.yaml")
+
+    assert "#define COLLECTION_TEST_COLLECTION_TLV_MAX_SIZE (ODIN_TLV_HEADER_SIZE * 2 + sizeof(float) * 11)" in header
+    assert "#define COLLECTION_TEST_COLLECTION_JSON_MAX_SIZE" in header
+
+    # The string of a custom type is not bounded
+    assert "COLLECTION_TEST_COLLECTION_STRING_MAX_SIZE" in header
+    assert "ODIN_STORE_STRING_MAX_SIZE" not in header
+
+
+def test_dirty_tracking():
+    source, header = generate_c("test/test_configs/access_control.yaml", CGeneratorConfig(dirty_tracking=True))
+
+    assert "uint32_t odin_dirty[1];" in source
+    assert "extern uint32_t odin_dirty[1];" in header
+    assert "#ifndef ODIN_DIRTY_TRACKING\n#error" in header
+
+    # The bits follow the leaves of the root group
+    indices = [int(index) for index in re.findall(r"\.dirty_index = (\d+)", source)]
+    assert indices == list(range(6))
+    assert source.count(".dirty_bitmap = odin_dirty") == 6
+
+    assert "    .leaf_count = 6,\n    .leaves = odin_store_leaves,\n    .dirty_first = 0," in source
+    assert "    .leaves = odin_store_another_group_leaves,\n    .dirty_first = 3," in source
+
+
+def test_dirty_tracking_for_collections():
+    source, _ = generate_c("test/test_configs/collections.yaml", CGeneratorConfig(dirty_tracking=True))
+
+    # The collection holds the first two leaves of the root in order, so it can scan the bitmap as well
+    assert "    .leaves = collection_test_collection_leaves,\n    .dirty_first = 0," in source
+
+
+def test_dirty_tracking_is_disabled_by_default():
+    source, header = generate_c("test/test_configs/access_control.yaml", CGeneratorConfig())
+
+    assert "dirty" not in source
+    assert "DIRTY" not in header
+
+
+def test_dirty_tracking_needs_leaf_arrays():
+    with pytest.raises(ValueError):
+        CGeneratorConfig(dirty_tracking=True, leaf_arrays=False)
+
+
+def test_seqlock_per_group():
+    source, header = generate_c("test/test_configs/access_control.yaml", CGeneratorConfig(seqlock=True))
+
+    # The root has no parameters of its own, so only the two groups get a counter
+    assert "ODIN_seqlock_t odin_seqlocks[2];" in source
+    assert "extern ODIN_seqlock_t odin_seqlocks[2];" in header
+    assert "#ifndef ODIN_SEQLOCK\n#error" in header
+
+    assert re.findall(r"\.seqlock = &odin_seqlocks\[(\d)\]", source) == ["0", "0", "0", "1", "1", "1"]
+
+
+def test_seqlock_is_disabled_by_default():
+    source, header = generate_c("test/test_configs/access_control.yaml", CGeneratorConfig())
+
+    assert "seqlock" not in source
+    assert "SEQLOCK" not in header
+
+
+def test_limit_validation_is_typed():
+    source, _ = generate_c("test/test_configs/extensions.yaml")
+
+    # Fractional limits are rounded inwards for integers, a missing limit is the limit of the type
+    assert "&ODIN_validate_extension_uint8_ops" in source
+    assert "(range_parameter_uint8_t){ .max = 200u, .min = 2u }" in source
+    assert "(range_parameter_int16_t){ .max = INT16_MAX, .min = -1000 }" in source
+
+    # The 64 bit limits are exact
+    assert "(range_parameter_uint64_t){ .max = 18446744073709551614u, .min = 1u }" in source
+    assert "(range_parameter_int64_t){ .max = 9007199254740993, .min = -9223372036854775807 }" in source
+
+    assert "(range_parameter_float_t){ .max = 1.0, .min = 0.0 }" in source
+    assert "(range_parameter_double_t){ .max = 1e+300, .min = -INFINITY }" in source
+
+    # Types without a typed validator are still compared as float
+    assert "&ODIN_validate_extension_ops," in source
+    assert "(range_parameter_t){ .max = 1.0, .min = 0.0 }" in source
+
+
+def test_limit_validation_without_valid_values():
+    extension = LimitValidationExtension(type="validation_limit_value", min=0.2, max=0.8)
+
+    with pytest.raises(ValueError):
+        extension.typed_range("uint8_t")
+
+    assert extension.typed_range("float") == ("float", "0.2", "0.8")
+    assert extension.typed_range("custom_t") is None
+
+
+def test_mapped_number_fixed_point():
+    source, _ = generate_c("test/test_configs/extensions.yaml")
+
+    # 0.25 * x - 12.5 is exact as (x - 50) >> 2
+    assert (
+        "(mapped_number_fixed_parameters_t){ .reference = &odin_objects.mapped.raw, .multiplier = 1, .divisor = 1, "
+        ".offset = -50, .shift = 2 }" in source
+    )
+
+    # 0.1 is not a fraction of a power of two, only with a tolerance
+    assert "(mapped_number_parameters_t){ .reference = &odin_objects.mapped.raw, .scale = 0.1, .offset = 0.0 }" in source
+    assert ".multiplier = 838861, .divisor = 838860, .offset = 0, .shift = 23 }" in source
+
+    # A float parameter always uses the float mapping
+    assert "(mapped_number_parameters_t){ .reference = &odin_objects.mapped.raw, .scale = 0.25, .offset = 0.0 }" in source
+
+
+def test_mapped_number_report():
+    model_context, config_model = ConfigurationReader().load("test/test_configs/extensions.yaml", "advanced")
+    report = CGenerator(config_model.c_generator).mapped_number_report(model_context)
+
+    assert report == [
+        "Mapped number 'mapped.quarter': fixed point (x * 1 - 50) >> 2",
+        "Mapped number 'mapped.tenth': float",
+        "Mapped number 'mapped.tenth_approximate': fixed point (x * 838861 + 0) >> 23, written with divisor 838860",
+        "Mapped number 'mapped.volts': float",
+        "Mapped number 'mapped.clamped': fixed point (x * 2 + 0) >> 0",
+    ]
+
+
+def test_mapped_number_report_is_only_logged(tmp_path, capsys, caplog):
+    model_context, config_model = ConfigurationReader().load("test/test_configs/extensions.yaml", "advanced")
+    generator = CGenerator(config_model.c_generator)
+
+    with caplog.at_level(logging.DEBUG, logger="odin_python.generators.c.generator"):
+        generator.generate(model_context, (tmp_path / "OD.c").as_posix(), type="source")
+
+    assert "Mapped number" not in capsys.readouterr().out
+    assert "Mapped number 'mapped.quarter': fixed point (x * 1 - 50) >> 2" in caplog.messages
+
+
+def float32(value: float) -> float:
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def test_approximate_fixed_point_matches_the_float_mapping():
+    model_context, _ = ConfigurationReader().load("test/test_configs/extensions.yaml", "advanced")
+    parameter = model_context.root_model.path_index.names["mapped.tenth_approximate"]
+    extension = parameter.extensions[0]
+    mapping = extension.to_fixed_point(parameter)
+    assert mapping is not None
+
+    # The float ops compute in single precision and truncate, over the whole range of the i16 reference
+    scale = float32(0.1)
+    for raw in range(-(2**15), 2**15):
+        assert mapping.read(raw) == math.trunc(float32(raw * scale)), raw
+    for value in range(-3276, 3277):
+        assert mapping.write(value) == math.trunc(float32(value / scale)), value
+
+    # Rounding the multiplier to the nearest integer reads 10 as 0
+    nearest = FixedPointMapping(multiplier=209715, divisor=209715, offset=0, shift=21)
+    assert nearest.read(10) == 0
+    assert not extension.matches_float_mapping(nearest, (-(2**15), 2**15 - 1), (-(2**31), 2**31 - 1))
+
+
+def test_extensions_are_an_array_sorted_by_type():
+    source, _ = generate_c("test/test_configs/extensions.yaml")
+
+    # Configured as IO first, emitted with the validation first
+    clamped = re.search(r"\.clamped = \{(.*?)\n        \}", source, re.DOTALL)
+    assert clamped is not None
+    assert re.findall(r"\.type=(\w+)", clamped.group(1)) == ["ODIN_EXTENSION_TYPE_VALIDATE", "ODIN_EXTENSION_TYPE_IO"]
+    assert ".extension_count = 2" in clamped.group(1)
+
+    raw = re.search(r"\.raw = \{(.*?)\n        \}", source, re.DOTALL)
+    assert raw is not None
+    assert ".extensions = NULL,\n            .extension_count = 0" in raw.group(1)
@@ -1,3 +1,5 @@
+import json
+import os
 from pathlib import Path
 from click.testing import CliRunner
 from odin_python.cli import cli
@@ -44,3 +46,140 @@ def test_generate_with_valid_target():
     runner = CliRunner()
     result = runner.invoke(cli, ["generate", "test/test_configs/config.yaml", "test/demo"])
     assert result.exit_code == 0, f"CLI command failed with error: {result.output}"
+
+
+def test_generate_reuses_cached_targets(tmp_path: Path):
+    runner = CliRunner()
+    arguments = ["generate", "test/test_configs/config.yaml", tmp_path.as_posix(), "--target", "C", "--target", "DB"]
+
+    result = runner.invoke(cli, arguments)
+    assert result.exit_code == 0, f"CLI command failed with error: {result.output}"
+    assert "reusing cached outputs" not in result.output
+
+    result = runner.invoke(cli, arguments)
+    assert result.exit_code == 0, f"CLI command failed with error: {result.output}"
+    assert "Target 'C' is up to date" in result.output
+    assert "Target 'DB' is up to date" in result.output
+
+    # A modified output is regenerated
+    (tmp_path / "OD.h").write_text("modified")
+    result = runner.invoke(cli, arguments)
+    assert "Target 'C' is up to date" not in result.output
+    assert "Target 'DB' is up to date" in result.output
+    assert (tmp_path / "OD.h").read_text() != "modified"
+
+    result = runner.invoke(cli, arguments + ["--no-cache"])
+    assert result.exit_code == 0, f"CLI command failed with error: {result.output}"
+    assert "reusing cached outputs" not in result.output
+
+
+def test_generate_parallel_targets(tmp_path: Path):
+    runner = CliRunner()
+    result = runner.invoke(cli, ["generate", "test/test_configs/config.yaml", tmp_path.as_posix(), "--jobs", "4", "--no-cache"])
+    assert result.exit_code == 0, f"CLI command failed with error: {result.output}"
+
+    for file_name in ["OD.c", "OD.h", "OD.odin", "OD.pdf", "OD/src/odin_interface/model.py"]:
+        assert (tmp_path / file_name).exists(), f"{file_name} was not generated"
+
+    # Results are reported in the order of the targets
+    lines = [line for line in result.output.splitlines() if line.startswith("Target")]
+    assert lines == ["Target 'DOC' generated", "Target 'DB' generated", "Target 'PY' generated", "Target 'C' generated"]
+
+
+def test_generate_reports_failed_targets(tmp_path: Path):
+    runner = CliRunner()
+
+    # The python package directory can not be created, because a file with the same name exists
+    (tmp_path / "OD").write_text("blocking file")
+
+    for jobs in ["1", "2"]:
+        result = runner.invoke(cli, ["generate", "test/test_configs/config.yaml", tmp_path.as_posix(), "--jobs", jobs, "--no-cache"])
+        assert result.exit_code != 0, "CLI command should fail if a target fails"
+        # With the traceback, from the worker process when generated in parallel
+        assert "Target 'PY' failed:\n" in result.output
+        assert "Traceback (most recent call last):" in result.output
+        assert "in generate_target" in result.output
+        assert "Target 'C' generated" in result.output
+
+
+def test_generate_leaves_unchanged_files_untouched(tmp_path: Path):
+    runner = CliRunner()
+    arguments = ["generate", "test/test_configs/access_control.yaml", tmp_path.as_posix(), "--no-cache"]
+
+    result = runner.invoke(cli, arguments)
+    assert result.exit_code == 0, f"CLI command failed with error: {result.output}"
+
+    files = [path for path in tmp_path.rglob("*") if path.is_file() and not path.name.startswith(".")]
+    for path in files:
+        os.utime(path, ns=(0, 0))
+
+    result = runner.invoke(cli, arguments)
+    assert result.exit_code == 0, f"CLI command failed with error: {result.output}"
+
+    for path in files:
+        assert path.stat().st_mtime_ns == 0, f"{path} was rewritten"
+
+
+def test_generate_profile(tmp_path: Path):
+    runner = CliRunner()
+    profile = tmp_path / "profile.json"
+    cprofile_dir = tmp_path / "cprofile"
+
+    for jobs in ["1", "2"]:
+        result = runner.invoke(
+            cli,
+            [
+                "generate",
+                "test/test_configs/config.yaml",
+                tmp_path.as_posix(),
+                "--no-cache",
+                "--jobs",
+                jobs,
+                "--profile",
+                profile.as_posix(),
+                "--cprofile-dir",
+                cprofile_dir.as_posix(),
+            ],
+        )
+        assert result.exit_code == 0, f"CLI command failed with error: {result.output}"
+
+        phases = json.loads(profile.read_text())["phases"]
+        for phase in ["parse.yaml", "parse.validate", "resolve.parameters", "resolve.finalize", "generate.C.source", "generate.PY"]:
+            assert phase in phases, f"{phase} missing with {jobs} jobs"
+            assert phases[phase]["calls"] == 1
+            assert phases[phase]["wall_s"] > 0
+            assert phases[phase]["peak_bytes"] is not None
+
+        # The C target writes the source and the header
+        assert phases["generate.C.write"]["calls"] == 2
+
+        assert (cprofile_dir / "resolve.prof").exists()
+        assert (cprofile_dir / "generate.DOC.prof").exists()
+
+
+class WriteMarker:
+    def __init__(self, path: str):
+        self.path = path
+
+    def __reduce__(self):
+        return (Path(self.path).write_text, ("unpickled",))
+
+
+def test_generate_never_loads_models_from_the_output_dir(tmp_path: Path, monkeypatch):
+    import pickle
+
+    monkeypatch.setenv("XDG_CACHE_HOME", (tmp_path / "user_cache").as_posix())
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    # A committed pickle with the name of the old model cache
+    marker = tmp_path / "marker"
+    (output_dir / ".config.yaml.odin-model.pickle").write_bytes(pickle.dumps(WriteMarker(marker.as_posix())))
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["generate", "test/test_configs/config.yaml", output_dir.as_posix(), "--target", "C"])
+    assert result.exit_code == 0, f"CLI command failed with error: {result.output}"
+
+    assert not marker.exists()
+    assert len(list((tmp_path / "user_cache" / "odin_python").glob("config.yaml-*.odin-model.pickle"))) == 1
+    assert [path.name for path in output_dir.glob("*.pickle")] == [".config.yaml.odin-model.pickle"]
@@ -0,0 +1,70 @@
+import subprocess
+import sys
+
+import pytest
+
+# Budget for importing the cli, the minimum of a few runs is used to filter out noise
+IMPORT_TIME_BUDGET_US = 500_000
+IMPORT_TIME_RUNS = 3
+
+HEAVY_MODULES = ["csnake", "reportlab", "odin_db", "pydantic_yaml", "ruamel.yaml"]
+
+
+def imported_modules(code: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+def cli_import_time() -> int:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import odin_python.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Format: "import time: self [us] | cumulative | imported package"
+    for line in result.stderr.splitlines():
+        self_time, cumulative, package = line.removeprefix("import time:").split("|")
+        if package.strip() == "odin_python":
+            return int(cumulative)
+
+    raise AssertionError("odin_python import time not found")
+
+
+def test_cli_import_does_not_load_generators():
+    modules = imported_modules("import odin_python.cli")
+
+    for module in HEAVY_MODULES:
+        assert module not in modules, f"{module} is imported at startup"
+
+
+@pytest.mark.parametrize(
+    "target, expected, unexpected",
+    [
+        ("C", "csnake", ["reportlab", "odin_db"]),
+        ("DB", "odin_db", ["reportlab", "csnake"]),
+        ("DOC", "reportlab", ["odin_db", "csnake"]),
+    ],
+)
+def test_target_only_loads_own_dependencies(target: str, expected: str, unexpected: list[str], tmp_path):
+    modules = imported_modules(
+        "from odin_python.parameter.loader import ConfigurationReader\n"
+        "from odin_python.generators.generator import GeneratorTarget, generator\n"
+        "context, config = ConfigurationReader().load('test/test_configs/config.yaml', 'advanced')\n"
+        f"generator('OD', context, {tmp_path.as_posix()!r}, GeneratorTarget.{target}, config)"
+    )
+
+    assert expected in modules
+    for module in unexpected:
+        assert module not in modules, f"{module} is imported for target {target}"
+
+
+def test_cli_import_time_budget():
+    import_time = min(cli_import_time() for _ in range(IMPORT_TIME_RUNS))
+    assert import_time < IMPORT_TIME_BUDGET_US, f"Importing the cli took {import_time / 1000:.0f}ms"
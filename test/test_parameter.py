@@ -0,0 +1,126 @@
+from odin_python.parameter import BaseParameterGroupModel
+from odin_python.parameter.loader import ConfigurationReader
+
+
+def load_root(config: str):
+    model_context, _ = ConfigurationReader().load(config, "advanced")
+    return model_context.root_model
+
+
+def test_finalize_matches_tree_walk():
+    root = load_root("test/test_configs/access_control.yaml")
+
+    for parameter in root.to_flat_list():
+        assert parameter._resolved_global_id == parameter._calculate_global_id()
+        assert parameter._resolved_global_shift == parameter._calculate_global_shift()
+        assert parameter._resolved_global_name == parameter._calculate_global_name()
+        assert parameter._resolved_root is root
+
+    group = root.children["basic_group"]
+    assert isinstance(group, BaseParameterGroupModel)
+    assert group.children["test_variable_B"].global_id == 0x01020000
+    assert group.children["test_variable_B"].global_name == "root.basic_group.test_variable_B"
+
+
+def test_invalidate_and_finalize_after_change():
+    root = load_root("test/test_configs/access_control.yaml")
+    group = root.children["basic_group"]
+    parameter = group.children["test_variable_A"]
+
+    group.local_id = 0x3
+
+    # The cached value is kept until the tree is invalidated
+    assert parameter.global_id == 0x01010000
+
+    root.invalidate()
+    assert parameter._resolved_global_id is None
+    assert parameter.global_id == 0x03010000
+
+    root.finalize()
+    assert parameter._resolved_global_id == 0x03010000
+
+
+def test_find_parameters_by_object_name():
+    root = load_root("test/test_configs/access_control.yaml")
+
+    assert [p.global_name for p in root.find_parameters_by_object_name("basic_group.test_variable_A")] == [
+        "root.basic_group.test_variable_A"
+    ]
+    assert root.find_parameters_by_object_name("basic_group.unknown") == []
+    assert root.find_parameters_by_object_name("basic_group.test_variable_A.unknown") == []
+
+    assert [p._name for p in root.find_parameters_by_object_name("*")] == ["basic_group", "another_group"]
+    assert [p._name for p in root.find_parameters_by_object_name("another_group.*")] == [
+        "test_variable_A",
+        "test_variable_B",
+        "test_variable_small",
+    ]
+    assert [p.global_name for p in root.find_parameters_by_object_name("*.test_variable_B")] == [
+        "root.basic_group.test_variable_B",
+        "root.another_group.test_variable_B",
+    ]
+    assert len(root.find_parameters_by_object_name("**")) == len(root.to_flat_list())
+
+    group = root.children["basic_group"]
+    assert isinstance(group, BaseParameterGroupModel)
+    assert root.find_parameters_by_object_name("basic_group.**") == group.to_flat_list()
+    assert group.find_parameter_by_object_name("test_variable_small") is group.children["test_variable_small"]
+
+
+ACCESS_CONTROL_EDGE_CASES = """
+access_control:
+  cli: { default: [read], override: [write] }
+  ble: { default: [read] }
+  admin: RW
+id_space_shift: 8
+parameters:
+  group:
+    type: group
+    local_id: 1
+    id_space_shift: 8
+    access_control:
+      ble: { override: [write], default: [read] }
+      guest: [R]
+    children:
+      inherited:
+        type: parameter
+        local_id: 1
+        primitive: u8
+        default: 0
+      overridden:
+        type: parameter
+        local_id: 2
+        primitive: u8
+        default: 0
+        access_control:
+          cli: []
+          ble: [R]
+          admin: { override: [] }
+  single:
+    type: parameter
+    local_id: 2
+    primitive: u8
+    default: 0
+    access_control:
+      cli: [read]
+"""
+
+
+def collapsed_state(collection):
+    return [(name, entry.override, entry.default) for name, entry in collection.root.items()]
+
+
+def test_access_control_inheritance_matches_collapse(tmp_path):
+    config = tmp_path / "access_control.yaml"
+    config.write_text(ACCESS_CONTROL_EDGE_CASES)
+
+    for path in [config.as_posix(), "test/test_configs/access_control.yaml"]:
+        root = load_root(path)
+        parameters = root.to_flat_list()
+        cached = [collapsed_state(parameter.effective_access_control) for parameter in parameters]
+        flags = [parameter.access_control_c_definition for parameter in parameters]
+
+        # Without the cache, the access control is collapsed by walking up the tree
+        root.invalidate()
+        assert cached == [collapsed_state(parameter.access_control.collapse()) for parameter in parameters]
+        assert flags == [parameter.access_control.collapse().to_c_definition() for parameter in parameters]
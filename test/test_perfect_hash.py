@@ -0,0 +1,21 @@
+import pytest
+
+from odin_python.utils.perfect_hash import build_perfect_hash
+
+
+@pytest.mark.parametrize("count", [1, 2, 7, 8, 64, 1000])
+def test_every_key_gets_its_own_slot(count: int):
+    keys = [f"group_{index // 7}.param_{index}".encode() for index in range(count)]
+    table = build_perfect_hash(keys)
+
+    assert sorted(table.slots) == list(range(count))
+    assert [table.slots[table.slot(key)] for key in keys] == list(range(count))
+    assert all(displacement <= 0xFFFFFFFF for displacement in table.displacements)
+
+
+def test_invalid_keys():
+    with pytest.raises(ValueError):
+        build_perfect_hash([])
+
+    with pytest.raises(ValueError):
+        build_perfect_hash([b"a", b"a"])
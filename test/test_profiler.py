@@ -0,0 +1,49 @@
+from odin_python.generators.generator import GeneratorTarget, generator
+from odin_python.parameter.loader import ConfigurationReader
+from odin_python.utils.profiler import Profiler, active_profiler, profile_phase
+
+
+def test_nested_phases():
+    profiler = Profiler()
+
+    with profiler.activate():
+        assert active_profiler() is profiler
+
+        for _ in range(2):
+            with profile_phase("outer"):
+                with profile_phase("inner"):
+                    data = bytearray(4 * 2**20)
+                del data
+
+                with profile_phase("other"):
+                    pass
+
+    assert active_profiler() is None
+    assert list(profiler.phases) == ["outer", "outer.inner", "outer.other"]
+    assert profiler.phases["outer"].calls == 2
+
+    inner_peak = profiler.phases["outer.inner"].peak_bytes
+    outer_peak = profiler.phases["outer"].peak_bytes
+    assert inner_peak is not None and inner_peak >= 4 * 2**20
+    # The peak of the inner phase is also the peak of the outer phase, even though "other" resets it
+    assert outer_peak is not None and outer_peak >= inner_peak
+
+
+def test_profile_phase_without_profiler():
+    with profile_phase("unused"):
+        pass
+
+
+def test_generator_profiler_hook(tmp_path):
+    model_context, config = ConfigurationReader().load("test/test_configs/config.yaml", "advanced")
+
+    profiler = Profiler(trace_memory=False)
+    generator("OD", model_context, tmp_path.as_posix(), GeneratorTarget.C, config, profiler=profiler)
+
+    assert list(profiler.phases) == [
+        "generate.C",
+        "generate.C.source",
+        "generate.C.write",
+        "generate.C.header",
+    ]
+    assert all(stats.peak_bytes is None for stats in profiler.phases.values())
@@ -0,0 +1,440 @@
+import asyncio
+import struct
+
+import pytest
+
+from odin_python.generators.py.template.src.odin_interface.base_types import (
+    BaseRootModel,
+    CachedInterface,
+    GenericModel,
+    ODINArrayEntry,
+    ODINEntry,
+    ODINStringEntry,
+    ODINVectorEntry,
+    TemplateInterface,
+    array_struct,
+    decode_tlv,
+    encode_tlv,
+)
+from odin_python.generators.generator import GeneratorTarget, generator
+from odin_python.generators.py.conversion import numpy_dtype
+from odin_python.parameter.loader import ConfigurationReader
+
+
+class U16(GenericModel, int):
+    STRUCT = struct.Struct("<H")
+
+    def encode_to_bytes(self) -> bytes:
+        return self.STRUCT.pack(self)
+
+    @classmethod
+    def decode_from_bytes(cls, data: bytes | memoryview) -> "U16":
+        return cls(*cls.STRUCT.unpack(data))
+
+    @classmethod
+    def from_unpacked(cls, unpacked_data: tuple) -> "U16":
+        return cls(*unpacked_data)
+
+
+class Point(GenericModel):
+    STRUCT = struct.Struct("<hh")
+
+    def __init__(self, x: int, y: int):
+        self.x, self.y = x, y
+
+    def __eq__(self, other) -> bool:
+        return (self.x, self.y) == (other.x, other.y)
+
+    def encode_to_bytes(self) -> bytes:
+        return self.STRUCT.pack(self.x, self.y)
+
+    @classmethod
+    def decode_from_bytes(cls, data: bytes | memoryview) -> "Point":
+        return cls.from_unpacked(cls.STRUCT.unpack(data))
+
+    @classmethod
+    def from_unpacked(cls, unpacked_data: tuple) -> "Point":
+        return cls(*unpacked_data)
+
+
+class SingleInterface(TemplateInterface):
+    def __init__(self, values: dict[int, bytes]):
+        self.values = values
+        self.requests: list[list[int]] = []
+
+    async def get_single(self, id: int) -> bytes:
+        self.requests.append([id])
+        return self.values[id]
+
+
+class MultiInterface(SingleInterface):
+    max_batch_size = 2
+
+    async def get_multi(self, ids: list[int]) -> dict[int, bytes]:
+        self.requests.append(ids)
+        return {id: self.values[id] for id in ids if id in self.values}
+
+
+class WritableInterface(MultiInterface):
+    async def set_request(self, data: dict[int, bytes]):
+        self.values.update(data)
+
+
+class GroupInterface(SingleInterface):
+    async def get_group(self, id: int) -> bytes:
+        self.requests.append([id])
+        return encode_tlv(self.values)
+
+
+class Group(BaseRootModel):
+    _id = 0x01000000
+
+    def __init__(self, interface: TemplateInterface):
+        self.value = ODINEntry[U16](0x01010000, cls=U16, interface=interface)
+        self.name = ODINStringEntry(0x01020000, max_length=8, interface=interface, writable=False)
+        self._children = {"value": self.value, "name": self.name}
+        super().__init__(interface)
+
+
+class Root(BaseRootModel):
+    def __init__(self, interface: TemplateInterface):
+        self.array = ODINArrayEntry[U16](0x02000000, cls=U16, elements=2, element_size=2, interface=interface)
+        self.group = Group(interface)
+        self._children = {"array": self.array, "group": self.group}
+        super().__init__(interface)
+
+
+VALUES = {0x01010000: struct.pack("<H", 7), 0x01020000: b"name", 0x02000000: struct.pack("<HH", 1, 2)}
+
+
+def test_encode_tlv_is_sorted_by_id():
+    data = encode_tlv({0x02000000: b"\x01\x02", 0x01000000: b"", 0x01010000: b"\x03"})
+
+    assert data == (
+        struct.pack("<IH", 0x01000000, 0)
+        + struct.pack("<IH", 0x01010000, 1)
+        + b"\x03"
+        + struct.pack("<IH", 0x02000000, 2)
+        + b"\x01\x02"
+    )
+
+
+def test_encode_tlv_unsorted():
+    data = encode_tlv({2: b"a", 1: b"b"}, sort=False)
+
+    assert data == struct.pack("<IH", 2, 1) + b"a" + struct.pack("<IH", 1, 1) + b"b"
+
+
+def test_encode_tlv_too_long():
+    with pytest.raises(ValueError):
+        encode_tlv({1: bytes(0x10000)})
+
+
+def test_read_all_in_batches():
+    interface = MultiInterface(VALUES)
+    data = asyncio.run(Root(interface).read_all())
+
+    assert data == {"array": [1, 2], "group": {"value": 7, "name": "name"}}
+    assert interface.requests == [[0x02000000, 0x01010000], [0x01020000]]
+
+
+def test_read_all_with_single_reads():
+    interface = SingleInterface(VALUES)
+    data = asyncio.run(Root(interface).group.read_all())
+
+    assert data == {"value": 7, "name": "name"}
+    assert interface.requests == [[0x01010000], [0x01020000]]
+
+
+def test_read_all_keeps_failures():
+    interface = MultiInterface({0x01010000: b"\x01", 0x01020000: b"name"})
+    data = asyncio.run(Root(interface).read_all())
+
+    # Too short to decode, and missing from the response
+    assert isinstance(data["group"]["value"], struct.error)
+    assert isinstance(data["array"], KeyError)
+    assert data["group"]["name"] == "name"
+
+
+def test_read_all_with_a_failing_single_read():
+    class FailingInterface(SingleInterface):
+        async def get_single(self, id: int) -> bytes:
+            if id == 0x01010000:
+                raise PermissionError("not readable")
+            return await super().get_single(id)
+
+    data = asyncio.run(Root(FailingInterface(VALUES)).read_all())
+
+    # Only the failing id is missing, the rest of its batch is read
+    assert isinstance(data["group"]["value"], KeyError)
+    assert data["group"]["name"] == "name"
+    assert data["array"] == [1, 2]
+
+
+def test_decode_tlv_returns_views():
+    data = encode_tlv({1: b"ab", 2: b"", 3: b"c"})
+    records = list(decode_tlv(data))
+
+    assert [(id, bytes(value)) for id, value in records] == [(1, b"ab"), (2, b""), (3, b"c")]
+    assert all(isinstance(value, memoryview) for _, value in records)
+
+
+@pytest.mark.parametrize("data", [struct.pack("<IH", 1, 2) + b"a", struct.pack("<IH", 1, 0) + b"\x02\x00"])
+def test_decode_tlv_truncated(data: bytes):
+    with pytest.raises(ValueError):
+        list(decode_tlv(data))
+
+
+def test_read_group_in_one_request():
+    # Parameters the model does not know are skipped
+    interface = GroupInterface({**VALUES, 0x03000000: b"new"})
+    data = asyncio.run(Root(interface).read_group())
+
+    assert data == {"array": [1, 2], "group": {"value": 7, "name": "name"}}
+    assert interface.requests == [[0x00000000]]
+
+    asyncio.run(Root(interface).group.read_group())
+    assert interface.requests[-1] == [0x01000000]
+
+
+def test_read_group_with_missing_parameter():
+    interface = GroupInterface({0x01010000: struct.pack("<H", 7)})
+    data = asyncio.run(Root(interface).group.read_group())
+
+    assert data["value"] == 7
+    assert isinstance(data["name"], KeyError)
+
+
+def test_generated_groups_have_their_id(tmp_path):
+    model_context, config_model = ConfigurationReader().load("test/test_configs/access_control.yaml", "advanced")
+    generator(
+        name="OD",
+        model_context=model_context,
+        output_dir=tmp_path.as_posix(),
+        target=GeneratorTarget.PY,
+        generator_config=config_model,
+    )
+
+    model = (tmp_path / "OD" / "src" / "odin_interface" / "model.py").read_text()
+    assert "class RootModel(BaseRootModel):\n    _id = 0x00000000\n" in model
+    assert "    class BasicGroup(BaseRootModel):\n        _id = 0x01000000\n" in model
+
+
+def test_array_struct_is_cached():
+    assert array_struct("f", 3) is array_struct("f", 3)
+    assert array_struct("f", 3).format == array_struct("<f", 3).format == "<3f"
+
+
+def test_vector_of_custom_type():
+    entry = ODINVectorEntry[Point](1, cls=Point, element_size=4, max_elements=3, interface=TemplateInterface())
+    data = struct.pack("<hhhh", 1, -2, 3, -4)
+
+    assert entry.decode_from_bytes(data) == [Point(1, -2), Point(3, -4)]
+    assert entry.decode_from_bytes(memoryview(data)[:4]) == [Point(1, -2)]
+    assert Point.encode_array([Point(1, -2), Point(3, -4)]) == data
+
+    with pytest.raises(struct.error):
+        entry.decode_from_bytes(data[:-1])
+
+
+def generate_py(config: str, output_dir, numpy: bool = False) -> tuple[str, str]:
+    model_context, config_model = ConfigurationReader().load(config, "advanced")
+    config_model.python_generator.numpy = numpy
+    generator(
+        name="OD",
+        model_context=model_context,
+        output_dir=output_dir.as_posix(),
+        target=GeneratorTarget.PY,
+        generator_config=config_model,
+    )
+
+    interface = output_dir / "OD" / "src" / "odin_interface"
+    return (interface / "type_definitions.py").read_text(), (interface / "model.py").read_text()
+
+
+def test_numpy_dtype_follows_the_struct_layout():
+    model_context, _ = ConfigurationReader().load("test/test_configs/custom_types.yaml", "advanced")
+    types = dict(model_context.types)
+
+    assert numpy_dtype(types["multi_type"].model) == "[('a', '<f'), ('b', '<i'), ('c', '<I')]"
+    assert numpy_dtype(types["test_model"].model) == "[('multi_type_array', [('my_array', '<f', (10,))], (6,))]"
+
+
+def test_numpy_mode(tmp_path):
+    types, model = generate_py("test/test_configs/all_built_in_type_vector.yaml", tmp_path, numpy=True)
+
+    assert "import numpy as np\n" in types
+    assert "    DTYPE: ClassVar[np.dtype] = np.dtype('<h')\n" in types
+    assert "param_i16: NDArray\n" in model
+    assert "self.param_i16 = ODINNumpyVectorEntry[OdinI16](" in model
+
+    # Strings and bytes are not arrays
+    assert "self.param_char = ODINStringEntry(" in model
+    assert (tmp_path / "OD" / "src" / "odin_interface" / "numpy_types.py").exists()
+
+
+def test_numpy_mode_is_disabled_by_default(tmp_path):
+    generate_py("test/test_configs/all_built_in_type_vector.yaml", tmp_path, numpy=True)
+    types, model = generate_py("test/test_configs/all_built_in_type_vector.yaml", tmp_path)
+
+    assert "numpy" not in types
+    assert "numpy" not in model
+    assert "NDArray" not in model
+
+    # The numpy entries would not import without numpy, a copy from the earlier generation is removed
+    assert not (tmp_path / "OD" / "src" / "odin_interface" / "numpy_types.py").exists()
+
+
+def test_numpy_entries(monkeypatch):
+    np = pytest.importorskip("numpy")
+    from odin_python.generators.py.template.src.odin_interface.numpy_types import ODINNumpyArrayEntry, ODINNumpyVectorEntry
+
+    monkeypatch.setattr(Point, "DTYPE", np.dtype([("x", "<h"), ("y", "<h")]), raising=False)
+    monkeypatch.setattr(U16, "DTYPE", np.dtype("<H"), raising=False)
+
+    vector = ODINNumpyVectorEntry[Point](1, cls=Point, element_size=4, max_elements=2, interface=TemplateInterface())
+    data = struct.pack("<hhhh", 1, -2, 3, -4)
+    points = vector.decode_from_bytes(memoryview(data))
+
+    assert points["y"].tolist() == [-2, -4]
+    assert not points.flags.writeable
+    assert vector.encode_to_bytes(points) == data
+    assert vector.encode_to_bytes([Point(1, -2)]) == data[:4]
+
+    with pytest.raises(ValueError):
+        vector.decode_from_bytes(data * 2)
+
+    array = ODINNumpyArrayEntry[U16](1, cls=U16, element_size=2, elements=2, interface=TemplateInterface())
+    assert array.encode_to_bytes(np.array([1, 2], dtype=np.int64)) == struct.pack("<HH", 1, 2)
+
+    with pytest.raises(ValueError):
+        array.decode_from_bytes(b"\x01\x00")
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_time_to_live():
+    clock = Clock()
+    transport = WritableInterface(dict(VALUES))
+    cache = CachedInterface(transport, ttl=1.0, clock=clock)
+    root = Root(cache)
+
+    assert asyncio.run(root.group.value.read()) == 7
+    assert asyncio.run(root.group.value.read()) == 7
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    clock.now = 1.0
+    asyncio.run(root.group.value.read())
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(transport.requests) == 2
+
+
+def test_cache_keeps_read_only_parameters():
+    clock = Clock()
+    transport = WritableInterface(dict(VALUES))
+    cache = CachedInterface(transport, ttl=1.0, clock=clock)
+    root = Root(cache)
+
+    asyncio.run(root.read_all())
+    clock.now = 100.0
+    transport.requests.clear()
+
+    # Only the read only name is still cached
+    assert asyncio.run(root.read_all()) == {"array": [1, 2], "group": {"value": 7, "name": "name"}}
+    assert transport.requests == [[0x02000000, 0x01010000]]
+
+    # Unless the time to live is set explicitly
+    cache.set_ttl(root.group, 5.0)
+    transport.requests.clear()
+    asyncio.run(root.group.read_all())
+    clock.now = 105.0
+    asyncio.run(root.group.read_all())
+    assert transport.requests == [[0x01010000, 0x01020000], [0x01010000, 0x01020000]]
+
+
+def test_cache_invalidates_on_write():
+    transport = WritableInterface(dict(VALUES))
+    cache = CachedInterface(transport, ttl=None)
+    root = Root(cache)
+
+    assert asyncio.run(root.group.value.read()) == 7
+    asyncio.run(root.group.value.write(U16(9)))
+    assert asyncio.run(root.group.value.read()) == 9
+    assert cache.misses == 2
+
+
+def test_cache_ignores_values_read_during_a_write():
+    transport = WritableInterface(dict(VALUES))
+    cache = CachedInterface(transport, ttl=None)
+    root = Root(cache)
+
+    async def read_while_writing():
+        event = asyncio.Event()
+        original = transport.get_multi
+
+        async def slow_get_multi(ids: list[int]) -> dict[int, bytes]:
+            values = await original(ids)
+            await event.wait()
+            return values
+
+        transport.get_multi = slow_get_multi  # type: ignore
+        read = asyncio.create_task(root.group.value.read())
+        await asyncio.sleep(0)
+        await root.group.value.write(U16(9))
+        event.set()
+        return await read
+
+    # The read returns the value it received, but does not cache it
+    assert asyncio.run(read_while_writing()) == 7
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = CachedInterface(MultiInterface(VALUES), ttl=None, max_entries=2)
+
+    asyncio.run(cache.get_multi([0x01010000, 0x01020000]))
+    asyncio.run(cache.get_single(0x01010000))
+    asyncio.run(cache.get_single(0x02000000))
+
+    assert cache.evictions == 1
+    assert asyncio.run(cache.get_single(0x01010000)) == VALUES[0x01010000]
+    assert cache.hits == 2
+
+
+def test_cache_stores_group_reads():
+    transport = GroupInterface(VALUES)
+    cache = CachedInterface(transport, ttl=None)
+    root = Root(cache)
+
+    asyncio.run(root.read_group())
+    assert asyncio.run(root.read_all()) == {"array": [1, 2], "group": {"value": 7, "name": "name"}}
+    assert transport.requests == [[0x00000000]]
+
+
+def test_generated_entries_are_marked_read_only(tmp_path):
+    config = tmp_path / "read_only.yaml"
+    config.write_text(
+        "access_control:\n"
+        "  cli:\n"
+        "    default: [read]\n"
+        "id_space_shift: 8\n"
+        "parameters:\n"
+        "  status: { type: parameter, local_id: 1, primitive: u8, default: 0 }\n"
+        "  setpoint: { type: parameter, local_id: 2, primitive: u8, default: 0, access_control: { cli: [R, W] } }\n"
+    )
+    _, model = generate_py(config.as_posix(), tmp_path / "read_only")
+    assert "self.status = ODINEntry[OdinU8](0x01000000, cls=OdinU8,interface=interface,writable=False)" in model
+    assert "self.setpoint = ODINEntry[OdinU8](0x02000000, cls=OdinU8,interface=interface)" in model
+
+    # Without access groups nothing is known about the writers
+    _, model = generate_py("test/test_configs/all_built_in_types.yaml", tmp_path / "no_access_groups")
+    assert "writable" not in model
+
+    _, model = generate_py("test/test_configs/access_control.yaml", tmp_path / "writable")
+    assert "writable" not in model
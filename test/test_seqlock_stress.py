@@ -0,0 +1,60 @@
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from odin_python.generators.generator import GeneratorTarget, generator
+from odin_python.parameter.loader import ConfigurationReader
+
+ODIN_C = Path("src/odin_c")
+
+# The runtime without the JSON and protobuf codecs, they need cJSON and nanopb
+ODIN_C_SOURCES = [
+    "odin_core.c",
+    "odin_lookup.c",
+    "odin_security.c",
+    "odin_seqlock.c",
+    "odin_utils.c",
+    "codec/TLV_codec.c",
+    "codec/number_codec.c",
+    "codec/string_codec.c",
+    "extensions/extensions.c",
+    "extensions/io_extension.c",
+    "extensions/validate_extension.c",
+]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux") or shutil.which("gcc") is None, reason="Needs gcc and pthreads")
+def test_seqlock_stress(tmp_path: Path):
+    model_context, config = ConfigurationReader().load("test/c/seqlock.yaml", "advanced")
+    generator(name="OD", model_context=model_context, output_dir=str(tmp_path), target=GeneratorTarget.C, generator_config=config)
+
+    executable = tmp_path / "seqlock_stress"
+    subprocess.run(
+        [
+            "gcc",
+            "-std=gnu11",
+            "-O2",
+            "-DODIN_SEQLOCK",
+            f"-I{tmp_path}",
+            f"-I{ODIN_C}",
+            f"-I{ODIN_C / 'codec'}",
+            f"-I{ODIN_C / 'extensions'}",
+            str(tmp_path / "OD.c"),
+            "test/c/seqlock_stress.c",
+            *[str(ODIN_C / source) for source in ODIN_C_SOURCES],
+            "-o",
+            str(executable),
+            "-lm",
+            "-pthread",
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+    # 4 readers and 2 writers for half a second, fails on any torn read
+    result = subprocess.run([str(executable), "4", "2", "500"], capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout
+    assert "torn 0 errors 0" in result.stdout